@@ -4,11 +4,12 @@ Comprehensive Historical Data Pulling Script
 Fetches daily data for all tickers from 1996 to 2025 using Upstox V3 API
 
 Features:
+- Concurrent ticker downloads with bounded parallelism
 - Progress tracking with detailed logging
 - Robust error handling and retry logic
 - Data validation and quality checks
 - Efficient chunking for large date ranges
-- CSV output with standardized format
+- Parquet (zstd) output with CSV fallback
 - Resume capability for interrupted runs
 """
 
@@ -21,14 +22,44 @@ from pathlib import Path
 import logging
 import time
 import json
+import io
+import sqlite3
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory, resource_tracker
 from typing import List, Dict, Tuple, Optional
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pq = None
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.core.etl.data_provider.upstox_provider import UpstoxDataProvider
-from config.config import UPSTOX_CONFIG
+from src.core.etl.rate_limiter import RateLimiter
+from config.config import UPSTOX_CONFIG, private_session
 
 # Configure logging
 logging.basicConfig(
@@ -41,36 +72,134 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Columns every fetched frame must carry
+REQUIRED_COLUMNS = frozenset(('timestamp', 'open', 'high', 'low', 'close', 'volume'))
+
+# Narrow column types for fetched frames and Parquet output (prices do not need float64)
+COMPACT_DTYPES = {
+    'open': 'float32',
+    'high': 'float32',
+    'low': 'float32',
+    'close': 'float32',
+    'volume': 'int64'
+}
+INT32_RANGE = np.iinfo(np.int32)
+PARQUET_ROW_GROUP_SIZE = 65536
+
+# Worker frames travel as Arrow IPC in POSIX shared memory; Windows frees a
+# segment once its creator closes it, so there the table is pickled instead
+SHARED_MEMORY_TRANSPORT = PYARROW_AVAILABLE and os.name == 'posix'
+
+# Resume state: one row per ticker, upserted as each ticker finishes
+PROGRESS_FIELDS = ('status', 'data_points', 'date_range', 'processed_at', 'error')
+PROGRESS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    ticker TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    data_points INTEGER,
+    date_range TEXT,
+    processed_at TEXT,
+    error TEXT
+)
+"""
+PROGRESS_UPSERT = "INSERT OR REPLACE INTO progress VALUES (?, ?, ?, ?, ?, ?)"
+
+
+def dump_json(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def narrow_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast OHLC to float32 and volume to int32 when every value fits.
+    
+    Missing volumes keep their rows: the column becomes nullable Int64
+    instead of failing the integer cast.
+    """
+    dtypes = {col: dtype for col, dtype in COMPACT_DTYPES.items() if col in df.columns}
+    if 'volume' in dtypes and not df.empty:
+        volume = df['volume']
+        if volume.isna().any():
+            dtypes['volume'] = 'Int64'
+        elif INT32_RANGE.min <= volume.min() and volume.max() <= INT32_RANGE.max:
+            dtypes['volume'] = 'int32'
+    return df.astype(dtypes)
+
+
+def _ohlc_invalid_vectorized(o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray) -> bool:
+    """True if any row has high below low/open/close or low above open/close"""
+    return bool(np.any((h < l) | (h < o) | (h < c) | (l > o) | (l > c)))
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def ohlc_invalid(o, h, l, c):
+        """Single fused scan of the OHLC checks, stopping at the first bad row"""
+        for i in range(o.size):
+            if h[i] < l[i] or h[i] < o[i] or h[i] < c[i] or l[i] > o[i] or l[i] > c[i]:
+                return True
+        return False
+else:
+    ohlc_invalid = _ohlc_invalid_vectorized
+
+
 class ComprehensiveDataPuller:
     """Comprehensive data pulling system for historical market data"""
     
-    def __init__(self, output_dir: str = "historical_data"):
+    def __init__(self, output_dir: str = "historical_data", output_format: str = "parquet"):
         self.provider = None
+        self.session = None
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        # Output format: 'parquet' (default) or 'csv'
+        if output_format == "parquet" and not PYARROW_AVAILABLE:
+            logger.warning("pyarrow not installed; falling back to CSV output")
+            output_format = "csv"
+        self.output_format = output_format
+        
         # Configuration
         self.start_date = datetime(1996, 1, 1)
         self.end_date = datetime(2025, 7, 12)
         self.timeframe = "day"
+        self.narrow_dtypes = True  # float32 OHLC / int32 volume right after fetch
+        self.min_validation_rows = 2  # Smaller frames skip the value checks
         self.max_retries = 3
-        self.delay_between_requests = 0.5  # Respect API rate limits
+        self.delay_between_requests = 0.5  # Base retry backoff
+        self.requests_per_second = 5  # Respect API rate limits
+        self.limiter = RateLimiter(self.requests_per_second)
+        self.max_concurrent_requests = 16  # Tickers fetched in flight at once
+        self.validate_workers = 2  # Threads running data validation
+        self.save_workers = 2  # Threads dedicated to disk writes
+        self.pipeline_queue_size = 32  # Frames buffered between pipeline stages
+        # 'thread' for network-bound runs, 'process' when response parsing dominates
+        self.executor_type = "thread"
+        self.process_workers = os.cpu_count() or 4
+        self.http_pool_size = 64  # Keep-alive connections shared by fetch threads
         
         # Progress tracking
-        self.progress_file = self.output_dir / "progress.json"
+        self.progress_db_file = self.output_dir / "progress.db"
+        self.legacy_progress_file = self.output_dir / "progress.json"  # Pre-SQLite runs
+        self._progress_conn = None  # Opened on first use
         self.error_log_file = self.output_dir / "errors.json"
         self.summary_file = self.output_dir / "summary.json"
         
         # Statistics
         self.stats = {
             'total_tickers': 0,
-            'successful_downloads': 0,
-            'failed_downloads': 0,
-            'total_data_points': 0,
             'start_time': None,
-            'end_time': None,
-            'errors': []
+            'end_time': None
         }
+        # Hot counters live outside the dict and are folded in by save_summary
+        self.successful_downloads = 0
+        self.failed_downloads = 0
+        self.total_data_points = 0
+        self.max_recorded_errors = 10000
+        self.errors = deque(maxlen=self.max_recorded_errors)  # (ticker, error, monotonic_ns)
+        self._start_ns = None  # time.monotonic_ns() at run start
         
         logger.info(f"Initialized data puller for {self.start_date.date()} to {self.end_date.date()}")
         
@@ -97,6 +226,9 @@ class ComprehensiveDataPuller:
             
             if self.provider.authenticate():
                 logger.info("✅ Upstox authentication successful")
+                self.configure_session(self.provider.session)
+                # Load the instrument table once, before concurrent fetches share it
+                self.provider.fetch_instrument_details()
                 return True
             else:
                 logger.error("❌ Upstox authentication failed")
@@ -106,25 +238,86 @@ class ComprehensiveDataPuller:
             logger.error(f"Error setting up provider: {e}")
             return False
     
+    def configure_session(self, session):
+        """
+        Give the provider a private session pooled for the concurrent fetch threads.
+        
+        The authenticated session is shared process-wide by config.create_session,
+        so it is copied (headers, timeout and retry policy, which already backs
+        off on 429/5xx) with a pool of http_pool_size rather than remounted.
+        """
+        self.close_session()
+        self.session = self.provider.session = private_session(session, self.http_pool_size)
+    
+    def close_session(self):
+        """Close the private session and its keep-alive connections"""
+        if self.session is not None:
+            self.session.close()
+            self.session = None
+    
+    def _progress_db(self) -> sqlite3.Connection:
+        """Return the WAL-mode progress database, opening it on first use"""
+        if self._progress_conn is None:
+            conn = sqlite3.connect(self.progress_db_file)
+            conn.execute("PRAGMA journal_mode=WAL")  # Monitor can read while we write
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(PROGRESS_SCHEMA)
+            self._progress_conn = conn
+        return self._progress_conn
+    
+    def _import_legacy_progress(self, conn: sqlite3.Connection):
+        """Seed an empty progress database from a progress.json left by older runs"""
+        if not self.legacy_progress_file.exists():
+            return
+        if conn.execute("SELECT 1 FROM progress LIMIT 1").fetchone():
+            return
+        
+        with open(self.legacy_progress_file, 'r') as f:
+            legacy = json.load(f)
+        with conn:
+            conn.executemany(PROGRESS_UPSERT, [
+                (ticker, *(info.get(field) for field in PROGRESS_FIELDS))
+                for ticker, info in legacy.items()
+            ])
+        logger.info(f"Imported {len(legacy)} tickers from {self.legacy_progress_file}")
+    
     def load_progress(self) -> Dict:
-        """Load progress from previous run"""
-        if self.progress_file.exists():
-            try:
-                with open(self.progress_file, 'r') as f:
-                    progress = json.load(f)
-                logger.info(f"Resumed from previous run: {len(progress)} tickers already processed")
-                return progress
-            except Exception as e:
-                logger.warning(f"Could not load progress: {e}")
-        return {}
+        """Load progress from previous runs out of the progress database"""
+        progress = {}
+        try:
+            conn = self._progress_db()
+            self._import_legacy_progress(conn)
+            rows = conn.execute(f"SELECT ticker, {', '.join(PROGRESS_FIELDS)} FROM progress")
+            for ticker, *values in rows:
+                progress[ticker] = {field: value for field, value in zip(PROGRESS_FIELDS, values)
+                                    if value is not None}
+        except Exception as e:
+            logger.warning(f"Could not load progress: {e}")
+        
+        if progress:
+            logger.info(f"Resumed from previous run: {len(progress)} tickers already processed")
+        return progress
+    
+    def record_progress(self, ticker: str, info: Dict):
+        """Upsert a single ticker's status in its own short transaction"""
+        try:
+            conn = self._progress_db()
+            with conn:
+                conn.execute(PROGRESS_UPSERT, (ticker, *(info.get(field) for field in PROGRESS_FIELDS)))
+        except Exception as e:
+            logger.error(f"Error recording progress for {ticker}: {e}")
     
-    def save_progress(self, progress: Dict):
-        """Save current progress"""
+    def save_progress(self):
+        """Fold the WAL back into progress.db and close the connection"""
+        if self._progress_conn is None:
+            return
         try:
-            with open(self.progress_file, 'w') as f:
-                json.dump(progress, f, indent=2)
+            self._progress_conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._progress_conn.close()
         except Exception as e:
             logger.error(f"Error saving progress: {e}")
+        finally:
+            self._progress_conn = None
     
     def fetch_ticker_data(self, ticker: str) -> Tuple[Optional[pd.DataFrame], str]:
         """
@@ -137,6 +330,7 @@ class ComprehensiveDataPuller:
             try:
                 logger.info(f"Fetching data for {ticker} (attempt {attempt + 1}/{self.max_retries})")
                 
+                self.limiter.wait()
                 df = self.provider.fetch_historical_data(
                     symbol=ticker,
                     start_date=self.start_date,
@@ -148,6 +342,9 @@ class ComprehensiveDataPuller:
                     logger.warning(f"No data returned for {ticker}")
                     return None, "No data available"
                 
+                if self.narrow_dtypes:
+                    df = narrow_dtypes(df)
+                
                 # Data validation
                 if self.validate_data(df, ticker):
                     logger.info(f"✅ Successfully fetched {len(df)} data points for {ticker}")
@@ -165,39 +362,86 @@ class ComprehensiveDataPuller:
         
         return None, "Max retries exceeded"
     
+    async def fetch_ticker_data_async(self, ticker: str, executor: ThreadPoolExecutor) -> Tuple[Optional[pd.DataFrame], str]:
+        """
+        Async counterpart of fetch_ticker_data.
+        
+        The provider's HTTP calls are blocking, so each attempt runs in the
+        fetch executor while the event loop keeps other tickers in flight.
+        Validation is left to the pipeline's validate stage.
+        
+        Returns:
+            Tuple of (DataFrame, status_message)
+        """
+        loop = asyncio.get_running_loop()
+        
+        for attempt in range(self.max_retries):
+            try:
+                logger.info(f"Fetching data for {ticker} (attempt {attempt + 1}/{self.max_retries})")
+                
+                await self.limiter.acquire()
+                df = await loop.run_in_executor(
+                    executor,
+                    lambda: self.provider.fetch_historical_data(
+                        symbol=ticker,
+                        start_date=self.start_date,
+                        end_date=self.end_date,
+                        timeframe=self.timeframe
+                    )
+                )
+                
+                if df.empty:
+                    logger.warning(f"No data returned for {ticker}")
+                    return None, "No data available"
+                
+                if self.narrow_dtypes:
+                    df = narrow_dtypes(df)
+                
+                return df, "Fetched"
+                    
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1} failed for {ticker}: {e}")
+                if attempt < self.max_retries - 1:
+                    await asyncio.sleep(self.delay_between_requests * (attempt + 1))  # Exponential backoff
+                else:
+                    return None, f"Failed after {self.max_retries} attempts: {str(e)}"
+        
+        return None, "Max retries exceeded"
+    
     def validate_data(self, df: pd.DataFrame, ticker: str) -> bool:
         """Validate the quality of fetched data"""
         try:
             # Check if DataFrame has required columns
-            required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            if not all(col in df.columns for col in required_columns):
+            if not REQUIRED_COLUMNS.issubset(df.columns):
                 logger.error(f"Missing required columns for {ticker}")
                 return False
             
+            # Nothing to cross-check in trivially small frames
+            if len(df) < self.min_validation_rows:
+                return True
+            
+            # Validate on raw per-column arrays; a 2-D to_numpy would upcast the
+            # narrowed float32/int32 columns into a float64 copy
+            o, h, l, c = (np.ascontiguousarray(df[col].to_numpy()) for col in ('open', 'high', 'low', 'close'))
+            v = df['volume'].to_numpy()
+            
             # Check for reasonable data ranges
-            if df['close'].max() <= 0 or df['volume'].min() < 0:
+            if c.max() <= 0 or v.min() < 0:
                 logger.error(f"Invalid price/volume data for {ticker}")
                 return False
             
             # Check for reasonable OHLC relationships
-            invalid_ohlc = (
-                (df['high'] < df['low']) |
-                (df['high'] < df['open']) |
-                (df['high'] < df['close']) |
-                (df['low'] > df['open']) |
-                (df['low'] > df['close'])
-            ).any()
+            invalid_ohlc = ohlc_invalid(o, h, l, c)
             
             if invalid_ohlc:
                 logger.warning(f"Invalid OHLC relationships found for {ticker}")
                 # Don't fail validation for this, just warn
             
-            # Check date range coverage
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            earliest_date = df['timestamp'].min()
-            latest_date = df['timestamp'].max()
-            
-            logger.info(f"Data range for {ticker}: {earliest_date.date()} to {latest_date.date()}")
+            # Report date range coverage (provider returns frames sorted by timestamp)
+            if logger.isEnabledFor(logging.DEBUG):
+                earliest_date = df['timestamp'].iloc[0]
+                latest_date = df['timestamp'].iloc[-1]
+                logger.debug(f"Data range for {ticker}: {earliest_date.date()} to {latest_date.date()}")
             
             return True
             
@@ -206,17 +450,27 @@ class ComprehensiveDataPuller:
             return False
     
     def save_ticker_data(self, ticker: str, df: pd.DataFrame):
-        """Save ticker data to CSV file"""
+        """Save ticker data to a Parquet (or CSV) file"""
         try:
-            # Ensure timestamp is properly formatted
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
-            df = df.sort_values('timestamp')
-            
-            # Create ticker-specific output file
-            output_file = self.output_dir / f"{ticker}.csv"
+            # Serialize in memory so each file lands with a single open/write/close
+            if self.output_format == "parquet":
+                # Typed, zstd-compressed columnar file
+                output_file = self.output_dir / f"{ticker}.parquet"
+                table = pa.Table.from_pandas(narrow_dtypes(df), preserve_index=False)
+                sink = pa.BufferOutputStream()
+                pq.write_table(table, sink, compression='zstd',
+                               row_group_size=PARQUET_ROW_GROUP_SIZE)
+                payload = sink.getvalue().to_pybytes()
+            else:
+                # Create ticker-specific output file
+                output_file = self.output_dir / f"{ticker}.csv"
+                
+                # Save with proper formatting
+                buffer = io.StringIO()
+                df.to_csv(buffer, index=False, date_format='%Y-%m-%d %H:%M:%S%z')
+                payload = buffer.getvalue().encode('utf-8')
             
-            # Save with proper formatting
-            df.to_csv(output_file, index=False, date_format='%Y-%m-%d %H:%M:%S%z')
+            output_file.write_bytes(payload)
             
             logger.info(f"Saved {len(df)} records for {ticker} to {output_file}")
             
@@ -227,34 +481,47 @@ class ComprehensiveDataPuller:
     def update_statistics(self, ticker: str, success: bool, data_points: int = 0, error: str = None):
         """Update running statistics"""
         if success:
-            self.stats['successful_downloads'] += 1
-            self.stats['total_data_points'] += data_points
+            self.successful_downloads += 1
+            self.total_data_points += data_points
         else:
-            self.stats['failed_downloads'] += 1
+            self.failed_downloads += 1
             if error:
-                self.stats['errors'].append({
-                    'ticker': ticker,
-                    'error': error,
-                    'timestamp': datetime.now().isoformat()
-                })
+                self.errors.append((ticker, error, time.monotonic_ns()))
     
     def save_summary(self):
         """Save final summary report"""
         try:
+            end_ns = time.monotonic_ns()
             self.stats['end_time'] = datetime.now().isoformat()
             
-            if self.stats['start_time']:
-                duration = datetime.now() - datetime.fromisoformat(self.stats['start_time'])
+            self.stats['successful_downloads'] = self.successful_downloads
+            self.stats['failed_downloads'] = self.failed_downloads
+            self.stats['total_data_points'] = self.total_data_points
+            self.stats['errors'] = []
+            
+            if self._start_ns is not None:
+                # Monotonic clock: immune to wall-clock adjustments mid-run
+                started = datetime.fromisoformat(self.stats['start_time'])
+                duration = timedelta(microseconds=(end_ns - self._start_ns) // 1000)
                 self.stats['duration_seconds'] = duration.total_seconds()
                 self.stats['duration_formatted'] = str(duration)
+                
+                # Resolve error timestamps against the recorded start
+                self.stats['errors'] = [
+                    {
+                        'ticker': ticker,
+                        'error': error,
+                        'timestamp': (started + timedelta(microseconds=(error_ns - self._start_ns) // 1000)).isoformat()
+                    }
+                    for ticker, error, error_ns in self.errors
+                ]
             
             # Calculate success rate
-            total_processed = self.stats['successful_downloads'] + self.stats['failed_downloads']
+            total_processed = self.successful_downloads + self.failed_downloads
             if total_processed > 0:
-                self.stats['success_rate'] = (self.stats['successful_downloads'] / total_processed) * 100
+                self.stats['success_rate'] = (self.successful_downloads / total_processed) * 100
             
-            with open(self.summary_file, 'w') as f:
-                json.dump(self.stats, f, indent=2)
+            self.summary_file.write_bytes(dump_json(self.stats, indent=True))
             
             logger.info("📊 FINAL SUMMARY:")
             logger.info(f"  Total tickers: {self.stats['total_tickers']}")
@@ -272,6 +539,7 @@ class ComprehensiveDataPuller:
         try:
             # Initialize
             self.stats['start_time'] = datetime.now().isoformat()
+            self._start_ns = time.monotonic_ns()
             
             # Load tickers
             tickers = self.load_tickers(tickers_file)
@@ -293,53 +561,25 @@ class ComprehensiveDataPuller:
             logger.info(f"🚀 Starting data collection for {len(tickers)} tickers...")
             logger.info(f"📅 Date range: {self.start_date.date()} to {self.end_date.date()}")
             
+            pending = []
             for i, ticker in enumerate(tickers, 1):
                 # Skip if already processed
                 if ticker in progress and progress[ticker].get('status') == 'success':
                     logger.info(f"[{i}/{len(tickers)}] Skipping {ticker} (already processed)")
-                    self.stats['successful_downloads'] += 1
-                    self.stats['total_data_points'] += progress[ticker].get('data_points', 0)
+                    self.update_statistics(ticker, True, progress[ticker].get('data_points', 0))
                     continue
-                
-                logger.info(f"[{i}/{len(tickers)}] Processing {ticker}...")
-                
-                # Fetch data
-                df, status_message = self.fetch_ticker_data(ticker)
-                
-                if df is not None:
-                    # Save data
-                    self.save_ticker_data(ticker, df)
-                    
-                    # Update progress
-                    progress[ticker] = {
-                        'status': 'success',
-                        'data_points': len(df),
-                        'date_range': f"{df['timestamp'].min()} to {df['timestamp'].max()}",
-                        'processed_at': datetime.now().isoformat()
-                    }
-                    
-                    self.update_statistics(ticker, True, len(df))
-                    
-                else:
-                    # Handle failure
-                    progress[ticker] = {
-                        'status': 'failed',
-                        'error': status_message,
-                        'processed_at': datetime.now().isoformat()
-                    }
-                    
-                    self.update_statistics(ticker, False, error=status_message)
-                
-                # Save progress periodically
-                if i % 10 == 0:
-                    self.save_progress(progress)
-                    logger.info(f"Progress saved. Processed {i}/{len(tickers)} tickers.")
-                
-                # Rate limiting
-                time.sleep(self.delay_between_requests)
+                pending.append(ticker)
+            
+            # Resolve every instrument key up front in one batched lookup
+            resolved = self.provider.resolve_instrument_ids(pending)
+            if len(resolved) < len(pending):
+                logger.warning(f"⚠️ {len(pending) - len(resolved)} tickers have no instrument key and will fail")
+            
+            # Fetch remaining tickers concurrently
+            asyncio.run(self._collect_async(pending, progress))
             
             # Final save
-            self.save_progress(progress)
+            self.save_progress()
             self.save_summary()
             
             logger.info("🎉 Data collection completed successfully!")
@@ -347,13 +587,301 @@ class ComprehensiveDataPuller:
             
         except KeyboardInterrupt:
             logger.info("⚠️ Data collection interrupted by user")
-            self.save_progress(progress)
+            self.save_progress()
             self.save_summary()
             return False
             
         except Exception as e:
             logger.error(f"Fatal error in data collection: {e}")
             return False
+            
+        finally:
+            self.close_session()
+
+    async def _collect_async(self, tickers: List[str], progress: Dict):
+        """
+        Run tickers through a fetch -> validate -> save pipeline.
+        
+        Each stage has its own executor and the stages are joined by bounded
+        queues, so network, validation and disk work for different tickers
+        overlap while memory stays capped. At most max_concurrent_requests
+        fetches are in flight, and a single consumer task owns
+        progress/statistics updates.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        validate_q: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline_queue_size)
+        save_q: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline_queue_size)
+        results: asyncio.Queue = asyncio.Queue()
+        
+        use_processes = self.executor_type == "process"
+        if use_processes:
+            # Each worker builds and authenticates its own provider; the shared
+            # request budget is split evenly across them
+            fetch_executor = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                initializer=_init_fetch_worker,
+                initargs=(str(self.output_dir), self.start_date, self.end_date, self.timeframe,
+                          self.requests_per_second / self.process_workers)
+            )
+        else:
+            fetch_executor = ThreadPoolExecutor(max_workers=self.max_concurrent_requests,
+                                                thread_name_prefix="fetch")
+        validate_executor = ThreadPoolExecutor(max_workers=self.validate_workers,
+                                               thread_name_prefix="validate")
+        save_executor = ThreadPoolExecutor(max_workers=self.save_workers,
+                                           thread_name_prefix="save")
+        
+        # Shared memory segments handed back by workers and not yet received;
+        # whatever is left (cancelled or failed receives) is unlinked at the end
+        unreceived_segments = set()
+        
+        def track_segment(future):
+            if not future.cancelled() and future.exception() is None:
+                data = future.result()[0]
+                if isinstance(data, tuple):
+                    unreceived_segments.add(data[0])
+        
+        async def fetch(ticker: str):
+            async with semaphore:
+                if use_processes:
+                    # Workers validate before shipping the frame back
+                    next_q = save_q
+                    try:
+                        worker_future = fetch_executor.submit(_worker_fetch, ticker)
+                        worker_future.add_done_callback(track_segment)
+                        data, status_message = await asyncio.wrap_future(worker_future)
+                        try:
+                            df = _receive_frame(data)
+                        finally:
+                            if isinstance(data, tuple):
+                                unreceived_segments.discard(data[0])
+                    except Exception as e:
+                        df, status_message = None, f"Worker failed: {e}"
+                else:
+                    next_q = validate_q
+                    df, status_message = await self.fetch_ticker_data_async(ticker, fetch_executor)
+            
+            if df is None:
+                await results.put((ticker, None, status_message))
+            else:
+                await next_q.put((ticker, df))
+        
+        async def validate():
+            while True:
+                item = await validate_q.get()
+                if item is None:
+                    break
+                
+                ticker, df = item
+                if await loop.run_in_executor(validate_executor, self.validate_data, df, ticker):
+                    logger.info(f"✅ Successfully fetched {len(df)} data points for {ticker}")
+                    await save_q.put((ticker, df))
+                else:
+                    logger.warning(f"Data validation failed for {ticker}")
+                    await results.put((ticker, None, "Data validation failed"))
+        
+        async def save():
+            while True:
+                item = await save_q.get()
+                if item is None:
+                    break
+                
+                ticker, df = item
+                try:
+                    await loop.run_in_executor(save_executor, self.save_ticker_data, ticker, df)
+                    await results.put((ticker, df, "Success"))
+                except Exception as e:
+                    await results.put((ticker, None, f"Save failed: {e}"))
+        
+        consumer = asyncio.create_task(self._consume_results(results, progress, len(tickers)))
+        validators = [asyncio.create_task(validate()) for _ in range(self.validate_workers)]
+        savers = [asyncio.create_task(save()) for _ in range(self.save_workers)]
+        try:
+            outcomes = await asyncio.gather(*[fetch(ticker) for ticker in tickers], return_exceptions=True)
+            # A fetch task that raised never reported its ticker; record it as failed
+            for ticker, outcome in zip(tickers, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(f"Fetch task for {ticker} failed: {outcome!r}", exc_info=outcome)
+                    await results.put((ticker, None, f"Fetch task failed: {outcome!r}"))
+            
+            # Drain the pipeline stage by stage with one sentinel per worker
+            for _ in validators:
+                await validate_q.put(None)
+            await asyncio.gather(*validators)
+            for _ in savers:
+                await save_q.put(None)
+            await asyncio.gather(*savers)
+            await results.put(None)
+            await consumer
+        finally:
+            fetch_executor.shutdown(wait=True)
+            validate_executor.shutdown(wait=True)
+            save_executor.shutdown(wait=True)
+            for name in unreceived_segments:
+                _unlink_segment(name)
+    
+    async def _consume_results(self, results: asyncio.Queue, progress: Dict, total: int):
+        """Record completed tickers, journaling each update as it lands"""
+        completed = 0
+        
+        while True:
+            item = await results.get()
+            if item is None:
+                break
+            
+            ticker, df, status_message = item
+            completed += 1
+            logger.info(f"[{completed}/{total}] Finished {ticker}: {status_message}")
+            
+            if df is not None:
+                # Update progress
+                progress[ticker] = {
+                    'status': 'success',
+                    'data_points': len(df),
+                    'date_range': f"{df['timestamp'].iloc[0]} to {df['timestamp'].iloc[-1]}",
+                    'processed_at': datetime.now().isoformat()
+                }
+                
+                self.update_statistics(ticker, True, len(df))
+                
+            else:
+                # Handle failure
+                progress[ticker] = {
+                    'status': 'failed',
+                    'error': status_message,
+                    'processed_at': datetime.now().isoformat()
+                }
+                
+                self.update_statistics(ticker, False, error=status_message)
+            
+            self.record_progress(ticker, progress[ticker])
+            
+            if completed % 10 == 0:
+                logger.info(f"Progress recorded. Processed {completed}/{total} tickers.")
+
+# Per-process puller used by the process-pool fetch path
+_worker_puller: Optional[ComprehensiveDataPuller] = None
+
+
+def _init_fetch_worker(output_dir: str, start_date: datetime, end_date: datetime,
+                       timeframe: str, requests_per_second: float):
+    """Process-pool initializer: build an authenticated puller for this worker"""
+    global _worker_puller
+    puller = ComprehensiveDataPuller(output_dir)
+    puller.start_date = start_date
+    puller.end_date = end_date
+    puller.timeframe = timeframe
+    puller.limiter = RateLimiter(requests_per_second)
+    
+    # Reuses the token cached by the parent process
+    if not puller.setup_provider():
+        puller.provider = None
+    _worker_puller = puller
+
+
+def _worker_fetch(ticker: str):
+    """
+    Fetch and validate a ticker inside a worker process.
+    
+    Returns:
+        Tuple of (frame payload, status_message); see _send_frame
+    """
+    if _worker_puller is None or _worker_puller.provider is None:
+        return None, "Provider setup failed in worker"
+    
+    df, status_message = _worker_puller.fetch_ticker_data(ticker)
+    if df is None:
+        return None, status_message
+    return _send_frame(df), status_message
+
+
+def _send_frame(df: pd.DataFrame):
+    """
+    Package a worker's frame for the trip back to the main process.
+    
+    With shared memory available the table is written as an Arrow IPC
+    stream straight into a new segment and only (name, size) is pickled;
+    otherwise the Arrow table (or, without pyarrow, the DataFrame) is
+    returned as-is.
+    """
+    if not PYARROW_AVAILABLE:
+        return df
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if not SHARED_MEMORY_TRANSPORT:
+        return table
+    
+    # Size the stream first so it can be written into the segment in one pass
+    mock = pa.MockOutputStream()
+    with pa.ipc.new_stream(mock, table.schema) as writer:
+        writer.write_table(table)
+    size = mock.size()
+    
+    # The main process unlinks the segment once read (or when the run ends),
+    # so this worker's resource tracker must not reclaim it first
+    if sys.version_info >= (3, 13):
+        shm = shared_memory.SharedMemory(create=True, size=size, track=False)
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        # POSIX segments are registered under their public name with a leading slash
+        resource_tracker.unregister(f"/{shm.name}", 'shared_memory')
+    try:
+        _write_ipc_frame(shm.buf, table)
+    except BaseException:
+        _release_segment(shm)
+        raise
+    shm.close()
+    return shm.name, size
+
+
+def _release_segment(shm: shared_memory.SharedMemory):
+    """Close and unlink a segment; the unlink runs even if close() fails"""
+    try:
+        shm.close()
+    finally:
+        shm.unlink()
+
+
+def _unlink_segment(name: str):
+    """Free a segment by name if it still exists (frames that were never received)"""
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    _release_segment(shm)
+
+
+def _receive_frame(data) -> Optional[pd.DataFrame]:
+    """Rebuild a DataFrame from a _send_frame payload, freeing any shared segment"""
+    if data is None or isinstance(data, pd.DataFrame):
+        return data
+    if isinstance(data, tuple):
+        name, size = data
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            return _read_ipc_frame(shm.buf, size)
+        finally:
+            # Unlink even if close() fails, or the segment outlives the run in /dev/shm
+            _release_segment(shm)
+    return data.to_pandas()
+
+
+def _write_ipc_frame(buffer: memoryview, table):
+    """Write a table as an Arrow IPC stream into a preallocated buffer"""
+    # Kept in its own frame so every view of the buffer is released on return
+    sink = pa.FixedSizeBufferWriter(pa.py_buffer(buffer))
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def _read_ipc_frame(buffer: memoryview, size: int) -> pd.DataFrame:
+    """Read an Arrow IPC stream from a buffer into a DataFrame that owns its memory"""
+    # to_pandas can keep zero-copy views (e.g. string columns with pandas >= 3),
+    # so copy the stream out first; the segment can then be released on return
+    with buffer[:size] as view:
+        payload = pa.py_buffer(bytes(view))
+    return pa.ipc.open_stream(payload).read_all().to_pandas()
+
 
 def main():
     """Main execution function"""
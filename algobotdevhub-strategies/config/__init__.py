@@ -9,10 +9,24 @@ from .config import (
     setup_logging,
     setup_logging_back,
     create_session,
+    private_session,
+    close_sessions,
+    stop_log_listeners,
     ZERODHA_CONFIG,
     UPSTOX_CONFIG,
+    Timeframe,
+    parse_timeframe,
+    upstox_unit_interval,
+    to_broker_tf,
+    from_broker_tf,
     save_zerodha_access_token,
     load_zerodha_access_token,
     load_upstox_access_token,
-    save_upstox_access_token
+    save_upstox_access_token,
+    aload_latest_access_token,
+    asave_access_token,
+    aload_zerodha_access_token,
+    asave_zerodha_access_token,
+    aload_upstox_access_token,
+    asave_upstox_access_token
 )
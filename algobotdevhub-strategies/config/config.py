@@ -17,20 +17,38 @@ Key features:
 """
 
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 import os
 import json
 import logging
 import sys
+import time
+import asyncio
+import atexit
+import queue
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import threading
 import pytz
-from logging.handlers import TimedRotatingFileHandler, RotatingFileHandler
-from typing import Dict, Any, Optional, Union
-import traceback
+from logging.handlers import TimedRotatingFileHandler, RotatingFileHandler, QueueHandler, QueueListener
+from typing import Callable, Dict, Any, Optional, Union, Tuple
+from enum import IntEnum
+from functools import lru_cache, cache
+from collections import ChainMap
+from dataclasses import dataclass
 from urllib.parse import urlencode
 import platform
+import tempfile
 import uuid
+import weakref
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 # Setup basic logging initially (will be enhanced in setup_logging functions)
 logging.basicConfig(
@@ -38,40 +56,214 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 )
 
-# Control logging level for third-party libraries
-logging.getLogger("asyncio").setLevel(logging.WARNING)
-logging.getLogger("urllib3").setLevel(logging.WARNING)
-logging.getLogger("requests").setLevel(logging.WARNING)
-logging.getLogger("aiohttp").setLevel(logging.WARNING)
+# Control logging level for third-party libraries. The level check in
+# Logger.isEnabledFor rejects their DEBUG/INFO calls before a LogRecord is
+# built, so nothing below WARNING ever reaches the root handlers.
+_QUIET_LIBRARY_LOGGERS = ("asyncio", "urllib3", "requests", "aiohttp")
+for _name in _QUIET_LIBRARY_LOGGERS:
+    logging.getLogger(_name).setLevel(logging.WARNING)
+del _name
 
 # Define the base directory as the parent of this file's directory
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-# Create a unique system ID for this instance
-SYSTEM_ID = str(uuid.uuid4())[:8]
+# Unique system ID for this instance, generated on first use so importing
+# the config does not read from the kernel entropy pool
+@cache
+def _system_id() -> str:
+    """Short unique ID for this instance"""
+    return str(uuid.uuid4())[:8]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve SYSTEM_ID lazily (PEP 562 module attribute)"""
+    if name == "SYSTEM_ID":
+        return _system_id()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Define IST timezone for consistent timestamping
 IST = pytz.timezone("Asia/Kolkata")
 
+# IST has had no DST since 1945, so log formatting can use a fixed offset
+_IST_OFFSET_SECONDS = 5 * 3600 + 30 * 60
+_IST_FIXED = timezone(timedelta(seconds=_IST_OFFSET_SECONDS))
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
 # Thread lock for token operations
 _token_lock = threading.RLock()
 
+# Per-second cache of the IST clock: [epoch second, 'YYYY-MM-DD', ISO timestamp]
+_ist_clock_cache = [None, None, None]
+_ist_clock_lock = threading.Lock()
+
 # Environment detection
 ENV = os.getenv("TRADING_ENV", "development").lower()
 IS_PRODUCTION = ENV == "production"
 IS_DEVELOPMENT = ENV == "development"
 IS_TESTING = ENV == "testing"
 
+# Legacy Zerodha access_token.csv mirror (opt-in for tools that still read it)
+ZERODHA_LEGACY_CSV = os.getenv("ZERODHA_LEGACY_CSV", "0") == "1"
+
 # System information
-SYSTEM_INFO = {
-    "hostname": platform.node(),
-    "platform": platform.platform(),
-    "python_version": platform.python_version(),
-    "cpu_count": os.cpu_count(),
-    "system_id": SYSTEM_ID,
-    "environment": ENV
+class _LazyDict(dict):
+    """
+    Plain dict whose deferred keys are computed on first use, then stored.
+    
+    Looking up a deferred key computes just that value; reading the dict as a
+    whole (iteration, items(), json.dumps, repr, copies) computes the rest first.
+    Pickling and deep copies produce a plain dict.
+    """
+    
+    def __init__(self, values: Dict[str, Any], deferred: Dict[str, Callable[[], Any]]):
+        super().__init__(values)
+        self._deferred = dict(deferred)
+        
+    def _resolve(self, *keys: str):
+        """Compute the given deferred keys, or all of them"""
+        for key in keys or tuple(self._deferred):
+            factory = self._deferred.get(key)
+            if factory is not None:
+                dict.__setitem__(self, key, factory())
+                self._deferred.pop(key, None)
+        
+    def __missing__(self, key: str) -> Any:
+        if key not in self._deferred:
+            raise KeyError(key)
+        self._resolve(key)
+        return dict.__getitem__(self, key)
+    
+    def __setitem__(self, key: str, value: Any):
+        self._deferred.pop(key, None)
+        dict.__setitem__(self, key, value)
+        
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self, key) or key in self._deferred
+    
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._deferred)
+    
+    def __iter__(self):
+        self._resolve()
+        return dict.__iter__(self)
+    
+    def __eq__(self, other: object) -> bool:
+        self._resolve()
+        return dict.__eq__(self, other)
+    
+    def __ne__(self, other: object) -> bool:
+        self._resolve()
+        return dict.__ne__(self, other)
+    
+    def __repr__(self) -> str:
+        self._resolve()
+        return dict.__repr__(self)
+    
+    def __reduce__(self):
+        return dict, (self.copy(),)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self else default
+    
+    def keys(self):
+        self._resolve()
+        return dict.keys(self)
+    
+    def values(self):
+        self._resolve()
+        return dict.values(self)
+    
+    def items(self):
+        self._resolve()
+        return dict.items(self)
+    
+    def copy(self) -> Dict[str, Any]:
+        self._resolve()
+        return dict(dict.items(self))
+
+
+class SystemInfo(_LazyDict):
+    """Host details as a dict, with the slow probes deferred.
+    
+    platform.platform() can shell out on some systems and the system ID reads
+    the entropy pool, so those two entries are filled in on first use. Fields
+    are also readable as attributes (SYSTEM_INFO.platform).
+    """
+    
+    def __init__(self):
+        super().__init__(
+            {
+                "hostname": platform.node(),
+                "python_version": platform.python_version(),
+                "cpu_count": os.cpu_count(),
+                "environment": ENV,
+            },
+            {"platform": platform.platform, "system_id": _system_id}
+        )
+        
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+SYSTEM_INFO = SystemInfo()
+
+# === Standard Timeframes ===
+
+class Timeframe(IntEnum):
+    """Closed set of standard timeframes; each value indexes the tables below."""
+    M1 = 0
+    M2 = 1
+    M3 = 2
+    M5 = 3
+    M10 = 4
+    M15 = 5
+    M30 = 6
+    H1 = 7
+    H2 = 8
+    DAY = 9
+    WEEK = 10
+    MONTH = 11
+
+
+# Upstox V3 unit/interval per Timeframe value
+_UPSTOX_UNIT = ('minutes', 'minutes', 'minutes', 'minutes', 'minutes', 'minutes', 'minutes',
+                'hours', 'hours', 'days', 'weeks', 'months')
+_UPSTOX_INTERVAL = ('1', '2', '3', '5', '10', '15', '30', '1', '2', '1', '1', '1')
+
+# Accepted spellings, parsed once at the edge into a Timeframe
+_TIMEFRAME_BY_NAME = {
+    '1m': Timeframe.M1,
+    '2m': Timeframe.M2,
+    '3m': Timeframe.M3,
+    '5m': Timeframe.M5,
+    '10m': Timeframe.M10,
+    '15m': Timeframe.M15,
+    '30m': Timeframe.M30,
+    '1h': Timeframe.H1,
+    '2h': Timeframe.H2,
+    'day': Timeframe.DAY,
+    'week': Timeframe.WEEK,
+    'month': Timeframe.MONTH,
+    # Legacy spellings for backward compatibility
+    '1minute': Timeframe.M1,
+    '30minute': Timeframe.M30
 }
 
+
+def parse_timeframe(name: str) -> Optional[Timeframe]:
+    """Parse a timeframe string (e.g. '5m', 'day', '1minute'); None if unknown."""
+    return _TIMEFRAME_BY_NAME.get(name)
+
+
+def upstox_unit_interval(timeframe: Timeframe) -> Tuple[str, str]:
+    """Upstox V3 (unit, interval) for a timeframe, by tuple index."""
+    return _UPSTOX_UNIT[timeframe], _UPSTOX_INTERVAL[timeframe]
+
+
 # === Upstox Configuration ===
 UPSTOX_CONFIG = {
     # API credentials - MUST be set via environment variables
@@ -90,23 +282,10 @@ UPSTOX_CONFIG = {
     'MAX_DAYS_PER_REQUEST': 200,
     'API_VERSION': 'v3',  # Historical data API version
     
-    # V3 API unit and interval mappings
+    # V3 API unit and interval mappings (derived from the Timeframe tables)
     'TIMEFRAME_MAPPINGS': {
-        '1m': {'unit': 'minutes', 'interval': '1'},
-        '2m': {'unit': 'minutes', 'interval': '2'},
-        '3m': {'unit': 'minutes', 'interval': '3'},
-        '5m': {'unit': 'minutes', 'interval': '5'},
-        '10m': {'unit': 'minutes', 'interval': '10'},
-        '15m': {'unit': 'minutes', 'interval': '15'},
-        '30m': {'unit': 'minutes', 'interval': '30'},
-        '1h': {'unit': 'hours', 'interval': '1'},
-        '2h': {'unit': 'hours', 'interval': '2'},
-        'day': {'unit': 'days', 'interval': '1'},
-        'week': {'unit': 'weeks', 'interval': '1'},
-        'month': {'unit': 'months', 'interval': '1'},
-        # Legacy mappings for backward compatibility
-        '1minute': {'unit': 'minutes', 'interval': '1'},
-        '30minute': {'unit': 'minutes', 'interval': '30'}
+        name: {'unit': _UPSTOX_UNIT[tf], 'interval': _UPSTOX_INTERVAL[tf]}
+        for name, tf in _TIMEFRAME_BY_NAME.items()
     },
     
     # Supported timeframes for V3 API
@@ -165,6 +344,57 @@ ZERODHA_CONFIG = {
 }
 
 # === Backtester Configuration ===
+
+# Standardized timeframe definitions (used across the system)
+_STANDARD_TIMEFRAMES = {
+    '1m': {'upstox': '1minute', 'zerodha': 'minute'},
+    '3m': {'upstox': None, 'zerodha': '3minute'},
+    '5m': {'upstox': None, 'zerodha': '5minute'},
+    '10m': {'upstox': None, 'zerodha': '10minute'},
+    '15m': {'upstox': None, 'zerodha': '15minute'},
+    '30m': {'upstox': '30minute', 'zerodha': '30minute'},
+    '1h': {'upstox': None, 'zerodha': 'hour'},
+    'day': {'upstox': 'day', 'zerodha': 'day'},
+    'week': {'upstox': 'week', 'zerodha': 'week'},
+    'month': {'upstox': 'month', 'zerodha': 'month'}
+}
+
+
+# Providers the standard timeframe table is defined for
+_VALID_PROVIDERS = frozenset({'upstox', 'zerodha'})
+
+# Flat forward/reverse indexes over the table above, keyed by (timeframe, broker)
+_PROVIDER_TF: Dict[Tuple[str, str], Optional[str]] = {}
+_STANDARD_TF: Dict[Tuple[str, str], str] = {}
+
+
+def _rebuild_timeframe_index(standard_timeframes: Optional[Dict[str, Dict[str, Optional[str]]]] = None) -> None:
+    """Recompute the timeframe lookup indexes after the standard table changes."""
+    if standard_timeframes is None:
+        standard_timeframes = _STANDARD_TIMEFRAMES
+    _PROVIDER_TF.clear()
+    _STANDARD_TF.clear()
+    for std_tf, brokers in standard_timeframes.items():
+        for broker, broker_tf in brokers.items():
+            _PROVIDER_TF[std_tf, broker] = broker_tf
+            if broker_tf is not None:
+                # First standard timeframe wins, matching the original linear scan
+                _STANDARD_TF.setdefault((broker_tf, broker), std_tf)
+
+
+_rebuild_timeframe_index()
+
+
+def to_broker_tf(std_tf: str, broker: str) -> Optional[str]:
+    """Broker-specific timeframe for a standard one, or None if the broker lacks it"""
+    return _PROVIDER_TF.get((std_tf, broker))
+
+
+def from_broker_tf(broker_tf: str, broker: str) -> Optional[str]:
+    """Standard timeframe for a broker-specific one, or None if unknown"""
+    return _STANDARD_TF.get((broker_tf, broker))
+
+
 BACKTESTER_CONFIG = {
     # Primary data provider (can be 'upstox' or 'zerodha')
     'DATA_PROVIDER': os.getenv('DATA_PROVIDER', 'upstox'),
@@ -177,19 +407,8 @@ BACKTESTER_CONFIG = {
     'DEFAULT_TICKER': ["RELIANCE", "TCS", "INFY"],
     'DEFAULT_TIMEFRAME': ['1m', 'day'],
     
-    # Standardized timeframe definitions (used across the system)
-    'STANDARD_TIMEFRAMES': {
-        '1m': {'upstox': '1minute', 'zerodha': 'minute'},
-        '3m': {'upstox': None, 'zerodha': '3minute'},
-        '5m': {'upstox': None, 'zerodha': '5minute'},
-        '10m': {'upstox': None, 'zerodha': '10minute'},
-        '15m': {'upstox': None, 'zerodha': '15minute'},
-        '30m': {'upstox': '30minute', 'zerodha': '30minute'},
-        '1h': {'upstox': None, 'zerodha': 'hour'},
-        'day': {'upstox': 'day', 'zerodha': 'day'},
-        'week': {'upstox': 'week', 'zerodha': 'week'},
-        'month': {'upstox': 'month', 'zerodha': 'month'}
-    },
+    # Standardized timeframe definitions (read-only; translate via to_broker_tf)
+    'STANDARD_TIMEFRAMES': _STANDARD_TIMEFRAMES,
     
     # Supported timeframes in standardized format
     'SUPPORTED_TIMEFRAMES': ['1m', '3m', '5m', '10m', '15m', '30m', '1h', 'day', 'week', 'month'],
@@ -352,11 +571,10 @@ LIVE_TRADING_CONFIG = {
     'NOTIFICATION_LEVELS': ['ERROR', 'CRITICAL']
 }
 
-# Shared configuration
-COMMON_CONFIG = {
+# Shared configuration; SYSTEM_ID is generated on first lookup
+COMMON_CONFIG = _LazyDict({
     'VERSION': '0.05',  # Strategy Lab version
     'SYSTEM_INFO': SYSTEM_INFO,
-    'SYSTEM_ID': SYSTEM_ID,
     'BASE_DIR': BASE_DIR,
     'ENV': ENV,
     'IST_TIMEZONE': IST,
@@ -375,7 +593,127 @@ COMMON_CONFIG = {
     'LOG_MAX_SIZE_MB': 50,
     
     
-}
+}, {'SYSTEM_ID': _system_id})
+
+@dataclass(frozen=True)
+class _TokTpl:
+    """Dated token file name split into its directory and name parts."""
+    parent: Path
+    prefix: str = "access_token_"
+    suffix: str = ".json"
+    
+    def path(self, date_str: str) -> Path:
+        """Token file for a 'YYYY-MM-DD' date, joined without re-parsing the directory"""
+        return self.parent / f"{self.prefix}{date_str}{self.suffix}"
+
+
+# Lookup precedence for get_config_value. ChainMap holds references, so
+# update_config's in-place mutations are visible without a rebuild.
+_CONFIG_CHAIN = ChainMap(LIVE_TRADING_CONFIG, BACKTESTER_CONFIG, COMMON_CONFIG)
+
+# Hot-path lookups hoisted out of the config dicts once at import
+_UPSTOX_TOK_TPL = _TokTpl(Path(UPSTOX_CONFIG['ACCESS_TOKEN_DIR']))
+_ZERODHA_TOK_TPL = _TokTpl(Path(ZERODHA_CONFIG['ACCESS_TOKEN_DIR']))
+_ZERODHA_KEY_CSV = Path(ZERODHA_CONFIG['KEY_CSV_LOCATION'])
+_LIVE_TOK_TPL = _TokTpl(Path(LIVE_TRADING_CONFIG['ACCESS_TOKEN_DIR']))
+_BACKTESTER_LOG_DIR = BACKTESTER_CONFIG['LOG_DIR']
+_LIVE_LOG_DIR = LIVE_TRADING_CONFIG['LOG_DIR']
+
+
+# === Token File Serialization ===
+
+def json_dumps(obj, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON (indented or compact), using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: bool = True) -> None:
+    """
+    Write a file atomically: write and fsync a temp file, then os.replace it in.
+    
+    Concurrent readers (other threads or processes) see either the old or the
+    new complete file, never a torn one. fsync=False skips the flush to disk
+    for frequently rewritten files that can afford to lose the latest write on
+    power loss (the rename is still atomic).
+    """
+    path = Path(path)
+    # A uniquely named sibling per call, so concurrent writers never share a temp file
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    tmp_file = Path(tmp_name)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_file, path)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+# === Directory Helpers ===
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> None:
+    """Create a directory (and parents) at most once per process."""
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
+# === IST Clock Helpers ===
+
+def _ist_now_strings() -> Tuple[str, str]:
+    """
+    Return today's IST date string and the current IST ISO timestamp.
+    
+    Both are formatted at most once per wall-clock second; repeated token
+    saves/loads within the same second reuse the cached strings.
+    """
+    second = int(time.time())
+    with _ist_clock_lock:
+        if second != _ist_clock_cache[0]:
+            now = datetime.fromtimestamp(second, IST)
+            _ist_clock_cache[:] = [second, now.strftime("%Y-%m-%d"), now.isoformat()]
+        return _ist_clock_cache[1], _ist_clock_cache[2]
+
+
+def _today_ist_ordinal() -> int:
+    """Today's IST date as a proleptic Gregorian ordinal, from integer arithmetic only"""
+    return (int(time.time()) + _IST_OFFSET_SECONDS) // 86400 + _EPOCH_ORDINAL
+
+
+# (IST day ordinal, 'YYYY-MM-DD'); the string is rebuilt only when the IST day rolls over
+_ist_date_cache = (0, "")
+
+
+def _today_ist_str() -> str:
+    """Today's date in IST as 'YYYY-MM-DD'"""
+    global _ist_date_cache
+    day = _today_ist_ordinal()
+    cached = _ist_date_cache
+    if cached[0] != day:
+        cached = _ist_date_cache = (day, date.fromordinal(day).isoformat())
+    return cached[1]
+
+
+def _token_date_is_today(token_date_str: str) -> bool:
+    """Whether a stored 'YYYY-MM-DD' token date is today's IST date"""
+    try:
+        return date.fromisoformat(token_date_str).toordinal() == _today_ist_ordinal()
+    except (TypeError, ValueError):
+        return False
 
 
 # === Custom Logging Formatter for IST ===
@@ -384,9 +722,17 @@ class ISTFormatter(logging.Formatter):
     """
     Custom formatter to ensure all logs are timestamped in IST.
     """
+    # Directives time.strftime cannot render from a shifted struct_time
+    _DATETIME_DIRECTIVES = ('%z', '%Z', '%f')
+    
     def formatTime(self, record, datefmt=None):
+        if datefmt and not any(d in datefmt for d in self._DATETIME_DIRECTIVES):
+            # Fast path: shift the epoch by the IST offset and format as UTC,
+            # without building a datetime per record
+            return time.strftime(datefmt, time.gmtime(record.created + _IST_OFFSET_SECONDS))
+        
         # Convert record.created (float -> datetime in IST)
-        dt = datetime.fromtimestamp(record.created, IST)
+        dt = datetime.fromtimestamp(record.created, _IST_FIXED)
         if datefmt:
             return dt.strftime(datefmt)
         else:
@@ -394,12 +740,79 @@ class ISTFormatter(logging.Formatter):
             return dt.isoformat()
 
 
+# === Non-blocking Log Handlers ===
+
+# Background listeners that own the real file/console handlers, keyed by logger name
+_log_listeners: Dict[str, QueueListener] = {}
+
+
+def _attach_queue_listener(logger: logging.Logger, *handlers: logging.Handler) -> None:
+    """
+    Route a logger's records through a queue drained by a background thread.
+    
+    QueueHandler.prepare() still formats each record in the calling thread;
+    the handlers' write()s to disk and console happen on the listener thread.
+    Listeners live in _log_listeners so stop_log_listeners() can flush them.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logger.addHandler(QueueHandler(log_queue))
+    listener.start()
+    _log_listeners[logger.name] = listener
+
+
+def _stop_queue_listener(name: str) -> None:
+    """Flush and stop the listener for a logger, closing the handlers it owns."""
+    listener = _log_listeners.pop(name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def stop_log_listeners() -> None:
+    """Flush and stop every queue listener (registered with atexit; safe to call at shutdown)."""
+    for name in list(_log_listeners):
+        _stop_queue_listener(name)
+
+
+def _restart_queue_listeners_after_fork() -> None:
+    """
+    Give each listener a fresh queue and thread in a forked child.
+    
+    Threads do not survive fork, so without this the child's records would sit
+    in the inherited queue forever. Pool workers leave via os._exit and skip
+    atexit, hence the multiprocessing finalizer.
+    """
+    if not _log_listeners:
+        return
+    for name, listener in _log_listeners.items():
+        log_queue = queue.SimpleQueue()
+        listener.queue = log_queue
+        for handler in logging.getLogger(name).handlers:
+            if isinstance(handler, QueueHandler):
+                handler.queue = log_queue
+        listener._thread = None
+        listener.start()
+    
+    from multiprocessing import util as mp_util
+    mp_util.Finalize(None, stop_log_listeners, exitpriority=0)
+
+
+atexit.register(stop_log_listeners)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_queue_listeners_after_fork)
+
+
 # === Logging Setup Function ===
 
+@cache
 def setup_logging_back(module='backtester'):
     """
     Sets up logging for the backtester.
     Logs are stored in the Backtester/logs directory, with daily rotation.
+    Configured once per module per process; repeat calls return the cached logger.
     
     Args:
         module: Name of the module for which logging is being set up.
@@ -407,11 +820,11 @@ def setup_logging_back(module='backtester'):
     Returns:
         Configured logger instance
     """
-    log_dir = BACKTESTER_CONFIG['LOG_DIR']
-    log_dir.mkdir(parents=True, exist_ok=True)
+    log_dir = _BACKTESTER_LOG_DIR
+    _ensure_dir(str(log_dir))
 
     # Create a log file name with today's date (in IST)
-    current_date = datetime.now(IST).strftime('%Y-%m-%d')
+    current_date = _today_ist_str()
     log_file = log_dir / f"{module}_{current_date}.log"
     
     logger = logging.getLogger(module)
@@ -419,6 +832,7 @@ def setup_logging_back(module='backtester'):
     
     # Clear any existing handlers to prevent duplicates
     if logger.hasHandlers():
+        _stop_queue_listener(module)
         logger.handlers.clear()
     
     formatter = ISTFormatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s', '%Y-%m-%d %H:%M:%S')
@@ -438,23 +852,25 @@ def setup_logging_back(module='backtester'):
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Records are formatted in the caller; file and console writes happen on the listener thread
+    _attach_queue_listener(logger, file_handler, console_handler)
     logger.propagate = False
 
     # Log system information
     logger.info(f"Logger initialized for module '{module}'. Log file: {log_file}")
-    logger.info(f"System ID: {SYSTEM_ID}")
+    logger.info(f"System ID: {_system_id()}")
     logger.info(f"Environment: {ENV}")
-    logger.info(f"Python version: {SYSTEM_INFO['python_version']}")
+    logger.info(f"Python version: {SYSTEM_INFO.python_version}")
     
     return logger
 
 
+@cache
 def setup_logging(module='live_trading'):
     """
     Sets up logging for the specified module.
     Logs are written to both a file and the console.
+    Configured once per module per process; repeat calls return the cached logger.
     
     Args:
         module: Name of the module for which logging is being set up.
@@ -463,8 +879,8 @@ def setup_logging(module='live_trading'):
         Configured logger instance
     """
     # Define the log directory
-    log_dir = LIVE_TRADING_CONFIG['LOG_DIR']
-    log_dir.mkdir(parents=True, exist_ok=True)
+    log_dir = _LIVE_LOG_DIR
+    _ensure_dir(str(log_dir))
 
     # Define the log file path
     log_file = log_dir / f'{module}.log'
@@ -494,16 +910,15 @@ def setup_logging(module='live_trading'):
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
 
-    # Add the handlers to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Hand both handlers to a background listener; the logger formats and enqueues
+    _attach_queue_listener(logger, file_handler, console_handler)
 
     # Prevent log messages from being propagated to the root logger
     logger.propagate = False
     
     # Log system information
     logger.info(f"Logger initialized for module '{module}'. Log file: {log_file}")
-    logger.info(f"System ID: {SYSTEM_ID}")
+    logger.info(f"System ID: {_system_id()}")
     logger.info(f"Environment: {ENV}")
     logger.info(f"Trading mode: {LIVE_TRADING_CONFIG['TRADING_MODE']}")
     
@@ -530,13 +945,68 @@ def ensure_dirs_exist():
         LIVE_TRADING_CONFIG['ACCESS_TOKEN_DIR']
     ]
     
-    for directory in directories:
+    # Only leaf directories need creating; their ancestors come along with
+    # makedirs, so drop any path that is a parent of another before touching disk
+    leaves = set(map(Path, directories))
+    ancestors = {parent for directory in leaves for parent in directory.parents}
+    
+    for directory in sorted(leaves - ancestors, key=lambda d: len(d.parts)):
         try:
-            directory.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(str(directory))
         except Exception as e:
             logging.error(f"Error creating directory {directory}: {e}")
 
 
+# === Token File Lookup ===
+
+def _latest_token_file(token_tpl: _TokTpl) -> Optional[Path]:
+    """
+    Return the token file to validate from a token directory.
+    
+    Only today's file can be valid, so it is probed directly first; the
+    directory is scanned only when it is missing, in a single os.scandir
+    pass that keeps the newest match without building Path objects or sorting.
+    """
+    todays_file = token_tpl.path(_today_ist_str())
+    if todays_file.exists():
+        return todays_file
+    
+    prefix, suffix = token_tpl.prefix, token_tpl.suffix
+    best_path, best_mtime = None, -1.0
+    with os.scandir(token_tpl.parent) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(suffix):
+                mtime = entry.stat().st_mtime
+                if mtime > best_mtime:
+                    best_path, best_mtime = entry.path, mtime
+    
+    return Path(best_path) if best_path is not None else None
+
+
+# Last validated token per token directory: path, mtime, token and IST day
+# ordinal. A hit costs one stat() instead of a directory scan and JSON parse.
+_TOKEN_CACHE: Dict[_TokTpl, Dict[str, Any]] = {}
+
+
+def _cached_token(token_tpl: _TokTpl) -> Optional[str]:
+    """Return the cached token if it is from today and its file is unchanged."""
+    entry = _TOKEN_CACHE.get(token_tpl)
+    if entry is None or entry["date"] != _today_ist_ordinal():
+        return None
+    try:
+        if entry["path"].stat().st_mtime != entry["mtime"]:
+            return None
+    except OSError:
+        return None
+    return entry["token"]
+
+
+def _remember_token(token_tpl: _TokTpl, path: Path, mtime: float, token: str) -> None:
+    """Cache a token that has just passed today's-date validation."""
+    _TOKEN_CACHE[token_tpl] = {"path": path, "mtime": mtime, "token": token, "date": _today_ist_ordinal()}
+
+
 # === Upstox Access Token Management Functions ===
 
 def save_upstox_access_token(token_data: dict):
@@ -550,30 +1020,29 @@ def save_upstox_access_token(token_data: dict):
     with _token_lock:
         try:
             # Ensure access tokens directory exists
-            access_tokens_dir = UPSTOX_CONFIG['ACCESS_TOKEN_DIR']
-            access_tokens_dir.mkdir(parents=True, exist_ok=True)
+            access_tokens_dir = _UPSTOX_TOK_TPL.parent
+            _ensure_dir(str(access_tokens_dir))
 
             # Add 'token_date' to token_data
-            token_date = datetime.now(IST).strftime("%Y-%m-%d")
+            token_date, saved_at = _ist_now_strings()
             token_data["token_date"] = token_date
             
             # Add system and timestamp information
-            token_data["system_id"] = SYSTEM_ID
-            token_data["saved_at"] = datetime.now(IST).isoformat()
+            token_data["system_id"] = _system_id()
+            token_data["saved_at"] = saved_at
 
             # Determine filename
-            date_str = token_date
-            token_file = UPSTOX_CONFIG['ACCESS_TOKEN_FILE_TEMPLATE'].format(date_str)
+            token_file = _UPSTOX_TOK_TPL.path(token_date)
             
             # Write token to file
-            with open(token_file, 'w') as f:
-                json.dump(token_data, f, indent=2)
+            atomic_write_bytes(token_file, json_dumps(token_data))
+            _TOKEN_CACHE.pop(_UPSTOX_TOK_TPL, None)
                 
             logging.info(f"Upstox access token saved to {token_file}")
             return True
         except Exception as e:
             logging.error(f"Failed to save Upstox access token: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Traceback:", exc_info=True)
             return False
 
 
@@ -587,28 +1056,28 @@ def load_upstox_access_token() -> Optional[str]:
         Access token string if valid, else None.
     """
     with _token_lock:
+        # Same file, same IST day: reuse the token parsed last time
+        cached_token = _cached_token(_UPSTOX_TOK_TPL)
+        if cached_token is not None:
+            return cached_token
+        
         try:
             # Ensure access tokens directory exists
-            access_tokens_dir = UPSTOX_CONFIG['ACCESS_TOKEN_DIR']
+            access_tokens_dir = _UPSTOX_TOK_TPL.parent
             if not access_tokens_dir.exists():
                 logging.warning(f"Upstox access tokens directory does not exist: {access_tokens_dir}")
                 return None
 
-            # List all token files and sort them by date descending
-            token_files = sorted(
-                [f for f in access_tokens_dir.glob("access_token_*.json")],
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
+            # Find today's token file, or the most recent one
+            latest_token_file = _latest_token_file(_UPSTOX_TOK_TPL)
             
-            if not token_files:
+            if latest_token_file is None:
                 logging.warning("No Upstox access token files found.")
                 return None
 
             # Load the latest token file
-            latest_token_file = token_files[0]
-            with open(latest_token_file, 'r') as f:
-                token_data = json.load(f)
+            token_mtime = latest_token_file.stat().st_mtime
+            token_data = json_loads(latest_token_file.read_bytes())
                 
             logging.debug(f"Loaded Upstox access token from {latest_token_file}")
 
@@ -618,10 +1087,9 @@ def load_upstox_access_token() -> Optional[str]:
                 logging.warning("token_date not found in saved Upstox token; forcing re-auth.")
                 return None
 
-            # Get today's date in IST
-            today_ist = datetime.now(IST).strftime("%Y-%m-%d")
-            if token_date_str != today_ist:
-                logging.warning(f"Upstox token date {token_date_str} != today ({today_ist}). Forcing re-auth.")
+            # Compare against today's date in IST
+            if not _token_date_is_today(token_date_str):
+                logging.warning(f"Upstox token date {token_date_str} != today ({_today_ist_str()}). Forcing re-auth.")
                 return None
 
             # If valid, return the access token
@@ -629,12 +1097,14 @@ def load_upstox_access_token() -> Optional[str]:
             if not access_token:
                 logging.error("access_token not found in Upstox token data.")
                 return None
-                
+            
+            _remember_token(_UPSTOX_TOK_TPL, latest_token_file, token_mtime, access_token)
             return access_token
             
         except Exception as e:
+            _TOKEN_CACHE.pop(_UPSTOX_TOK_TPL, None)
             logging.error(f"Error loading Upstox access token: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Traceback:", exc_info=True)
             return None
 
 
@@ -655,16 +1125,16 @@ def save_zerodha_access_token(access_token: str, request_token: str = None, api_
     with _token_lock:
         try:
             # Ensure access tokens directory exists
-            access_tokens_dir = ZERODHA_CONFIG['ACCESS_TOKEN_DIR']
-            access_tokens_dir.mkdir(parents=True, exist_ok=True)
+            access_tokens_dir = _ZERODHA_TOK_TPL.parent
+            _ensure_dir(str(access_tokens_dir))
             
             # Create token data structure similar to Upstox
-            token_date = datetime.now(IST).strftime("%Y-%m-%d")
+            token_date, saved_at = _ist_now_strings()
             token_data = {
                 "access_token": access_token,
                 "token_date": token_date,
-                "system_id": SYSTEM_ID,
-                "saved_at": datetime.now(IST).isoformat()
+                "system_id": _system_id(),
+                "saved_at": saved_at
             }
             
             if request_token:
@@ -674,22 +1144,23 @@ def save_zerodha_access_token(access_token: str, request_token: str = None, api_
                 token_data["api_key"] = api_key
             
             # Save token in JSON format using date-based filename
-            token_file = ZERODHA_CONFIG['ACCESS_TOKEN_FILE_TEMPLATE'].format(token_date)
-            with open(token_file, 'w') as f:
-                json.dump(token_data, f, indent=2)
+            token_file = _ZERODHA_TOK_TPL.path(token_date)
+            atomic_write_bytes(token_file, json_dumps(token_data))
+            _TOKEN_CACHE.pop(_ZERODHA_TOK_TPL, None)
                 
-            # Also save in legacy CSV format for backward compatibility
-            legacy_file = ZERODHA_CONFIG['KEY_CSV_LOCATION']
-            legacy_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(legacy_file, 'w') as f:
-                f.write(access_token)
-                
-            logging.info(f"Zerodha access token saved to {token_file} and {legacy_file}")
+            # Also save in legacy CSV format when backward compatibility is enabled
+            if ZERODHA_LEGACY_CSV:
+                legacy_file = _ZERODHA_KEY_CSV
+                _ensure_dir(str(legacy_file.parent))
+                atomic_write_bytes(legacy_file, access_token.encode('utf-8'))
+                logging.info(f"Zerodha access token saved to {token_file} and {legacy_file}")
+            else:
+                logging.info(f"Zerodha access token saved to {token_file}")
             return True
             
         except Exception as e:
             logging.error(f"Failed to save Zerodha access token: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Traceback:", exc_info=True)
             return False
 
 def load_zerodha_access_token() -> Optional[str]:
@@ -700,25 +1171,25 @@ def load_zerodha_access_token() -> Optional[str]:
         Access token string if valid, else None
     """
     with _token_lock:
+        # Same file, same IST day: reuse the token parsed last time
+        cached_token = _cached_token(_ZERODHA_TOK_TPL)
+        if cached_token is not None:
+            return cached_token
+        
         try:
             # Ensure access tokens directory exists
-            access_tokens_dir = ZERODHA_CONFIG['ACCESS_TOKEN_DIR']
+            access_tokens_dir = _ZERODHA_TOK_TPL.parent
             if not access_tokens_dir.exists():
                 logging.warning(f"Zerodha access tokens directory does not exist: {access_tokens_dir}")
                 return None
 
-            # List all token files and sort them by date descending
-            token_files = sorted(
-                [f for f in access_tokens_dir.glob("access_token_*.json")],
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
+            # Find today's token file, or the most recent one
+            latest_token_file = _latest_token_file(_ZERODHA_TOK_TPL)
             
-            if token_files:
+            if latest_token_file is not None:
                 # New approach: Load from JSON with date validation
-                latest_token_file = token_files[0]
-                with open(latest_token_file, 'r') as f:
-                    token_data = json.load(f)
+                token_mtime = latest_token_file.stat().st_mtime
+                token_data = json_loads(latest_token_file.read_bytes())
                 
                 # Check token date
                 token_date_str = token_data.get("token_date")
@@ -726,26 +1197,24 @@ def load_zerodha_access_token() -> Optional[str]:
                     logging.warning("token_date not found in Zerodha token; forcing re-auth.")
                     return None
                 
-                # Get today's date in IST
-                today_ist = datetime.now(IST).strftime("%Y-%m-%d")
-                
                 # Zerodha tokens expire at 6:00 AM IST the next day
-                # So if the token is from today, it's valid
-                if token_date_str != today_ist:
-                    logging.warning(f"Zerodha token from {token_date_str} != today ({today_ist}). Forcing re-auth.")
+                # So if the token is from today (IST), it's valid
+                if not _token_date_is_today(token_date_str):
+                    logging.warning(f"Zerodha token from {token_date_str} != today ({_today_ist_str()}). Forcing re-auth.")
                     return None
                 
                 access_token = token_data.get("access_token")
                 if access_token:
                     logging.debug(f"Loaded Zerodha access token from {latest_token_file}")
+                    _remember_token(_ZERODHA_TOK_TPL, latest_token_file, token_mtime, access_token)
                     return access_token
             
-            # Fallback to legacy CSV approach
-            legacy_file = ZERODHA_CONFIG['KEY_CSV_LOCATION']
-            if legacy_file.exists():
+            # Fallback to legacy CSV approach (only when the legacy mirror is enabled)
+            legacy_file = _ZERODHA_KEY_CSV
+            if ZERODHA_LEGACY_CSV and legacy_file.exists():
                 # Check file modification time
                 token_mtime = datetime.fromtimestamp(legacy_file.stat().st_mtime)
-                today_ist = datetime.now(IST).date()
+                today_ist = date.fromordinal(_today_ist_ordinal())
                 
                 # If token was modified today, assume it's valid
                 if token_mtime.date() == today_ist:
@@ -762,8 +1231,9 @@ def load_zerodha_access_token() -> Optional[str]:
             return None
             
         except Exception as e:
+            _TOKEN_CACHE.pop(_ZERODHA_TOK_TPL, None)
             logging.error(f"Error loading Zerodha access token: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Traceback:", exc_info=True)
             return None
 
 # === Live Trading Access Token Management (kept for backward compatibility) ===
@@ -781,30 +1251,29 @@ def save_access_token(token_data: dict):
     with _token_lock:
         try:
             # Ensure access tokens directory exists
-            access_tokens_dir = LIVE_TRADING_CONFIG['ACCESS_TOKEN_DIR']
-            access_tokens_dir.mkdir(parents=True, exist_ok=True)
+            access_tokens_dir = _LIVE_TOK_TPL.parent
+            _ensure_dir(str(access_tokens_dir))
 
             # Add 'token_date' to token_data
-            token_date = datetime.now(IST).strftime("%Y-%m-%d")
+            token_date, saved_at = _ist_now_strings()
             token_data["token_date"] = token_date
             
             # Add system and timestamp information
-            token_data["system_id"] = SYSTEM_ID
-            token_data["saved_at"] = datetime.now(IST).isoformat()
+            token_data["system_id"] = _system_id()
+            token_data["saved_at"] = saved_at
 
             # Determine filename
-            date_str = token_date
-            token_file = LIVE_TRADING_CONFIG['ACCESS_TOKEN_FILE_TEMPLATE'].format(date_str)
+            token_file = _LIVE_TOK_TPL.path(token_date)
             
             # Write token to file
-            with open(token_file, 'w') as f:
-                json.dump(token_data, f, indent=2)
+            atomic_write_bytes(token_file, json_dumps(token_data))
+            _TOKEN_CACHE.pop(_LIVE_TOK_TPL, None)
                 
             logging.info(f"Access token saved to {token_file}")
             return True
         except Exception as e:
             logging.error(f"Failed to save access token: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Traceback:", exc_info=True)
             return False
 
 
@@ -818,28 +1287,28 @@ def load_latest_access_token() -> Optional[str]:
         Access token string if valid, else None.
     """
     with _token_lock:
+        # Same file, same IST day: reuse the token parsed last time
+        cached_token = _cached_token(_LIVE_TOK_TPL)
+        if cached_token is not None:
+            return cached_token
+        
         try:
             # Ensure access tokens directory exists
-            access_tokens_dir = LIVE_TRADING_CONFIG['ACCESS_TOKEN_DIR']
+            access_tokens_dir = _LIVE_TOK_TPL.parent
             if not access_tokens_dir.exists():
                 logging.warning(f"Access tokens directory does not exist: {access_tokens_dir}")
                 return None
 
-            # List all token files and sort them by date descending
-            token_files = sorted(
-                [f for f in access_tokens_dir.glob("access_token_*.json")],
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )
+            # Find today's token file, or the most recent one
+            latest_token_file = _latest_token_file(_LIVE_TOK_TPL)
             
-            if not token_files:
+            if latest_token_file is None:
                 logging.warning("No access token files found.")
                 return None
 
             # Load the latest token file
-            latest_token_file = token_files[0]
-            with open(latest_token_file, 'r') as f:
-                token_data = json.load(f)
+            token_mtime = latest_token_file.stat().st_mtime
+            token_data = json_loads(latest_token_file.read_bytes())
                 
             logging.debug(f"Loaded access token from {latest_token_file}")
 
@@ -850,9 +1319,8 @@ def load_latest_access_token() -> Optional[str]:
                 return None
 
             # Get today's date in IST
-            today_ist = datetime.now(IST).strftime("%Y-%m-%d")
-            if token_date_str != today_ist:
-                logging.warning(f"Token date {token_date_str} != today ({today_ist}). Forcing re-auth.")
+            if not _token_date_is_today(token_date_str):
+                logging.warning(f"Token date {token_date_str} != today ({_today_ist_str()}). Forcing re-auth.")
                 return None
 
             # If valid, return the access token
@@ -860,20 +1328,180 @@ def load_latest_access_token() -> Optional[str]:
             if not access_token:
                 logging.error("access_token not found in token data.")
                 return None
-                
+            
+            _remember_token(_LIVE_TOK_TPL, latest_token_file, token_mtime, access_token)
             return access_token
             
         except Exception as e:
+            _TOKEN_CACHE.pop(_LIVE_TOK_TPL, None)
             logging.error(f"Error loading access token: {e}")
-            logging.debug(traceback.format_exc())
+            logging.debug("Traceback:", exc_info=True)
             return None
 
 
+# === Async Token Management ===
+# Coroutine variants for event-loop callers (live-trading WebSocket handlers).
+# The blocking lock + file I/O runs in a worker thread, so the loop is never
+# stalled; _token_lock still serializes them against the sync callers.
+
+async def asave_upstox_access_token(token_data: dict) -> bool:
+    """Async variant of save_upstox_access_token."""
+    return await asyncio.to_thread(save_upstox_access_token, token_data)
+
+
+async def aload_upstox_access_token() -> Optional[str]:
+    """Async variant of load_upstox_access_token."""
+    return await asyncio.to_thread(load_upstox_access_token)
+
+
+async def asave_zerodha_access_token(access_token: str, request_token: str = None, api_key: str = None) -> bool:
+    """Async variant of save_zerodha_access_token."""
+    return await asyncio.to_thread(save_zerodha_access_token, access_token, request_token, api_key)
+
+
+async def aload_zerodha_access_token() -> Optional[str]:
+    """Async variant of load_zerodha_access_token."""
+    return await asyncio.to_thread(load_zerodha_access_token)
+
+
+async def asave_access_token(token_data: dict) -> bool:
+    """Async variant of save_access_token."""
+    return await asyncio.to_thread(save_access_token, token_data)
+
+
+async def aload_latest_access_token() -> Optional[str]:
+    """Async variant of load_latest_access_token."""
+    return await asyncio.to_thread(load_latest_access_token)
+
+
 # === Session Creation Functions ===
 
+class _TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout to every request."""
+    
+    # Session pickles only the names in __attrs__
+    __attrs__ = requests.Session.__attrs__ + ['_default_timeout']
+    
+    def __init__(self, default_timeout: float):
+        super().__init__()
+        self._default_timeout = default_timeout
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self._default_timeout)
+        return super().request(method, url, **kwargs)
+
+
+# Keep-alive connections per host kept by each pooled session
+_SESSION_POOL_SIZE = 32
+
+# Warm sessions keyed by (access_token, provider)
+_SESSION_POOL: Dict[Tuple[str, str], requests.Session] = {}
+_SESSION_LOCK = threading.Lock()
+
+
+@cache
+def _base_headers() -> Dict[str, str]:
+    """
+    Headers shared by every session, formatted once per process.
+    
+    Built on first use rather than at import so the platform probe behind
+    the User-Agent stays lazy.
+    """
+    return {
+        'Accept': 'application/json',
+        'User-Agent': f'TradingSystem/{COMMON_CONFIG["VERSION"]} ({SYSTEM_INFO.platform})'
+    }
+
+
+def _build_session(access_token: str, timeout: float, max_retries: int) -> requests.Session:
+    """Authenticated session with the shared default headers, timeout and connection pool."""
+    session = _TimeoutSession(timeout)
+    headers = _base_headers().copy()
+    headers['Authorization'] = f'Bearer {access_token}'
+    session.headers.update(headers)
+    
+    # Retry only idempotent GETs so order placement is never resent
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_SESSION_POOL_SIZE,
+        pool_maxsize=_SESSION_POOL_SIZE,
+        max_retries=retry
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _close_adapters(adapters: Tuple[HTTPAdapter, ...]) -> None:
+    """Close connection pools (what Session.close does, without the session)"""
+    for adapter in adapters:
+        adapter.close()
+
+
+def _retire_session(session: requests.Session) -> None:
+    """Close a replaced session's connections once its last holder drops it."""
+    weakref.finalize(session, _close_adapters, tuple(session.adapters.values()))
+
+
+def _pooled_session(access_token: str, provider: str, config: Dict[str, Any]) -> requests.Session:
+    """
+    Return the warm session for a token, building it on first use.
+    
+    A new token for a provider replaces that provider's previous session,
+    so rotated tokens do not accumulate open pools. Other holders may still
+    be using the old session, so it is retired rather than closed.
+    """
+    key = (access_token, provider)
+    with _SESSION_LOCK:
+        session = _SESSION_POOL.get(key)
+        if session is None:
+            for stale_key in [k for k in _SESSION_POOL if k[1] == provider]:
+                _retire_session(_SESSION_POOL.pop(stale_key))
+            session = _build_session(access_token, config['REQUEST_TIMEOUT'], config['MAX_RETRIES'])
+            _SESSION_POOL[key] = session
+        return session
+
+
+def private_session(session: requests.Session, pool_size: int) -> requests.Session:
+    """
+    Unshared copy of a pooled session with its own connection pool size.
+    
+    Pooled sessions are shared across the process, so callers that need a
+    different pool must not remount adapters on them. The copy keeps the
+    headers, default timeout and retry policy; the caller owns and closes it.
+    """
+    copy = _TimeoutSession(getattr(session, '_default_timeout', None))
+    copy.headers.update(session.headers)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=session.get_adapter("https://").max_retries
+    )
+    copy.mount("https://", adapter)
+    return copy
+
+
+def close_sessions() -> None:
+    """Close every pooled session and its keep-alive connections."""
+    with _SESSION_LOCK:
+        for session in _SESSION_POOL.values():
+            session.close()
+        _SESSION_POOL.clear()
+
+
+atexit.register(close_sessions)
+
+
 def create_upstox_session(access_token: str) -> requests.Session:
     """
     Creates a requests.Session with the provided Upstox access token for authenticated API calls.
+    Sessions are pooled per token, so repeat calls reuse the warm keep-alive connections.
 
     Args:
         access_token: OAuth2 access token.
@@ -882,32 +1510,17 @@ def create_upstox_session(access_token: str) -> requests.Session:
         Authenticated requests.Session object.
     """
     try:
-        session = requests.Session()
-        
-        # Set default headers
-        session.headers.update({
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json',
-            'User-Agent': f'TradingSystem/{COMMON_CONFIG["VERSION"]} ({SYSTEM_INFO["platform"]})'
-        })
-        
-        # Set default timeout
-        session.request = lambda method, url, **kwargs: requests.Session.request(
-            session, method, url, 
-            timeout=kwargs.pop('timeout', UPSTOX_CONFIG['REQUEST_TIMEOUT']), 
-            **kwargs
-        )
-        
-        return session
+        return _pooled_session(access_token, 'upstox', UPSTOX_CONFIG)
     except Exception as e:
         logging.error(f"Error creating Upstox session: {e}")
-        logging.debug(traceback.format_exc())
+        logging.debug("Traceback:", exc_info=True)
         raise
 
 
 def create_session(access_token: str) -> requests.Session:
     """
     Creates a requests.Session with the provided access token for authenticated API calls.
+    Sessions are pooled per token, so repeat calls reuse the warm keep-alive connections.
     (Maintained for backward compatibility with live trading)
 
     Args:
@@ -917,31 +1530,32 @@ def create_session(access_token: str) -> requests.Session:
         Authenticated requests.Session object.
     """
     try:
-        session = requests.Session()
-        
-        # Set default headers
-        session.headers.update({
-            'Authorization': f'Bearer {access_token}',
-            'Accept': 'application/json',
-            'User-Agent': f'TradingSystem/{COMMON_CONFIG["VERSION"]} ({SYSTEM_INFO["platform"]})'
-        })
-        
-        # Set default timeout
-        session.request = lambda method, url, **kwargs: requests.Session.request(
-            session, method, url, 
-            timeout=kwargs.pop('timeout', LIVE_TRADING_CONFIG['REQUEST_TIMEOUT']), 
-            **kwargs
-        )
-        
-        return session
+        return _pooled_session(access_token, 'live', LIVE_TRADING_CONFIG)
     except Exception as e:
         logging.error(f"Error creating session: {e}")
-        logging.debug(traceback.format_exc())
+        logging.debug("Traceback:", exc_info=True)
         raise
 
 
 # === Utility functions ===
 
+# (configured DATA_PROVIDER string, its lower-cased form). Config strings are
+# reassigned rather than mutated, so an identity check detects changes.
+_default_provider = (None, None)
+
+
+def _resolve_provider(provider: Optional[str]) -> str:
+    """Lower-cased provider name, defaulting to the configured data provider."""
+    global _default_provider
+    if provider:
+        return provider.lower()
+    raw = BACKTESTER_CONFIG['DATA_PROVIDER']
+    cached = _default_provider
+    if raw is not cached[0]:
+        cached = _default_provider = (raw, raw.lower())
+    return cached[1]
+
+
 def get_provider_timeframe(standard_timeframe: str, provider: str = None) -> Optional[str]:
     """
     Convert a standard timeframe to provider-specific timeframe.
@@ -953,17 +1567,13 @@ def get_provider_timeframe(standard_timeframe: str, provider: str = None) -> Opt
     Returns:
         Provider-specific timeframe or None if not supported
     """
-    if not provider:
-        provider = BACKTESTER_CONFIG['DATA_PROVIDER']
-        
-    provider = provider.lower()
+    provider = _resolve_provider(provider)
     
-    if provider not in ['upstox', 'zerodha']:
+    if provider not in _VALID_PROVIDERS:
         logging.error(f"Unsupported provider: {provider}")
         return None
         
-    timeframe_map = BACKTESTER_CONFIG['STANDARD_TIMEFRAMES'].get(standard_timeframe, {})
-    return timeframe_map.get(provider)
+    return to_broker_tf(standard_timeframe, provider)
 
 
 def get_standard_timeframe(provider_timeframe: str, provider: str = None) -> Optional[str]:
@@ -977,20 +1587,13 @@ def get_standard_timeframe(provider_timeframe: str, provider: str = None) -> Opt
     Returns:
         Standard timeframe or None if not found
     """
-    if not provider:
-        provider = BACKTESTER_CONFIG['DATA_PROVIDER']
-        
-    provider = provider.lower()
+    provider = _resolve_provider(provider)
     
-    if provider not in ['upstox', 'zerodha']:
+    if provider not in _VALID_PROVIDERS:
         logging.error(f"Unsupported provider: {provider}")
         return None
         
-    for standard_tf, providers in BACKTESTER_CONFIG['STANDARD_TIMEFRAMES'].items():
-        if providers.get(provider) == provider_timeframe:
-            return standard_tf
-            
-    return None
+    return from_broker_tf(provider_timeframe, provider)
 
 
 def get_config_value(key: str, default: Any = None) -> Any:
@@ -1004,14 +1607,7 @@ def get_config_value(key: str, default: Any = None) -> Any:
     Returns:
         Configuration value or default
     """
-    if key in LIVE_TRADING_CONFIG:
-        return LIVE_TRADING_CONFIG[key]
-    elif key in BACKTESTER_CONFIG:
-        return BACKTESTER_CONFIG[key]
-    elif key in COMMON_CONFIG:
-        return COMMON_CONFIG[key]
-    else:
-        return default
+    return _CONFIG_CHAIN.get(key, default)
 
 
 def update_config(config_dict: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
@@ -1026,12 +1622,17 @@ def update_config(config_dict: Dict[str, Any], updates: Dict[str, Any]) -> Dict[
         Updated configuration dictionary
     """
     for key, value in updates.items():
-        if isinstance(value, dict) and key in config_dict and isinstance(config_dict[key], dict):
-            # Recursively update nested dictionaries
-            config_dict[key] = update_config(config_dict[key], value)
+        existing = config_dict.get(key)
+        if type(value) is dict and type(existing) is dict:
+            # Recurse only when both sides are nested dictionaries
+            update_config(existing, value)
         else:
             # Update simple values
             config_dict[key] = value
+    
+    # Keep the timeframe lookup indexes in step with the table they mirror
+    if config_dict is BACKTESTER_CONFIG and 'STANDARD_TIMEFRAMES' in updates:
+        _rebuild_timeframe_index(BACKTESTER_CONFIG['STANDARD_TIMEFRAMES'])
     return config_dict
 
 
@@ -1046,31 +1647,35 @@ def load_config_from_file(filepath: str) -> Dict[str, Any]:
         Configuration dictionary
     """
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return json_loads(f.read())
     except Exception as e:
         logging.error(f"Error loading configuration from {filepath}: {e}")
         return {}
 
 
-def save_config_to_file(config_dict: Dict[str, Any], filepath: str) -> bool:
+def save_config_to_file(config_dict: Dict[str, Any], filepath: str, pretty: bool = False,
+                        fsync: bool = True) -> bool:
     """
     Save configuration to a JSON file.
     
     Args:
         config_dict: Configuration dictionary
         filepath: Path to save JSON file
+        pretty: Indent the output for human editing (compact by default)
+        fsync: Flush to disk before the atomic rename (skip for hot, disposable snapshots)
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        # Ensure directory exists (created at most once per process)
+        directory = os.path.dirname(filepath)
+        if directory:
+            _ensure_dir(directory)
         
-        # Write configuration to file
-        with open(filepath, 'w') as f:
-            json.dump(config_dict, f, indent=2)
+        # Write configuration to a temp file and swap it in atomically
+        atomic_write_bytes(filepath, json_dumps(config_dict, pretty), fsync)
         return True
     except Exception as e:
         logging.error(f"Error saving configuration to {filepath}: {e}")
@@ -1092,7 +1697,7 @@ if __name__ == "__main__":
     
     # Verify directories
     logger.info("Checking directories:")
-    for key, directory in {
+    directories = {
         "BACKTESTER_DATA_POOL_DIR": BACKTESTER_CONFIG['DATA_POOL_DIR'],
         "BACKTESTER_OUTPUT_FOLDER": BACKTESTER_CONFIG['OUTPUT_FOLDER'],
         "BACKTESTER_LOG_DIR": BACKTESTER_CONFIG['LOG_DIR'],
@@ -1100,8 +1705,21 @@ if __name__ == "__main__":
         "LIVE_TRADING_LOG_DIR": LIVE_TRADING_CONFIG['LOG_DIR'],
         "UPSTOX_ACCESS_TOKEN_DIR": UPSTOX_CONFIG['ACCESS_TOKEN_DIR'],
         "ZERODHA_ACCESS_TOKEN_DIR": ZERODHA_CONFIG['ACCESS_TOKEN_DIR']
-    }.items():
-        logger.info(f"  {key}: {directory} (Exists: {directory.exists()})")
+    }
+    
+    # One directory listing per shared parent instead of a stat() per path
+    parent_listings: Dict[Path, set] = {}
+    for key, directory in directories.items():
+        directory = Path(directory)
+        names = parent_listings.get(directory.parent)
+        if names is None:
+            try:
+                with os.scandir(directory.parent) as entries:
+                    names = {entry.name for entry in entries if entry.is_dir()}
+            except OSError:
+                names = set()
+            parent_listings[directory.parent] = names
+        logger.info(f"  {key}: {directory} (Exists: {directory.name in names})")
     
     # Test timeframe mapping
     logger.info("Testing timeframe mapping:")
@@ -4,15 +4,276 @@ Centralized configuration management for backtesting framework.
 All strategy, risk, and system parameters in one place.
 """
 
-import json
+import copy
 import os
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, List, Mapping
 from pathlib import Path
+from functools import lru_cache
 import logging
 
+from .config import json_dumps, json_loads, atomic_write_bytes
+
+# Sentinel for flat-map misses (None is a legitimate config value)
+_MISS = object()
+
+
+@lru_cache(maxsize=512)
+def _split_key_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dotted key path, memoised for repeated dynamic lookups."""
+    return tuple(key_path.split('.'))
+
+
+# Built-in defaults, built once at import; instances get a deep copy
+_DEFAULT_CONFIG_TEMPLATE: Dict[str, Any] = {
+    # System Configuration
+    "system": {
+        "data_pool_dir": "data/pools",
+        "output_dir": "outputs",
+        "num_processes": 4,
+        "log_level": "INFO",
+        "enable_profiling": False
+    },
+    
+    # Data Configuration
+    "data": {
+        "providers": {
+            "default": "upstox",
+            "available": ["upstox", "zerodha"]
+        },
+        "timeframes": {
+            "default": ["1m"],
+            "available": ["1m", "5m", "15m", "30m", "1h", "day"]
+        },
+        "data_quality": {
+            "remove_outliers": True,
+            "outlier_threshold": 5,  # Standard deviations
+            "fill_gaps": True,
+            "gap_fill_method": "forward"
+        }
+    },
+    
+    # Strategy Configuration
+    "strategies": {
+        "default": ["mse"],
+        "parameters": {
+            "mse": {
+                "macd_fast": 12,
+                "macd_slow": 26,
+                "macd_signal": 9,
+                "ema_short": 9,
+                "ema_long": 20,
+                "warmup_periods": 390  # minutes
+            }
+        },
+        "optimization": {
+            "enabled": False,
+            "method": "grid_search",  # or "bayesian", "genetic"
+            "metric": "sharpe_ratio",
+            "min_trades": 30,
+            "walk_forward": {
+                "enabled": False,
+                "in_sample_ratio": 0.7,
+                "step_size": 0.1
+            }
+        }
+    },
+    
+    # Risk Management Configuration
+    "risk": {
+        "enabled": True,
+        "position_sizing": {
+            "method": "volatility_targeting",  # "kelly", "fixed_fractional", "equal_weight"
+            "max_position_size": 0.1,  # 10% of portfolio
+            "min_position_size": 0.01,  # 1% minimum
+            "volatility_target": 0.15,  # 15% annualized
+            "kelly_fraction": 0.25  # Kelly criterion cap
+        },
+        "portfolio_limits": {
+            "max_positions": 20,
+            "max_sector_exposure": 0.3,
+            "max_correlation": 0.7,
+            "max_leverage": 1.0,
+            "max_drawdown": 0.2  # 20% stop
+        },
+        "trade_controls": {
+            "stop_loss": 0.02,  # 2% stop loss
+            "take_profit": 0.05,  # 5% take profit
+            "trailing_stop": {
+                "enabled": False,
+                "trigger": 0.03,  # Activate after 3% profit
+                "distance": 0.01  # Trail by 1%
+            },
+            "time_stop": {
+                "enabled": False,
+                "max_holding_days": 30
+            }
+        },
+        "checks": {
+            "position_size": True,
+            "drawdown": True,
+            "concentration": True,
+            "liquidity": True,
+            "volatility": True,
+            "correlation": True
+        }
+    },
+    
+    # Transaction Cost Configuration
+    "costs": {
+        "enabled": True,
+        "commission": {
+            "rate": 0.0003,  # 3 basis points
+            "minimum": 20,  # Minimum commission
+            "model": "percentage"  # or "per_share", "fixed"
+        },
+        "slippage": {
+            "model": "market_impact",  # or "fixed", "volatility_based"
+            "base_spread": 0.0001,  # 1 basis point
+            "impact_coefficient": 0.1,
+            "urgency_factor": 1.0
+        },
+        "market_impact": {
+            "temporary": {
+                "coefficient": 0.1,
+                "exponent": 0.5  # Square root model
+            },
+            "permanent": {
+                "coefficient": 0.05,
+                "exponent": 0.5
+            }
+        },
+        "borrow_cost": {
+            "enabled": False,
+            "rate": 0.02  # 2% annual for shorts
+        }
+    },
+    
+    # Bias Detection Configuration
+    "bias_detection": {
+        "enabled": True,
+        "checks": {
+            "look_ahead": True,
+            "survivorship": True,
+            "data_mining": True,
+            "selection": True
+        },
+        "look_ahead": {
+            "strict_mode": True,
+            "check_indicators": True,
+            "check_signals": True
+        },
+        "survivorship": {
+            "use_point_in_time_data": False,
+            "delisted_data_path": None
+        }
+    },
+    
+    # Options Configuration
+    "options": {
+        "enabled": False,
+        "use_synthetic": True,
+        "pricing_model": "black_scholes",
+        "volatility": {
+            "model": "historical",  # or "implied", "garch"
+            "window": 20,
+            "min_volatility": 0.1,
+            "max_volatility": 2.0
+        },
+        "risk_free_rate": 0.05,
+        "dividend_yield": 0.02,
+        "american_exercise": False,
+        "greeks_calculation": True
+    },
+    
+    # Reporting Configuration
+    "reporting": {
+        "metrics": {
+            "basic": ["total_return", "win_rate", "profit_factor"],
+            "risk_adjusted": ["sharpe_ratio", "sortino_ratio", "calmar_ratio"],
+            "drawdown": ["max_drawdown", "max_drawdown_duration", "recovery_time"],
+            "risk": ["var_95", "cvar_95", "downside_deviation"],
+            "stability": ["stability_of_returns", "tail_ratio", "common_sense_ratio"]
+        },
+        "visualizations": {
+            "equity_curve": True,
+            "drawdown_chart": True,
+            "returns_distribution": True,
+            "monthly_returns": True,
+            "rolling_metrics": True,
+            "trade_analysis": True,
+            "risk_dashboard": True
+        },
+        "output_formats": ["csv", "json", "html"],
+        "save_trades": True,
+        "save_signals": True,
+        "save_metrics": True
+    },
+    
+    # Performance Configuration
+    "performance": {
+        "chunk_size": 10000,  # Rows to process at once
+        "cache_enabled": True,
+        "cache_dir": ".cache",
+        "parallel_processing": True,
+        "memory_limit": "4GB",
+        "profile_enabled": False
+    }
+}
+
+
+# === Typed Section Views ===
+
+class _SectionView:
+    """Attribute view of one config section, resolved once from the nested dict."""
+    __slots__ = ()
+    
+    def __init__(self, section: Optional[Dict[str, Any]]):
+        section = section if isinstance(section, dict) else {}
+        for name in self.__slots__:
+            setattr(self, name, section.get(name))
+    
+    def __repr__(self) -> str:
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class _PositionSizingView(_SectionView):
+    __slots__ = ('method', 'max_position_size', 'min_position_size', 'volatility_target', 'kelly_fraction')
+
+
+class _PortfolioLimitsView(_SectionView):
+    __slots__ = ('max_positions', 'max_sector_exposure', 'max_correlation', 'max_leverage', 'max_drawdown')
+
+
+class _TradeControlsView(_SectionView):
+    __slots__ = ('stop_loss', 'take_profit', 'trailing_stop', 'time_stop')
+
+
+class _CommissionView(_SectionView):
+    __slots__ = ('rate', 'minimum', 'model')
+
+
+class _SlippageView(_SectionView):
+    __slots__ = ('model', 'base_spread', 'impact_coefficient', 'urgency_factor')
+
+
+# Section path -> (BacktestConfig attribute, view class)
+_SECTION_VIEWS = {
+    'risk.position_sizing': ('risk_position_sizing', _PositionSizingView),
+    'risk.portfolio_limits': ('risk_portfolio_limits', _PortfolioLimitsView),
+    'risk.trade_controls': ('risk_trade_controls', _TradeControlsView),
+    'costs.commission': ('costs_commission', _CommissionView),
+    'costs.slippage': ('costs_slippage', _SlippageView),
+}
+
+
 class BacktestConfig:
     """
     Centralized configuration manager for all backtesting parameters.
+    
+    Frequently read sections are also exposed as attribute views for inner
+    loops, e.g. config.risk_position_sizing.max_position_size.
     """
     
     def __init__(self, config_file: Optional[str] = None):
@@ -24,225 +285,73 @@ class BacktestConfig:
         """
         self.logger = logging.getLogger("BacktestConfig")
         self.config = self._load_default_config()
+        self._flat: Dict[str, Any] = {}
         
         if config_file:
             self._load_config_file(config_file)
+        
+        self._rebuild_flat()
+        self._rebuild_views()
     
     def _load_default_config(self) -> Dict[str, Any]:
         """Load default configuration settings."""
-        return {            # System Configuration
-            "system": {
-                "data_pool_dir": "data/pools",
-                "output_dir": "outputs",
-                "num_processes": 4,
-                "log_level": "INFO",
-                "enable_profiling": False
-            },
-            
-            # Data Configuration
-            "data": {
-                "providers": {
-                    "default": "upstox",
-                    "available": ["upstox", "zerodha"]
-                },
-                "timeframes": {
-                    "default": ["1m"],
-                    "available": ["1m", "5m", "15m", "30m", "1h", "day"]
-                },
-                "data_quality": {
-                    "remove_outliers": True,
-                    "outlier_threshold": 5,  # Standard deviations
-                    "fill_gaps": True,
-                    "gap_fill_method": "forward"
-                }
-            },
-            
-            # Strategy Configuration
-            "strategies": {
-                "default": ["mse"],
-                "parameters": {
-                    "mse": {
-                        "macd_fast": 12,
-                        "macd_slow": 26,
-                        "macd_signal": 9,
-                        "ema_short": 9,
-                        "ema_long": 20,
-                        "warmup_periods": 390  # minutes
-                    }
-                },
-                "optimization": {
-                    "enabled": False,
-                    "method": "grid_search",  # or "bayesian", "genetic"
-                    "metric": "sharpe_ratio",
-                    "min_trades": 30,
-                    "walk_forward": {
-                        "enabled": False,
-                        "in_sample_ratio": 0.7,
-                        "step_size": 0.1
-                    }
-                }
-            },
-            
-            # Risk Management Configuration
-            "risk": {
-                "enabled": True,
-                "position_sizing": {
-                    "method": "volatility_targeting",  # "kelly", "fixed_fractional", "equal_weight"
-                    "max_position_size": 0.1,  # 10% of portfolio
-                    "min_position_size": 0.01,  # 1% minimum
-                    "volatility_target": 0.15,  # 15% annualized
-                    "kelly_fraction": 0.25  # Kelly criterion cap
-                },
-                "portfolio_limits": {
-                    "max_positions": 20,
-                    "max_sector_exposure": 0.3,
-                    "max_correlation": 0.7,
-                    "max_leverage": 1.0,
-                    "max_drawdown": 0.2  # 20% stop
-                },
-                "trade_controls": {
-                    "stop_loss": 0.02,  # 2% stop loss
-                    "take_profit": 0.05,  # 5% take profit
-                    "trailing_stop": {
-                        "enabled": False,
-                        "trigger": 0.03,  # Activate after 3% profit
-                        "distance": 0.01  # Trail by 1%
-                    },
-                    "time_stop": {
-                        "enabled": False,
-                        "max_holding_days": 30
-                    }
-                },
-                "checks": {
-                    "position_size": True,
-                    "drawdown": True,
-                    "concentration": True,
-                    "liquidity": True,
-                    "volatility": True,
-                    "correlation": True
-                }
-            },
-            
-            # Transaction Cost Configuration
-            "costs": {
-                "enabled": True,
-                "commission": {
-                    "rate": 0.0003,  # 3 basis points
-                    "minimum": 20,  # Minimum commission
-                    "model": "percentage"  # or "per_share", "fixed"
-                },
-                "slippage": {
-                    "model": "market_impact",  # or "fixed", "volatility_based"
-                    "base_spread": 0.0001,  # 1 basis point
-                    "impact_coefficient": 0.1,
-                    "urgency_factor": 1.0
-                },
-                "market_impact": {
-                    "temporary": {
-                        "coefficient": 0.1,
-                        "exponent": 0.5  # Square root model
-                    },
-                    "permanent": {
-                        "coefficient": 0.05,
-                        "exponent": 0.5
-                    }
-                },
-                "borrow_cost": {
-                    "enabled": False,
-                    "rate": 0.02  # 2% annual for shorts
-                }
-            },
-            
-            # Bias Detection Configuration
-            "bias_detection": {
-                "enabled": True,
-                "checks": {
-                    "look_ahead": True,
-                    "survivorship": True,
-                    "data_mining": True,
-                    "selection": True
-                },
-                "look_ahead": {
-                    "strict_mode": True,
-                    "check_indicators": True,
-                    "check_signals": True
-                },
-                "survivorship": {
-                    "use_point_in_time_data": False,
-                    "delisted_data_path": None
-                }
-            },
-            
-            # Options Configuration
-            "options": {
-                "enabled": False,
-                "use_synthetic": True,
-                "pricing_model": "black_scholes",
-                "volatility": {
-                    "model": "historical",  # or "implied", "garch"
-                    "window": 20,
-                    "min_volatility": 0.1,
-                    "max_volatility": 2.0
-                },
-                "risk_free_rate": 0.05,
-                "dividend_yield": 0.02,
-                "american_exercise": False,
-                "greeks_calculation": True
-            },
-            
-            # Reporting Configuration
-            "reporting": {
-                "metrics": {
-                    "basic": ["total_return", "win_rate", "profit_factor"],
-                    "risk_adjusted": ["sharpe_ratio", "sortino_ratio", "calmar_ratio"],
-                    "drawdown": ["max_drawdown", "max_drawdown_duration", "recovery_time"],
-                    "risk": ["var_95", "cvar_95", "downside_deviation"],
-                    "stability": ["stability_of_returns", "tail_ratio", "common_sense_ratio"]
-                },
-                "visualizations": {
-                    "equity_curve": True,
-                    "drawdown_chart": True,
-                    "returns_distribution": True,
-                    "monthly_returns": True,
-                    "rolling_metrics": True,
-                    "trade_analysis": True,
-                    "risk_dashboard": True
-                },
-                "output_formats": ["csv", "json", "html"],
-                "save_trades": True,
-                "save_signals": True,
-                "save_metrics": True
-            },
-            
-            # Performance Configuration
-            "performance": {
-                "chunk_size": 10000,  # Rows to process at once
-                "cache_enabled": True,
-                "cache_dir": ".cache",
-                "parallel_processing": True,
-                "memory_limit": "4GB",
-                "profile_enabled": False
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG_TEMPLATE)
+    
+    @staticmethod
+    def from_template_readonly() -> Mapping[str, Any]:
+        """
+        Shared read-only view of the built-in defaults, without the deep copy.
+        
+        Nested sections are the template's own dicts and must not be mutated.
+        """
+        return MappingProxyType(_DEFAULT_CONFIG_TEMPLATE)
     
     def _load_config_file(self, config_file: str) -> None:
         """Load configuration from JSON file."""
         try:
-            with open(config_file, 'r') as f:
-                user_config = json.load(f)
-                self._merge_configs(self.config, user_config)
-                self.logger.info(f"Loaded configuration from {config_file}")
+            with open(config_file, 'rb') as f:
+                user_config = json_loads(f.read())
+            self._merge_configs(self.config, user_config)
+            self.logger.info(f"Loaded configuration from {config_file}")
         except Exception as e:
             self.logger.error(f"Failed to load config file {config_file}: {e}")
             raise
     
-    def _merge_configs(self, base: Dict, update: Dict) -> None:
-        """Recursively merge configuration dictionaries."""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._merge_configs(base[key], value)
+    def _flatten(self, prefix: str, node: Dict) -> None:
+        """Record the dotted path of every leaf value under a nested section in the flat map."""
+        for key, value in node.items():
+            if not isinstance(key, str) or '.' in key:
+                continue  # Unreachable through dotted paths
+            path = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, dict):
+                self._flatten(path, value)
             else:
-                base[key] = value
+                self._flat[path] = value
+    
+    def _rebuild_flat(self) -> None:
+        """Recompute the flat dotted-path view of the whole configuration."""
+        self._flat.clear()
+        self._flatten('', self.config)
+    
+    def _rebuild_views(self, key_path: Optional[str] = None) -> None:
+        """Rebuild the section views, or only those a changed key path touches."""
+        for section_path, (attr, view_cls) in _SECTION_VIEWS.items():
+            if (key_path is None or section_path == key_path
+                    or section_path.startswith(key_path + '.')
+                    or key_path.startswith(section_path + '.')):
+                setattr(self, attr, view_cls(self.get(section_path)))
+    
+    def _merge_configs(self, base: Dict, update: Dict) -> None:
+        """Merge configuration dictionaries, walking nested sections with an explicit stack."""
+        stack = [(base, update)]
+        while stack:
+            base_node, update_node = stack.pop()
+            for key, value in update_node.items():
+                existing = base_node.get(key)
+                if type(value) is dict and type(existing) is dict:
+                    stack.append((existing, value))
+                else:
+                    base_node[key] = value
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -251,8 +360,16 @@ class BacktestConfig:
         Examples:
             config.get('risk.position_sizing.max_position_size')
             config.get('strategies.parameters.mse.macd_fast')
+        
+        Leaf values are served from a flat path map kept in step by set().
+        Section paths go through the nested walk and come back as deep
+        copies, so editing a returned dict never bypasses the map; use set().
         """
-        keys = key_path.split('.')
+        value = self._flat.get(key_path, _MISS)
+        if value is not _MISS:
+            return value
+        
+        keys = _split_key_path(key_path)
         value = self.config
         
         for key in keys:
@@ -261,11 +378,11 @@ class BacktestConfig:
             else:
                 return default
         
-        return value
+        return copy.deepcopy(value) if isinstance(value, dict) else value
     
     def set(self, key_path: str, value: Any) -> None:
         """Set configuration value using dot notation."""
-        keys = key_path.split('.')
+        keys = _split_key_path(key_path)
         config = self.config
         
         for key in keys[:-1]:
@@ -273,14 +390,26 @@ class BacktestConfig:
                 config[key] = {}
             config = config[key]
         
+        if isinstance(value, dict):
+            value = copy.deepcopy(value)  # The caller's dict must not alias cached leaves
         config[keys[-1]] = value
+        
+        # Replace the flat entries for this path and anything beneath it
+        subtree_prefix = key_path + '.'
+        for stale in [path for path in self._flat if path.startswith(subtree_prefix)]:
+            del self._flat[stale]
+        self._flat.pop(key_path, None)
+        if isinstance(value, dict):
+            self._flatten(key_path, value)
+        else:
+            self._flat[key_path] = value
+        self._rebuild_views(key_path)
     
-    def save(self, file_path: str) -> None:
-        """Save current configuration to JSON file."""
+    def save(self, file_path: str, pretty: bool = False, fsync: bool = True) -> None:
+        """Save current configuration to JSON file (compact unless pretty=True), atomically."""
         try:
-            with open(file_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
-                self.logger.info(f"Saved configuration to {file_path}")
+            atomic_write_bytes(file_path, json_dumps(self.config, pretty), fsync)
+            self.logger.info(f"Saved configuration to {file_path}")
         except Exception as e:
             self.logger.error(f"Failed to save config: {e}")
             raise
@@ -362,8 +491,8 @@ class BacktestConfig:
             }
         }
         
-        with open(file_path, 'w') as f:
-            json.dump(template, f, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(json_dumps(template))
         
         self.logger.info(f"Created configuration template at {file_path}")
 
@@ -10,34 +10,126 @@ This module provides a comprehensive configuration management system that:
 - Provides templates for different trading styles
 """
 
-import yaml
-import logging
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, List, Optional, Union
+import copy
+import os
+import threading
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import lru_cache
+from typing import Callable, ClassVar, Dict, Any, FrozenSet, Mapping, Optional, Tuple
 from pathlib import Path
-from datetime import datetime, timedelta
-import json
+from types import MappingProxyType
+from datetime import datetime
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+@lru_cache(maxsize=None)
+def _yaml_backend() -> tuple:
+    """
+    Import PyYAML on first use: (yaml, loader, dumper, config dumper).
+    
+    Uses the libyaml-backed (C) loader/dumper when PyYAML was built with it,
+    pure Python otherwise; importers that never touch YAML skip the import.
+    """
+    import yaml
+    
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    
+    class _ConfigDumper(dumper):
+        """Shared safe dumper that also writes read-only mappings as plain YAML maps."""
+    
+    _ConfigDumper.add_representer(MappingProxyType, _ConfigDumper.represent_dict)
+    return yaml, loader, dumper, _ConfigDumper
+
+def __getattr__(name: str) -> Any:
+    """Resolve YAML_LOADER / YAML_DUMPER lazily (PEP 562)."""
+    if name == "YAML_LOADER":
+        return _yaml_backend()[1]
+    if name == "YAML_DUMPER":
+        return _yaml_backend()[2]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _load_yaml(stream) -> Any:
+    """Parse YAML with the shared safe loader."""
+    yaml, loader, _, _ = _yaml_backend()
+    return yaml.load(stream, Loader=loader)
+
+def _dump_yaml(data: Any, stream=None) -> Optional[str]:
+    """Dump YAML with the shared dumper and options."""
+    yaml, _, _, config_dumper = _yaml_backend()
+    return yaml.dump(data, stream, Dumper=config_dumper, default_flow_style=False, indent=2)
+
+# Parsed from_yaml results keyed by (absolute path, mtime_ns, size):
+# value is (config, whether the file pinned its own run_id)
+_YAML_CACHE: Dict[tuple, tuple] = {}
+
+# Directory sets already created by setup_paths() in this process
+_PATHS_READY: set = set()
+_PATHS_LOCK = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple:
+    """Dataclass field names, resolved once per class."""
+    return tuple(f.name for f in fields(cls))
+
+def _config_to_dict(obj: Any) -> Dict[str, Any]:
+    """
+    Walk nested config dataclasses into plain dicts.
+    
+    Unlike asdict() this does not deep-copy every leaf: dict and list values get
+    a shallow copy, anything nested inside them is shared with the config.
+    Tuples (shared defaults) come out as lists, as a YAML round trip would give.
+    """
+    result = {}
+    for name in _field_names(type(obj)):
+        value = getattr(obj, name)
+        if is_dataclass(value):
+            value = _config_to_dict(value)
+        elif type(value) is dict:
+            value = value.copy()
+        elif type(value) is list or type(value) is tuple:
+            value = list(value)
+        result[name] = value
+    return result
+
+# DataConfig defaults: the column tuple is shared by every instance, the folder
+# map is copied per instance (C-level dict.copy) since it must stay picklable
+_DEFAULT_TIMEFRAME_FOLDERS = {
+    "1minute": "1minute",
+    "5minute": "5minute", 
+    "15minute": "15minute",
+    "1hour": "1hour",
+    "1day": "1day"
+}
+_DEFAULT_REQUIRED_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+class _ConfigSection:
+    """Base of the section dataclasses nested in BacktestConfig."""
+    
+    # Valid field names, filled in per section once BacktestConfig is defined
+    _FIELDS: ClassVar[FrozenSet[str]] = frozenset()
 
 @dataclass
-class DataConfig:
+class DataConfig(_ConfigSection):
     """Configuration for data loading and processing."""
     data_pool_dir: str = "data/pools"
-    timeframe_folders: Dict[str, str] = field(default_factory=lambda: {
-        "1minute": "1minute",
-        "5minute": "5minute", 
-        "15minute": "15minute",
-        "1hour": "1hour",
-        "1day": "1day"
-    })
+    timeframe_folders: Dict[str, str] = field(default_factory=_DEFAULT_TIMEFRAME_FOLDERS.copy)
     default_timeframe: str = "1minute"
-    required_columns: List[str] = field(default_factory=lambda: [
-        "timestamp", "open", "high", "low", "close", "volume"
-    ])
+    required_columns: Tuple[str, ...] = _DEFAULT_REQUIRED_COLUMNS
     date_format: str = "%Y-%m-%d"
     timezone: str = "Asia/Kolkata"
     
+    def __post_init__(self):
+        # Lists from to_dict()/YAML compare unequal to the default tuple
+        self.required_columns = tuple(self.required_columns)
+    
 @dataclass
-class StrategyConfig:
+class StrategyConfig(_ConfigSection):
     """Configuration for strategy parameters."""
     name: str = "mse"
     parameters: Dict[str, Any] = field(default_factory=dict)
@@ -47,7 +139,7 @@ class StrategyConfig:
     initial_capital: float = 1000000.0  # Default 1M capital
     
 @dataclass
-class RiskConfig:
+class RiskConfig(_ConfigSection):
     """Configuration for risk management."""
     enabled: bool = True            # Enable/disable risk management completely
     bypass_mode: bool = False       # Bypass all risk checks (for debugging/analysis)
@@ -63,7 +155,7 @@ class RiskConfig:
     enable_timeout: bool = True
     
 @dataclass
-class TransactionConfig:
+class TransactionConfig(_ConfigSection):
     """Configuration for transaction costs."""
     enabled: bool = True  # Enable transaction cost modeling
     model_type: str = "advanced"  # basic, advanced, broker_specific
@@ -74,7 +166,7 @@ class TransactionConfig:
     enable_market_impact: bool = True
     
 @dataclass
-class OptionsConfig:
+class OptionsConfig(_ConfigSection):
     """Configuration for options trading."""
     enabled: bool = False
     synthetic_enabled: bool = True
@@ -86,7 +178,7 @@ class OptionsConfig:
     greeks_calculation: bool = True
     
 @dataclass
-class ValidationConfig:
+class ValidationConfig(_ConfigSection):
     """Configuration for data validation and bias detection."""
     enabled: bool = True
     lookahead_bias_check: bool = True
@@ -98,7 +190,7 @@ class ValidationConfig:
     strict_mode: bool = False  # Enable strict validation mode
     
 @dataclass
-class OptimizationConfig:
+class OptimizationConfig(_ConfigSection):
     """Configuration for strategy optimization."""
     enabled: bool = False
     method: str = "grid_search"  # grid_search, random_search, bayesian
@@ -108,7 +200,7 @@ class OptimizationConfig:
     random_state: int = 42
     
 @dataclass
-class OutputConfig:
+class OutputConfig(_ConfigSection):
     """Configuration for output generation."""
     save_trades: bool = True
     save_metrics: bool = True
@@ -124,7 +216,7 @@ class OutputConfig:
     visualization_trade_source: str = "auto"  # "strategy_trades", "risk_approved_trades", "auto"
     
 @dataclass
-class ExecutionConfig:
+class ExecutionConfig(_ConfigSection):
     """Configuration for execution and parallel processing."""
     parallel_processing: bool = True
     max_workers: int = 4
@@ -133,7 +225,7 @@ class ExecutionConfig:
     timeout_seconds: int = 3600  # 1 hour default timeout
 
 @dataclass
-class LoggingConfig:
+class LoggingConfig(_ConfigSection):
     """Configuration for logging."""
     level: str = "INFO"
     format: str = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
@@ -143,6 +235,20 @@ class LoggingConfig:
     max_file_size: str = "10MB"
     backup_count: int = 5
     
+# (check, message) pairs run by BacktestConfig.validate(), in reporting order
+_VALIDATORS: Tuple[Tuple[Callable[[Any], bool], str], ...] = (
+    # Risk parameters
+    (lambda c: 0 <= c.risk.max_position_size <= 1, "max_position_size must be between 0 and 1"),
+    (lambda c: 0 <= c.risk.max_daily_loss <= 1, "max_daily_loss must be between 0 and 1"),
+    (lambda c: 0 <= c.risk.max_drawdown <= 1, "max_drawdown must be between 0 and 1"),
+    # Transaction parameters
+    (lambda c: not c.transaction.brokerage_rate < 0, "brokerage_rate must be non-negative"),
+    (lambda c: not c.transaction.slippage_rate < 0, "slippage_rate must be non-negative"),
+    # Validation parameters
+    (lambda c: not c.validation.min_data_points <= 0, "min_data_points must be positive"),
+    (lambda c: 0 <= c.validation.max_missing_data_pct <= 1, "max_missing_data_pct must be between 0 and 1"),
+)
+
 @dataclass
 class BacktestConfig:
     """Unified configuration for the entire backtesting system."""
@@ -180,60 +286,64 @@ class BacktestConfig:
         return self.execution.cache_dir
     
     def __post_init__(self):
-        """Post-initialization validation and setup."""
-        self.validate()
-        self.setup_paths()
+        """
+        Post-initialization validation.
         
-    def validate(self):
-        """Validate configuration parameters."""
-        errors = []
+        Defaults and templates are checked statically by tools/validate_config.py,
+        so ALGOBOT_SKIP_VALIDATE=1 can skip the runtime checks. Directories are
+        not created here; the runner calls setup_paths() once per run.
+        """
+        if os.environ.get("ALGOBOT_SKIP_VALIDATE") != "1":
+            self.validate()
         
-        # Validate risk parameters
-        if not 0 <= self.risk.max_position_size <= 1:
-            errors.append("max_position_size must be between 0 and 1")
-        if not 0 <= self.risk.max_daily_loss <= 1:
-            errors.append("max_daily_loss must be between 0 and 1")
-        if not 0 <= self.risk.max_drawdown <= 1:
-            errors.append("max_drawdown must be between 0 and 1")
-            
-        # Validate transaction parameters
-        if self.transaction.brokerage_rate < 0:
-            errors.append("brokerage_rate must be non-negative")
-        if self.transaction.slippage_rate < 0:
-            errors.append("slippage_rate must be non-negative")
-            
-        # Validate validation parameters
-        if self.validation.min_data_points <= 0:
-            errors.append("min_data_points must be positive")
-        if not 0 <= self.validation.max_missing_data_pct <= 1:
-            errors.append("max_missing_data_pct must be between 0 and 1")
+    def validate(self, fast_fail: bool = False):
+        """
+        Validate configuration parameters.
+        
+        Args:
+            fast_fail: Stop at the first failing check instead of collecting all
+        """
+        errors = []
+        for check, message in _VALIDATORS:
+            if not check(self):
+                errors.append(message)
+                if fast_fail:
+                    break
             
         if errors:
             raise ValueError(f"Configuration validation failed: {'; '.join(errors)}")
             
     def setup_paths(self):
-        """Set up required directory paths."""
-        base_path = Path(self.base_dir)
-        
+        """Set up required directory paths (once per distinct set of directories)."""
         # Ensure all required directories exist
-        required_dirs = [
+        required_dirs = (
+            self.base_dir,
             self.data.data_pool_dir,
             self.output.output_dir,
             self.logging.log_dir,
             self.execution.cache_dir
-        ]
+        )
+        if required_dirs in _PATHS_READY:
+            return
         
-        for dir_path in required_dirs:
-            full_path = base_path / dir_path
-            full_path.mkdir(parents=True, exist_ok=True)
+        with _PATHS_LOCK:
+            if required_dirs in _PATHS_READY:
+                return
+            for dir_path in required_dirs[1:]:
+                os.makedirs(os.path.join(self.base_dir, dir_path), exist_ok=True)
+            _PATHS_READY.add(required_dirs)
             
+    def clone(self) -> 'BacktestConfig':
+        """Independent deep copy, e.g. to customise one of the cached templates."""
+        return copy.deepcopy(self)
+        
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
-        return asdict(self)
+        return _config_to_dict(self)
         
     def to_yaml(self, file_path: Optional[str] = None) -> str:
         """Export configuration to YAML format."""
-        yaml_content = yaml.dump(self.to_dict(), default_flow_style=False, indent=2)
+        yaml_content = _dump_yaml(self.to_dict())
         
         if file_path:
             with open(file_path, 'w') as f:
@@ -241,48 +351,109 @@ class BacktestConfig:
                 
         return yaml_content
         
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize configuration to indented JSON bytes.
+        
+        Intended for logs and run manifests; use to_yaml() for configs meant to
+        be edited and loaded back.
+        """
+        if ORJSON_AVAILABLE:
+            # orjson serializes the nested dataclasses natively in one C pass
+            return orjson.dumps(self, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        import json
+        return json.dumps(self.to_dict(), indent=2).encode('utf-8')
+        
     @classmethod
     def from_yaml(cls, file_path: str) -> 'BacktestConfig':
-        """Load configuration from YAML file."""
+        """
+        Load configuration from YAML file.
+        
+        Results are cached by path, mtime and size; an unchanged file returns a
+        deep copy of the cached config without re-parsing or re-validating.
+        """
+        st = os.stat(file_path)
+        key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+        cached = _YAML_CACHE.get(key)
+        if cached is not None:
+            config, pinned_run_id = cached
+            config = copy.deepcopy(config)
+            if not pinned_run_id:
+                # Each load without an explicit run_id is a new run
+                config.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+            return config
+        
         with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = _load_yaml(f)
             
-        return cls.from_dict(data)
+        config = cls.from_dict(data)
+        _YAML_CACHE[key] = (copy.deepcopy(config), 'run_id' in data)
+        return config
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'BacktestConfig':
         """Create configuration from dictionary."""
-        # Create nested configurations
-        config_kwargs = {}
-        
-        if 'data' in data:
-            config_kwargs['data'] = DataConfig(**data['data'])
-        if 'strategy' in data:
-            config_kwargs['strategy'] = StrategyConfig(**data['strategy'])
-        if 'risk' in data:
-            config_kwargs['risk'] = RiskConfig(**data['risk'])
-        if 'transaction' in data:
-            config_kwargs['transaction'] = TransactionConfig(**data['transaction'])
-        if 'options' in data:
-            config_kwargs['options'] = OptionsConfig(**data['options'])
-        if 'validation' in data:
-            config_kwargs['validation'] = ValidationConfig(**data['validation'])
-        if 'optimization' in data:
-            config_kwargs['optimization'] = OptimizationConfig(**data['optimization'])
-        if 'execution' in data:
-            config_kwargs['execution'] = ExecutionConfig(**data['execution'])
-        if 'output' in data:
-            config_kwargs['output'] = OutputConfig(**data['output'])
-        if 'logging' in data:
-            config_kwargs['logging'] = LoggingConfig(**data['logging'])
-            
-        # Add any remaining top-level keys
-        for key, value in data.items():
-            if key not in config_kwargs:
-                config_kwargs[key] = value
+        # Nested sections become their dataclass; other top-level keys pass through
+        config_kwargs = {
+            key: _SUB_CONFIGS[key](**value) if key in _SUB_CONFIGS else value
+            for key, value in data.items()
+        }
                 
         return cls(**config_kwargs)
 
+# Section name -> dataclass for the nested BacktestConfig components
+_SUB_CONFIGS: Dict[str, type] = {
+    f.name: f.default_factory for f in fields(BacktestConfig) if is_dataclass(f.default_factory)
+}
+
+# Valid field names per section, for the ConfigBuilder setters
+for _section_cls in _SUB_CONFIGS.values():
+    _section_cls._FIELDS = frozenset(_field_names(_section_cls))
+
+def _apply_fields(section: Any, values: Dict[str, Any]):
+    """Set known fields on a config section, ignoring unknown keys."""
+    valid = type(section)._FIELDS
+    for key, value in values.items():
+        if key in valid:
+            setattr(section, key, value)
+
+class LazyConfig:
+    """
+    Read-only view of a YAML config that builds section dataclasses on demand.
+    
+    The file is parsed once into plain data; ``cfg.risk`` constructs only the
+    RiskConfig on first access and caches it. No cross-section validation is
+    run; call materialize() for a full, validated BacktestConfig.
+    """
+    
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data or {}
+        
+    @classmethod
+    def from_yaml(cls, file_path: str) -> 'LazyConfig':
+        """Parse a YAML config without building any section objects."""
+        with open(file_path, 'r') as f:
+            return cls(_load_yaml(f))
+            
+    def __getattr__(self, name: str) -> Any:
+        # Only reached on a miss; built sections are stored on the instance
+        data = self.__dict__.get('_data')
+        if data is None:
+            raise AttributeError(name)
+        section_cls = _SUB_CONFIGS.get(name)
+        if section_cls is not None:
+            value = section_cls(**data.get(name, {}))
+        elif name in data:
+            value = data[name]
+        else:
+            raise AttributeError(f"'LazyConfig' has no attribute '{name}'")
+        self.__dict__[name] = value
+        return value
+        
+    def materialize(self) -> BacktestConfig:
+        """Build the complete BacktestConfig."""
+        return BacktestConfig.from_dict(self._data)
+
 class ConfigBuilder:
     """Builder pattern for creating BacktestConfig instances."""
     
@@ -291,23 +462,17 @@ class ConfigBuilder:
         
     def with_data_config(self, **kwargs) -> 'ConfigBuilder':
         """Configure data settings."""
-        for key, value in kwargs.items():
-            if hasattr(self.config.data, key):
-                setattr(self.config.data, key, value)
+        _apply_fields(self.config.data, kwargs)
         return self
         
     def with_strategy_config(self, **kwargs) -> 'ConfigBuilder':
         """Configure strategy settings."""
-        for key, value in kwargs.items():
-            if hasattr(self.config.strategy, key):
-                setattr(self.config.strategy, key, value)
+        _apply_fields(self.config.strategy, kwargs)
         return self
     
     def with_risk_config(self, **kwargs) -> 'ConfigBuilder':
         """Configure risk settings."""
-        for key, value in kwargs.items():
-            if hasattr(self.config.risk, key):
-                setattr(self.config.risk, key, value)
+        _apply_fields(self.config.risk, kwargs)
         return self
     
     def with_conservative_risk(self) -> 'ConfigBuilder':
@@ -339,23 +504,22 @@ class ConfigBuilder:
     def with_options_enabled(self, **kwargs) -> 'ConfigBuilder':
         """Enable options trading with configuration."""
         self.config.options.enabled = True
-        for key, value in kwargs.items():
-            if hasattr(self.config.options, key):
-                setattr(self.config.options, key, value)
+        _apply_fields(self.config.options, kwargs)
         return self
     
     def with_validation_config(self, **kwargs) -> 'ConfigBuilder':
         """Configure validation settings."""
-        for key, value in kwargs.items():
-            if hasattr(self.config.validation, key):
-                setattr(self.config.validation, key, value)
+        _apply_fields(self.config.validation, kwargs)
         return self
         
     def build(self) -> BacktestConfig:
         """Build and return the final configuration."""
         return self.config
 
-# Predefined configuration templates
+# Predefined configuration templates.
+# Each is built once and cached: treat the result as a read-only prototype and
+# call .clone() before modifying it.
+@lru_cache(maxsize=1)
 def get_minimal_config() -> BacktestConfig:
     """Get a minimal risk configuration for learning and testing."""
     return (ConfigBuilder()
@@ -370,22 +534,25 @@ def get_minimal_config() -> BacktestConfig:
             .with_validation_config(enabled=True, strict_mode=True)
             .build())
 
+@lru_cache(maxsize=1)
 def get_conservative_config() -> BacktestConfig:
     """Get a conservative trading configuration."""
     return ConfigBuilder().with_conservative_risk().build()
 
+@lru_cache(maxsize=1)
 def get_aggressive_config() -> BacktestConfig:
     """Get an aggressive trading configuration."""
     return ConfigBuilder().with_aggressive_risk().build()
 
+@lru_cache(maxsize=1)
 def get_options_config() -> BacktestConfig:
     """Get a configuration with options trading enabled."""
     return (ConfigBuilder()
             .with_options_enabled(synthetic_enabled=True, greeks_calculation=True)
             .build())
 
-# Standard calculation definitions for market consistency
-MARKET_STANDARD_CALCULATIONS = {
+# Standard calculation definitions for market consistency (read-only)
+_MARKET_STANDARD_CALCULATIONS = {
     "MACD": {
         "fast_period": 12,
         "slow_period": 26,
@@ -422,9 +589,17 @@ MARKET_STANDARD_CALCULATIONS = {
     }
 }
 
-def get_calculation_standard(indicator: str) -> Dict[str, Any]:
+MARKET_STANDARD_CALCULATIONS = MappingProxyType({
+    name: MappingProxyType(params) for name, params in _MARKET_STANDARD_CALCULATIONS.items()
+})
+
+# Upper-cased indicator name -> parameters, so lookups are case-insensitive
+_CALCULATIONS_BY_UPPER = {name.upper(): params for name, params in MARKET_STANDARD_CALCULATIONS.items()}
+_NO_CALCULATION = MappingProxyType({})
+
+def get_calculation_standard(indicator: str) -> Mapping[str, Any]:
     """Get market standard calculation parameters for an indicator."""
-    return MARKET_STANDARD_CALCULATIONS.get(indicator.upper(), {})
+    return _CALCULATIONS_BY_UPPER.get(indicator.upper(), _NO_CALCULATION)
 
 # Example usage and testing
 if __name__ == "__main__":
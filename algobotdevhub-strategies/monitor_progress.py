@@ -4,34 +4,170 @@ Data Collection Progress Monitor
 Real-time monitoring of the comprehensive data collection process
 """
 
-import json
+import sqlite3
+import threading
 import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 import os
 
+# Optional file-change notification backends (Linux inotify, cross-platform watchdog)
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+def load_progress(progress_db: Path) -> dict:
+    """Read ticker status from the collector's WAL-mode progress database"""
+    # Read-only connection; WAL lets this run alongside the collector's writes
+    conn = sqlite3.connect(f"file:{progress_db.as_posix()}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            "SELECT ticker, status, error FROM progress ORDER BY processed_at"
+        ).fetchall()
+    finally:
+        conn.close()
+    
+    return {ticker: {'status': status, 'error': error} for ticker, status, error in rows}
+
+def progress_exists(progress_db: Path) -> bool:
+    """Check whether the collector has created its progress database yet"""
+    return progress_db.exists()
+
+def progress_signature(progress_db: Path) -> tuple:
+    """
+    Change marker for the database and its WAL file (committed rows land in the WAL first).
+    The first entry is None while the database does not exist yet.
+    """
+    db_path = os.fspath(progress_db)
+    signature = []
+    for path in (db_path, db_path + "-wal"):
+        try:
+            st = os.stat(path)
+            signature.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+def summarize_progress(progress: dict, recent_count: int = 5) -> tuple:
+    """Count successes and failures and collect the latest successes in one pass"""
+    completed = failed = 0
+    recent = deque(maxlen=recent_count)
+    for ticker, info in progress.items():
+        status = info.get('status')
+        if status == 'success':
+            completed += 1
+            recent.append(ticker)
+        elif status == 'failed':
+            failed += 1
+    return completed, failed, list(recent)
+
+class ProgressWatcher:
+    """Wait for writes to the progress database, falling back to a plain sleep"""
+    
+    def __init__(self, progress_db: Path):
+        self.watch_dir = progress_db.parent
+        self.names = {progress_db.name, progress_db.name + "-wal"}
+        self._inotify = None
+        self._observer = None
+        self._changed = threading.Event()
+        self._started = False
+    
+    def _start(self):
+        """Attach a watcher once the output directory exists"""
+        if not self.watch_dir.is_dir():
+            return
+        self._started = True
+        try:
+            if INOTIFY_AVAILABLE:
+                self._inotify = INotify()
+                mask = (inotify_flags.MODIFY | inotify_flags.CLOSE_WRITE
+                        | inotify_flags.CREATE | inotify_flags.MOVED_TO)
+                self._inotify.add_watch(str(self.watch_dir), mask)
+            elif WATCHDOG_AVAILABLE:
+                watcher = self
+                
+                class _Handler(FileSystemEventHandler):
+                    def on_any_event(self, event):
+                        if Path(event.src_path).name in watcher.names:
+                            watcher._changed.set()
+                
+                self._observer = Observer()
+                self._observer.schedule(_Handler(), str(self.watch_dir))
+                self._observer.start()
+        except OSError:
+            # e.g. inotify watch limit reached; keep polling
+            self.close()
+    
+    def wait(self, timeout: float):
+        """Block until the database changes or timeout seconds pass"""
+        if not self._started:
+            self._start()
+        
+        if self._inotify is not None:
+            deadline = time.monotonic() + timeout
+            remaining = timeout
+            while remaining > 0:
+                events = self._inotify.read(timeout=int(remaining * 1000))
+                if any(event.name in self.names for event in events):
+                    return
+                remaining = deadline - time.monotonic()
+        elif self._observer is not None:
+            self._changed.wait(timeout)
+            self._changed.clear()
+        else:
+            time.sleep(timeout)
+    
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
 def monitor_progress():
     """Monitor the progress of data collection"""
     output_dir = Path("historical_data")
-    progress_file = output_dir / "progress.json"
+    progress_file = output_dir / "progress.db"
+    
+    if os.name == 'nt':
+        os.system('')  # enables ANSI escape handling in the Windows console
     
     print("📊 DATA COLLECTION PROGRESS MONITOR")
     print("=" * 50)
     print("Press Ctrl+C to stop monitoring\n")
     
     last_completed = 0
+    last_signature = None
+    completed = failed = 0
+    recent_completed = []
+    progress = None
     start_time = datetime.now()
+    watcher = ProgressWatcher(progress_file)
     
     try:
         while True:
-            # Check if progress file exists
-            if progress_file.exists():
+            # One stat per file both checks existence and detects changes
+            signature = progress_signature(progress_file)
+            if signature[0] is not None:
                 try:
-                    with open(progress_file, 'r') as f:
-                        progress = json.load(f)
+                    # Only re-query when the collector has written since the last tick
+                    if signature != last_signature:
+                        progress = load_progress(progress_file)
+                        completed, failed, recent_completed = summarize_progress(progress)
+                        last_signature = signature
                     
-                    completed = sum(1 for v in progress.values() if v.get('status') == 'success')
-                    failed = sum(1 for v in progress.values() if v.get('status') == 'failed')
                     total_processed = completed + failed
                     
                     # Calculate statistics
@@ -57,8 +193,8 @@ def monitor_progress():
                         eta_minutes = 0
                         eta_hours = 0
                     
-                    # Clear screen and display progress
-                    os.system('cls' if os.name == 'nt' else 'clear')
+                    # Clear screen and display progress (ANSI, no shell subprocess per tick)
+                    print("\x1b[2J\x1b[H", end="")
                     
                     print("📊 DATA COLLECTION PROGRESS MONITOR")
                     print("=" * 50)
@@ -80,51 +216,44 @@ def monitor_progress():
                     
                     # Show recent activity
                     if completed > last_completed:
-                        recent_completed = [k for k, v in progress.items() 
-                                          if v.get('status') == 'success'][-5:]
                         print(f"\n🔄 Recent completions: {', '.join(recent_completed)}")
                     
                     last_completed = completed
                     
-                except json.JSONDecodeError:
-                    print("⚠️ Progress file is being updated...")
+                except sqlite3.OperationalError:
+                    print("⚠️ Progress database is being updated...")
                 except Exception as e:
                     print(f"❌ Error reading progress: {e}")
                     
             else:
                 print("⏳ Waiting for progress file to be created...")
             
-            # Check for completion
-            if progress_file.exists():
-                try:
-                    with open(progress_file, 'r') as f:
-                        progress = json.load(f)
-                    if len(progress) >= 304:
-                        print("\n🎉 DATA COLLECTION COMPLETED!")
-                        break
-                except:
-                    pass
+            # Check for completion against the snapshot read above
+            if progress is not None and len(progress) >= 304:
+                print("\n🎉 DATA COLLECTION COMPLETED!")
+                break
             
-            time.sleep(5)  # Update every 5 seconds
+            # Redraw as soon as the collector writes, at least every 5 seconds
+            watcher.wait(5)
             
     except KeyboardInterrupt:
         print("\n\n⚠️ Monitoring stopped by user")
+    finally:
+        watcher.close()
 
 def show_current_status():
     """Show a quick status snapshot"""
     output_dir = Path("historical_data")
-    progress_file = output_dir / "progress.json"
+    progress_file = output_dir / "progress.db"
     
-    if not progress_file.exists():
+    if not progress_exists(progress_file):
         print("❌ No progress file found. Data collection may not have started.")
         return
     
     try:
-        with open(progress_file, 'r') as f:
-            progress = json.load(f)
+        progress = load_progress(progress_file)
         
-        completed = sum(1 for v in progress.values() if v.get('status') == 'success')
-        failed = sum(1 for v in progress.values() if v.get('status') == 'failed')
+        completed, failed, _ = summarize_progress(progress)
         total_processed = completed + failed
         
         print(f"📊 Current Status:")
@@ -14,32 +14,282 @@ Usage:
 import os
 import sys
 import argparse
+import glob
+import hashlib
 import logging
+import mmap
+import re
+import shutil
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Set, Dict, Any, Optional
 import pandas as pd
-import json
+import queue
 import time
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pc = None
+    ds = None
+    pq = None
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from config.config import BACKTESTER_CONFIG, setup_logging
+from config.config import BACKTESTER_CONFIG, setup_logging, json_dumps, atomic_write_bytes
 from src.core.etl.data_fetcher import DataFetcher
+from src.core.etl.rate_limiter import RateLimiter
+
+# A whole comma/newline-separated token that is purely alphanumeric (surrounding
+# blanks allowed); tokens such as M&M or BAJAJ-AUTO never match
+TICKER_TOKEN_RE = re.compile(rb'(?:(?<=[,\n])|\A)[ \t\r\f\v]*([A-Za-z0-9]+)[ \t\r\f\v]*(?=[,\n]|\Z)')
+
+# Column types for Parquet output: float32 is ample for exchange prices and halves
+# their size; volume stays int64 so every chunk of a file shares one schema
+PARQUET_DTYPES = {
+    'open': 'float32',
+    'high': 'float32',
+    'low': 'float32',
+    'close': 'float32',
+    'volume': 'int64'
+}
+
+# Approximate on-disk bytes per 1-minute candle, for size estimates
+BYTES_PER_CANDLE = {'parquet': 20, 'dataset': 20, 'csv': 100}
+
+def parquet_dtypes(df: pd.DataFrame) -> Dict[str, str]:
+    """Column casts for Parquet output; missing volumes fall back to nullable Int64."""
+    dtypes = {col: dtype for col, dtype in PARQUET_DTYPES.items() if col in df.columns}
+    if 'volume' in dtypes and df['volume'].isna().any():
+        dtypes['volume'] = 'Int64'
+    return dtypes
+
+def parquet_max_timestamp(path: Path) -> Optional[pd.Timestamp]:
+    """
+    Newest 'timestamp' in a Parquet file written in ascending order, or None.
+    
+    Read from the footer statistics of the last row group, so no data pages
+    are touched, and returned in the column's own timezone.
+    """
+    source = pq.ParquetFile(path)
+    metadata = source.metadata
+    if metadata.num_row_groups == 0:
+        return None
+    column = source.schema_arrow.get_field_index('timestamp')
+    stats = metadata.row_group(metadata.num_row_groups - 1).column(column).statistics
+    if stats is None or not stats.has_min_max:
+        return None
+        
+    end = pd.Timestamp(stats.max)
+    tz = source.schema_arrow.field('timestamp').type.tz
+    if tz is not None:
+        # Parquet stores UTC instants; convert back to the candles' wall-clock time
+        end = (end if end.tzinfo else end.tz_localize('UTC')).tz_convert(tz)
+    return end
+
+class FileCache:
+    """
+    On-disk cache of fetched chunk frames, one Parquet file per key.
+    
+    Historical candles for a closed date range never change, so entries have
+    no expiry. Disabled (every lookup misses) when pyarrow is not installed.
+    """
+    
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.enabled = PYARROW_AVAILABLE
+        
+    @staticmethod
+    def make_key(ticker: str, start: str, end: str, timeframe: str) -> str:
+        return hashlib.md5(f"{ticker}|{start}|{end}|{timeframe}".encode()).hexdigest()
+        
+    def _path(self, ticker: str, key: str) -> Path:
+        return self.cache_dir / ticker / f"{key}.parquet"
+        
+    def get(self, ticker: str, key: str, as_table: bool = False):
+        """Return the cached frame (or pyarrow Table with as_table), or None on a miss."""
+        if not self.enabled:
+            return None
+        try:
+            table = pq.read_table(self._path(ticker, key))
+        except (FileNotFoundError, pa.ArrowInvalid, OSError):
+            return None
+        return table if as_table else table.to_pandas()
+            
+    def put(self, ticker: str, key: str, data):
+        """Store a frame or Table; written to a temp file first so readers never see a partial entry."""
+        if not self.enabled:
+            return
+        if isinstance(data, pd.DataFrame):
+            data = pa.Table.from_pandas(data, preserve_index=False)
+        path = self._path(ticker, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        pq.write_table(data, tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+
+class TickerFileWriter:
+    """
+    Append chunk frames to a ticker's output file as they arrive.
+    
+    Parquet goes through one ParquetWriter (a row group per chunk), CSV is
+    appended with the header written once. Rows land in a ``.part`` file that
+    replaces the output only on commit, so a failed pull never leaves a
+    truncated file behind.
+    """
+    
+    def __init__(self, output_file: Path, output_format: str):
+        self.output_file = output_file
+        self.output_format = output_format
+        self.tmp_file = output_file.with_name(output_file.name + ".part")
+        self.rows = 0
+        self.last_timestamp = None  # Newest candle written so far
+        self.supersedes: Optional[Path] = None  # Earlier output folded in by carry_over
+        self._writer = None
+        
+    def _write_table(self, table: "pa.Table"):
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.tmp_file, table.schema, compression='zstd')
+        elif not table.schema.equals(self._writer.schema):
+            table = table.cast(self._writer.schema)
+        self._writer.write_table(table)
+        
+    def carry_over(self, source_file: Path):
+        """
+        Seed the new Parquet file with an existing output, one row group at a time.
+        
+        When the source is an older file (a shorter date range), it is removed
+        once this file commits, so the ticker keeps a single output.
+        """
+        source = pq.ParquetFile(source_file)
+        self.supersedes = source_file
+        for i in range(source.num_row_groups):
+            table = source.read_row_group(i)
+            if table.num_rows:
+                self._write_table(table)
+                self.rows += table.num_rows
+                self.last_timestamp = pd.Timestamp(table.column('timestamp')[-1].as_py())
+        
+    def write_table(self, table: "pa.Table"):
+        """Append an Arrow table (parquet output only), cast to the file's typed schema."""
+        schema = pa.schema([
+            (field.name, pa.type_for_alias(PARQUET_DTYPES[field.name]) if field.name in PARQUET_DTYPES else field.type)
+            for field in table.schema
+        ])
+        self._write_table(table.cast(schema))
+        self.rows += table.num_rows
+        
+    def write(self, df: pd.DataFrame):
+        if self.output_format == "parquet":
+            self._write_table(pa.Table.from_pandas(df.astype(parquet_dtypes(df)), preserve_index=False))
+        else:
+            df.to_csv(self.tmp_file, mode='a' if self.rows else 'w', header=not self.rows, index=False)
+        self.rows += len(df)
+        
+    def close(self, commit: bool = True):
+        """Finish the file; keep it only when committing and at least one row was written."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if commit and self.rows:
+            os.replace(self.tmp_file, self.output_file)
+            if self.supersedes is not None and self.supersedes != self.output_file:
+                self.supersedes.unlink(missing_ok=True)
+        else:
+            self.tmp_file.unlink(missing_ok=True)
+
+class PartitionedDatasetWriter:
+    """
+    Write chunk frames into a Hive-partitioned Parquet dataset.
+    
+    Layout: <base_dir>/timeframe=1m/symbol=TCS/year=2024/month=3/<chunk>-0.parquet.
+    Each chunk writes its own files (named after its first candle), so
+    months are appended independently and re-pulling a chunk replaces only
+    that chunk's files. Offers the same interface as TickerFileWriter:
+    fragments go to a hidden staging directory (skipped by dataset readers)
+    and are moved into place only on commit, otherwise discarded.
+    """
+    
+    def __init__(self, base_dir: Path, ticker: str, timeframe: str):
+        self.output_file = base_dir / f"timeframe={timeframe}" / f"symbol={ticker}"
+        self.base_dir = base_dir
+        self.staging_dir = base_dir / f".staging-{ticker}-{os.getpid()}-{threading.get_ident()}"
+        self.ticker = ticker
+        self.timeframe = timeframe
+        self.rows = 0
+        self.last_timestamp = None
+        self._partitioning = ds.partitioning(
+            pa.schema([('timeframe', pa.string()), ('symbol', pa.string()),
+                       ('year', pa.int16()), ('month', pa.int8())]),
+            flavor='hive'
+        )
+        
+    def write(self, df: pd.DataFrame):
+        timestamps = df['timestamp']
+        df = df.astype(parquet_dtypes(df)).assign(
+            timeframe=self.timeframe,
+            symbol=self.ticker,
+            year=timestamps.dt.year.astype('int16'),
+            month=timestamps.dt.month.astype('int8')
+        )
+        ds.write_dataset(
+            pa.Table.from_pandas(df, preserve_index=False),
+            self.staging_dir,
+            format='parquet',
+            partitioning=self._partitioning,
+            basename_template=f"{timestamps.iloc[0]:%Y%m%d}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore',
+            file_options=ds.ParquetFileFormat().make_write_options(compression='zstd')
+        )
+        self.rows += len(df)
+        
+    def close(self, commit: bool = True):
+        """Move staged fragments into the dataset when committing; drop them either way after."""
+        try:
+            if commit and self.rows:
+                for fragment in self.staging_dir.rglob('*.parquet'):
+                    target = self.base_dir / fragment.relative_to(self.staging_dir)
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(fragment, target)
+        finally:
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
 
 class MSEDataPuller:
     """Data puller specifically designed for MSE strategy requirements."""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 4, requests_per_second: float = 2,
+                 output_format: str = "parquet"):
         self.logger = logging.getLogger("MSEDataPuller")
         self.unique_tickers: Set[str] = set()
-        self.failed_tickers: List[str] = []
-        self.successful_tickers: List[str] = []
-        self.total_files_created = 0
+        # Per-run tallies, bumped from worker threads (see _reset_stats)
+        self._stats_lock = threading.Lock()
+        self._reset_stats()
         self.start_time = None
+        self.fetcher: Optional[DataFetcher] = None  # Shared by validation and pulls
+        self.cache = FileCache(Path(BACKTESTER_CONFIG['DATA_POOL_DIR']) / ".cache")
+        
+        # Output format: 'parquet' (default, typed + zstd, streamed a row group per chunk),
+        # 'dataset' (Hive-partitioned by symbol/year/month) or 'csv'
+        if output_format in ("parquet", "dataset") and not PYARROW_AVAILABLE:
+            self.logger.warning("pyarrow not installed; falling back to CSV output")
+            output_format = "csv"
+        self.output_format = output_format
+        
+        # Concurrency: tickers pulled in parallel under one shared token bucket
+        self.max_workers = max_workers  # Tickers in flight at once
+        self.requests_per_second = requests_per_second  # Sustained API call rate across every worker
+        self.limiter = RateLimiter(self.requests_per_second)
         
         # MSE Strategy requirements  
         self.required_timeframe = "1m"  # MSE needs 1-minute base data
@@ -67,17 +317,16 @@ class MSEDataPuller:
         self.logger.info(f"Reading tickers from: {tickers_file}")
         
         try:
-            with open(tickers_file, 'r') as f:
-                content = f.read()
-                
-            # Split by commas and clean up
-            raw_tickers = content.replace('\n', ',').split(',')
+            # Scan the file through a read-only memory map: no in-memory copy of its contents
             unique_tickers = set()
-            
-            for ticker in raw_tickers:
-                cleaned = ticker.strip().upper()
-                if cleaned and cleaned.isalnum():  # Only alphanumeric tickers
-                    unique_tickers.add(cleaned)
+            with open(tickers_file, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:  # mmap cannot map an empty file
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                        # One C-level regex scan picks out the alphanumeric tickers
+                        unique_tickers = {
+                            match.group(1).decode('ascii').upper()
+                            for match in TICKER_TOKEN_RE.finditer(content)
+                        }
                     
             self.unique_tickers = unique_tickers
             self.logger.info(f"Extracted {len(unique_tickers)} unique tickers")
@@ -108,8 +357,8 @@ class MSEDataPuller:
         candles_per_ticker = market_days * 375
         total_candles = candles_per_ticker * len(tickers)
         
-        # Estimate file size (assuming ~100 bytes per candle in CSV)
-        estimated_size_gb = (total_candles * 100) / (1024**3)
+        # Estimate file size (~20 bytes per candle in Parquet+zstd, ~100 in CSV)
+        estimated_size_gb = (total_candles * BYTES_PER_CANDLE[self.output_format]) / (1024**3)
         
         # API calls needed (max 200 days per call)
         api_calls_per_ticker = max(1, total_days // 200)
@@ -131,6 +380,18 @@ class MSEDataPuller:
         
         return estimates
         
+    def get_fetcher(self) -> DataFetcher:
+        """
+        Return the shared DataFetcher, creating it on first use.
+        
+        One provider instance means one authentication, one instruments table
+        load and one keep-alive session (pooled by config.create_session) for
+        the validation checks and every ticker pull.
+        """
+        if self.fetcher is None:
+            self.fetcher = DataFetcher()
+        return self.fetcher
+        
     def validate_setup(self) -> bool:
         """
         Validate that the system is ready for data pulling.
@@ -142,7 +403,7 @@ class MSEDataPuller:
         
         try:
             # Check data fetcher
-            fetcher = DataFetcher()
+            fetcher = self.get_fetcher()
             if not fetcher.provider:
                 self.logger.error("❌ No data provider available")
                 return False
@@ -200,7 +461,7 @@ class MSEDataPuller:
         self.logger.info(f"   Date range: {test_start.date()} to {test_end.date()}")
         
         try:
-            fetcher = DataFetcher()
+            fetcher = self.get_fetcher()
             
             for ticker in test_tickers:
                 self.logger.info(f"   Testing ticker: {ticker}")
@@ -225,7 +486,7 @@ class MSEDataPuller:
             return False
             
     def create_date_chunks(self, start_date: str, end_date: str, 
-                          chunk_days: int = 28) -> List[Dict[str, str]]:
+                          chunk_days: int = 28) -> List[Dict[str, Any]]:
         """
         Create date chunks for efficient API calls.
         
@@ -235,28 +496,158 @@ class MSEDataPuller:
             chunk_days: Days per chunk (default: 28, under 30-day API limit for 1-minute data)
             
         Returns:
-            List of date chunk dictionaries
+            List of date chunk dictionaries: 'start'/'end' strings plus the
+            'start_dt'/'end_dt' datetimes they were formatted from
+        """
+        end_dt = pd.Timestamp(datetime.strptime(end_date, '%Y-%m-%d'))
+        
+        # Chunk boundaries are computed as whole index operations, then zipped into dicts
+        starts = pd.date_range(datetime.strptime(start_date, '%Y-%m-%d'), end_dt, freq=f'{chunk_days}D')
+        ends = starts + pd.Timedelta(days=chunk_days - 1)
+        ends = ends.where(ends <= end_dt, end_dt)
+        days = (ends - starts).days + 1
+        
+        return [
+            {
+                'start_dt': chunk_start,
+                'end_dt': chunk_end,
+                'start': start_str,
+                'end': end_str,
+                'days': int(n_days)
+            }
+            for chunk_start, chunk_end, start_str, end_str, n_days in zip(
+                starts.to_pydatetime(), ends.to_pydatetime(),
+                starts.strftime('%Y-%m-%d'), ends.strftime('%Y-%m-%d'), days
+            )
+        ]
+        
+    def _output_file(self, ticker: str) -> Path:
+        """Per-ticker output path for the 'parquet' and 'csv' formats."""
+        date_range_str = f"{self.date_range['start']}_to_{self.date_range['end']}"
+        output_dir = Path(BACKTESTER_CONFIG['DATA_POOL_DIR']) / date_range_str / "1minute"
+        return output_dir / f"{ticker}_{self.required_timeframe}_{date_range_str}.{self.output_format}"
+        
+    def _dataset_dir(self) -> Path:
+        return Path(BACKTESTER_CONFIG['DATA_POOL_DIR']) / "mse_dataset"
+        
+    def _existing_output(self, ticker: str) -> Optional[Path]:
         """
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
+        Newest Parquet output for a ticker from the same start date, or None.
         
-        chunks = []
-        current_start = start_dt
+        Earlier runs may have used an earlier end date, so any
+        {start}_to_{end} file with an end up to the requested one counts.
+        For the 'dataset' format this is the ticker's symbol partition.
+        """
+        if self.output_format == "dataset":
+            symbol_dir = self._dataset_dir() / f"timeframe={self.required_timeframe}" / f"symbol={ticker}"
+            return symbol_dir if symbol_dir.is_dir() else None
+        if self.output_format != "parquet":
+            return None
+        start = self.date_range['start']
+        pattern = (f"{start}_to_*/1minute/"
+                   f"{glob.escape(ticker)}_{self.required_timeframe}_{start}_to_*.{self.output_format}")
+        suffix = f".{self.output_format}"
+        candidates = {
+            path.name[:-len(suffix)].rsplit('_to_', 1)[1]: path
+            for path in Path(BACKTESTER_CONFIG['DATA_POOL_DIR']).glob(pattern)
+        }
+        # ISO end dates sort chronologically as strings
+        ends = [end for end in candidates if end <= self.date_range['end']]
+        return candidates[max(ends)] if ends else None
         
-        while current_start <= end_dt:
-            current_end = min(current_start + timedelta(days=chunk_days - 1), end_dt)
-            
-            chunks.append({
-                'start': current_start.strftime('%Y-%m-%d'),
-                'end': current_end.strftime('%Y-%m-%d'),
-                'days': (current_end - current_start).days + 1
-            })
-            
-            current_start = current_end + timedelta(days=1)
-            
-        return chunks
+    def _open_writer(self, ticker: str) -> TickerFileWriter:
+        """Create the streaming writer for a ticker's output file."""
+        if self.output_format == "dataset":
+            return PartitionedDatasetWriter(self._dataset_dir(), ticker, self.required_timeframe)
         
-    def pull_ticker_data(self, ticker: str, date_chunks: List[Dict[str, str]], 
+        output_file = self._output_file(ticker)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        return TickerFileWriter(output_file, self.output_format)
+        
+    def _existing_end(self, ticker: str, output: Path) -> Optional[pd.Timestamp]:
+        """Newest candle in an existing output file or dataset partition, or None."""
+        try:
+            files = output.rglob('*.parquet') if output.is_dir() else [output]
+            ends = [end for end in map(parquet_max_timestamp, files) if end is not None]
+            return max(ends) if ends else None
+        except Exception as e:
+            self.logger.warning(f"⚠️ {ticker}: Could not read existing output {output.name}: {e}")
+            return None
+        
+    @staticmethod
+    def _write_chunk(writer: TickerFileWriter, df: pd.DataFrame):
+        """Append one chunk in timestamp order without duplicate candles."""
+        timestamps = df['timestamp']
+        if not timestamps.is_monotonic_increasing:
+            df = df.sort_values('timestamp', kind='stable')
+            timestamps = df['timestamp']
+        
+        # Chunks arrive in ascending order, so duplicates are either adjacent
+        # within the chunk or at/before the last candle already written
+        keep = timestamps.ne(timestamps.shift())
+        if writer.last_timestamp is not None:
+            keep &= timestamps > writer.last_timestamp
+        if not keep.all():
+            df = df[keep]
+        if df.empty:
+            return
+        
+        writer.write(df)
+        writer.last_timestamp = df['timestamp'].iloc[-1]
+        
+    @staticmethod
+    def _write_table_chunk(writer: TickerFileWriter, table: "pa.Table"):
+        """Arrow counterpart of _write_chunk for chunks fetched as pyarrow Tables."""
+        timestamps = table.column('timestamp')
+        if not pc.all(pc.less_equal(timestamps[:-1], timestamps[1:])).as_py():
+            table = table.sort_by('timestamp')
+            timestamps = table.column('timestamp')
+            
+        keep = pa.chunked_array([pa.array([True])] + pc.not_equal(timestamps[1:], timestamps[:-1]).chunks)
+        if writer.last_timestamp is not None:
+            keep = pc.and_(keep, pc.greater(timestamps, pa.scalar(writer.last_timestamp, type=timestamps.type)))
+        if not pc.all(keep).as_py():
+            table = table.filter(keep)
+        if table.num_rows == 0:
+            return
+        
+        writer.write_table(table)
+        writer.last_timestamp = pd.Timestamp(table.column('timestamp')[-1].as_py())
+        
+    def _reset_stats(self):
+        """Start a run with zeroed tallies; counts are lock-guarded ints, failures a queue."""
+        with self._stats_lock:
+            self.successful_count = 0
+            self.total_files_created = 0
+        self._failed_q: "queue.Queue[str]" = queue.Queue()
+        
+    def _count_success(self):
+        with self._stats_lock:
+            self.successful_count += 1
+            
+    def _drain_failed(self) -> List[str]:
+        """Take every failed ticker queued so far."""
+        failed = []
+        while True:
+            try:
+                failed.append(self._failed_q.get_nowait())
+            except queue.Empty:
+                return failed
+        
+    def _finish_writer(self, ticker: str, writer: TickerFileWriter) -> bool:
+        """Commit a ticker's file if it received any rows."""
+        committed = writer.rows > 0
+        writer.close(commit=committed)
+        
+        if committed:
+            self.logger.info(f"✅ {ticker}: {writer.rows} candles saved to {writer.output_file}")
+            with self._stats_lock:
+                self.total_files_created += 1
+        else:
+            self.logger.warning(f"⚠️ {ticker}: No data found for any chunks")
+        return committed
+        
+    def pull_ticker_data(self, ticker: str, date_chunks: List[Dict[str, Any]], 
                         fetcher: DataFetcher) -> bool:
         """
         Pull data for a single ticker across all date chunks.
@@ -269,58 +660,112 @@ class MSEDataPuller:
         Returns:
             True if successful
         """
+        writer = None
         try:
+            # Resume after the newest candle on disk (possibly in an earlier run's
+            # shorter-range file): drop chunks whose last day is before it and
+            # start the first remaining chunk just after it
+            existing_file = self._existing_output(ticker)
+            last_candle = self._existing_end(ticker, existing_file) if existing_file else None
+            # Chunks are naive dates, so compare in the candles' wall-clock time
+            cutoff = last_candle.replace(tzinfo=None).to_pydatetime() if last_candle is not None else None
+            if cutoff is not None:
+                date_chunks = [c for c in date_chunks if c['end_dt'] + timedelta(days=1) > cutoff]
+                if not date_chunks:
+                    output_file = self._output_file(ticker)
+                    if self.output_format == "parquet" and existing_file != output_file:
+                        output_file.parent.mkdir(parents=True, exist_ok=True)
+                        os.replace(existing_file, output_file)
+                    self.logger.info(f"✅ {ticker}: Up to date through {cutoff}")
+                    return True
+                first = date_chunks[0]
+                resume_dt = max(first['start_dt'], cutoff + timedelta(minutes=1))
+                date_chunks[0] = {
+                    **first,
+                    'start_dt': resume_dt,
+                    'start': resume_dt.strftime('%Y-%m-%d'),
+                    'days': (first['end_dt'].date() - resume_dt.date()).days + 1
+                }
+                
             self.logger.info(f"📥 Pulling data for {ticker} ({len(date_chunks)} chunks)")
             
-            all_data = []
+            # Chunks are written as they arrive instead of being held for one big concat
+            writer = self._open_writer(ticker)
+            if cutoff is not None and self.output_format == "dataset":
+                # Partitions are appended to, so only the newer candles are written
+                writer.last_timestamp = last_candle
+                self.logger.info(f"   ↪️ {ticker}: Resuming after {cutoff} in {existing_file}")
+            elif cutoff is not None:
+                # The output is replaced on commit, so existing rows are copied in first
+                writer.carry_over(existing_file)
+                self.logger.info(f"   ↪️ {ticker}: Resuming after {cutoff} from {existing_file.name} "
+                                 f"({writer.rows} candles on disk)")
+            today = datetime.now().date()
+            debug = self.logger.isEnabledFor(logging.DEBUG)  # Skip building per-chunk messages otherwise
+            
+            # Parquet output from an Arrow-capable provider stays in pyarrow Tables from parse to disk
+            use_arrow = self.output_format == "parquet" and hasattr(fetcher.provider, 'fetch_historical_data_arrow')
+            fetch = fetcher.provider.fetch_historical_data_arrow if use_arrow else fetcher.provider.fetch_historical_data
+            write_chunk = self._write_table_chunk if use_arrow else self._write_chunk
             
             for i, chunk in enumerate(date_chunks, 1):
-                self.logger.debug(f"   Chunk {i}/{len(date_chunks)}: {chunk['start']} to {chunk['end']}")
+                if debug:
+                    self.logger.debug(f"   Chunk {i}/{len(date_chunks)}: {chunk['start']} to {chunk['end']}")
                 
-                start_dt = datetime.strptime(chunk['start'], '%Y-%m-%d')
-                end_dt = datetime.strptime(chunk['end'], '%Y-%m-%d')
+                start_dt = chunk['start_dt']
+                end_dt = chunk['end_dt']
                 
-                # Fetch data for this chunk
-                df = fetcher.provider.fetch_historical_data(
-                    symbol=ticker,
-                    start_date=start_dt,
-                    end_date=end_dt,
-                    timeframe=self.required_timeframe
-                )
+                # Closed date ranges are served from the on-disk cache when present
+                cache_key = FileCache.make_key(ticker, chunk['start'], chunk['end'], self.required_timeframe)
+                cacheable = end_dt.date() < today
+                data = self.cache.get(ticker, cache_key, as_table=use_arrow) if cacheable else None
+                
+                if data is None:
+                    # Respect API limits across all worker threads
+                    self.limiter.wait()
+                    
+                    # Fetch data for this chunk (a DataFrame, or a Table on the Arrow path)
+                    data = fetch(
+                        symbol=ticker,
+                        start_date=start_dt,
+                        end_date=end_dt,
+                        timeframe=self.required_timeframe
+                    )
+                    if cacheable and len(data):
+                        try:
+                            self.cache.put(ticker, cache_key, data)
+                        except Exception as e:
+                            self.logger.warning(f"   ⚠️ Could not cache chunk {i} for {ticker}: {e}")
                 
-                if not df.empty:
-                    all_data.append(df)
-                    self.logger.debug(f"   ✅ Chunk {i}: {len(df)} candles")
+                if len(data):
+                    write_chunk(writer, data)
+                    if debug:
+                        self.logger.debug(f"   ✅ Chunk {i}: {len(data)} candles")
                 else:
                     self.logger.warning(f"   ⚠️ Chunk {i}: No data")
+                del data
                 
-                # Small delay to respect API limits
-                time.sleep(0.5)
-                
-            if all_data:
-                # Combine all chunks
-                combined_df = pd.concat(all_data, ignore_index=True)
-                combined_df = combined_df.drop_duplicates(subset=['timestamp']).sort_values('timestamp')
-                
-                # Save to file
-                date_range_str = f"{self.date_range['start']}_to_{self.date_range['end']}"
-                output_dir = Path(BACKTESTER_CONFIG['DATA_POOL_DIR']) / date_range_str / "1minute"
-                output_dir.mkdir(parents=True, exist_ok=True)
-                
-                output_file = output_dir / f"{ticker}_{self.required_timeframe}_{date_range_str}.csv"
-                combined_df.to_csv(output_file, index=False)
-                
-                self.logger.info(f"✅ {ticker}: {len(combined_df)} candles saved to {output_file}")
-                self.total_files_created += 1
-                return True
-            else:
-                self.logger.warning(f"⚠️ {ticker}: No data found for any chunks")
-                return False
+            return self._finish_writer(ticker, writer)
                 
         except Exception as e:
+            if writer is not None:
+                writer.close(commit=False)
             self.logger.error(f"❌ Error pulling data for {ticker}: {e}")
             return False
             
+    def _record_result(self, ticker: str, future):
+        """Tally a finished ticker future as success or failure."""
+        try:
+            success = future.result()
+        except Exception as e:
+            self.logger.error(f"❌ Failed to process {ticker}: {e}")
+            success = False
+            
+        if success:
+            self._count_success()
+        else:
+            self._failed_q.put(ticker)
+            
     def run_full_data_pull(self, tickers: Set[str] = None) -> Dict[str, Any]:
         """
         Run the full data pulling process.
@@ -337,6 +782,7 @@ class MSEDataPuller:
         if not tickers:
             raise ValueError("No tickers to process")
             
+        self._reset_stats()
         self.start_time = datetime.now()
         self.logger.info(f"🚀 Starting full data pull for {len(tickers)} tickers")
         
@@ -347,52 +793,60 @@ class MSEDataPuller:
         )
         self.logger.info(f"📅 Created {len(date_chunks)} date chunks")
         
-        # Initialize data fetcher
-        fetcher = DataFetcher()
+        # Reuse the fetcher (and its warm session) from setup validation
+        fetcher = self.get_fetcher()
+        
+        # Resolve instrument keys up front so worker threads only read the provider's cache
+        if hasattr(fetcher.provider, 'resolve_instrument_ids'):
+            fetcher.provider.resolve_instrument_ids(sorted(tickers))
         
-        # Process each ticker
-        for i, ticker in enumerate(sorted(tickers), 1):
-            self.logger.info(f"🔄 Processing ticker {i}/{len(tickers)}: {ticker}")
+        # Process tickers in parallel; results are tallied here on the main thread
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="mse-pull") as executor:
+            futures = {
+                executor.submit(self.pull_ticker_data, ticker, date_chunks, fetcher): ticker
+                for ticker in sorted(tickers)
+            }
+            self.logger.info(f"🔄 Processing {len(futures)} tickers with {self.max_workers} workers")
             
             try:
-                success = self.pull_ticker_data(ticker, date_chunks, fetcher)
-                
-                if success:
-                    self.successful_tickers.append(ticker)
-                else:
-                    self.failed_tickers.append(ticker)
+                for i, future in enumerate(as_completed(futures), 1):
+                    ticker = futures[future]
+                    self._record_result(ticker, future)
                     
-            except Exception as e:
-                self.logger.error(f"❌ Failed to process {ticker}: {e}")
-                self.failed_tickers.append(ticker)
-                
-            # Progress update every 10 tickers
-            if i % 10 == 0:
-                elapsed = datetime.now() - self.start_time
-                self.logger.info(f"📊 Progress: {i}/{len(tickers)} tickers, "
-                               f"elapsed: {elapsed}, files: {self.total_files_created}")
+                    # Progress update every 10 tickers
+                    if i % 10 == 0:
+                        elapsed = datetime.now() - self.start_time
+                        self.logger.info(f"📊 Progress: {i}/{len(tickers)} tickers, "
+                                       f"elapsed: {elapsed}, files: {self.total_files_created}")
+            except KeyboardInterrupt:
+                # Drop queued tickers; in-flight ones finish their current chunk loop
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
                 
         # Generate summary
         end_time = datetime.now()
         elapsed_time = end_time - self.start_time
+        with self._stats_lock:
+            successful = self.successful_count
+            files_created = self.total_files_created
+        failed = self._drain_failed()
         
         summary = {
             'start_time': self.start_time.isoformat(),
             'end_time': end_time.isoformat(),
             'elapsed_time': str(elapsed_time),
             'total_tickers': len(tickers),
-            'successful_tickers': len(self.successful_tickers),
-            'failed_tickers': len(self.failed_tickers),
-            'total_files_created': self.total_files_created,
-            'success_rate': round(len(self.successful_tickers) / len(tickers) * 100, 2),
-            'failed_tickers_list': self.failed_tickers[:10]  # First 10 failures
+            'successful_tickers': successful,
+            'failed_tickers': len(failed),
+            'total_files_created': files_created,
+            'success_rate': round(successful / len(tickers) * 100, 2),
+            'failed_tickers_list': failed[:10]  # First 10 failures
         }
         
         # Save summary
         summary_file = Path(BACKTESTER_CONFIG['DATA_POOL_DIR']) / f"mse_data_pull_summary_{self.start_time.strftime('%Y%m%d_%H%M%S')}.json"
-        with open(summary_file, 'w') as f:
-            json.dump(summary, f, indent=2)
-            
+        atomic_write_bytes(summary_file, json_dumps(summary))
+        
         self.logger.info(f"📋 Summary saved to: {summary_file}")
         return summary
         
@@ -416,6 +870,20 @@ class MSEDataPuller:
         print("="*60)
 
 
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+def positive_float(value: str) -> float:
+    """argparse type for rates that must be greater than 0."""
+    number = float(value)
+    if not number > 0:
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return number
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(description="MSE Strategy Data Puller")
@@ -424,6 +892,11 @@ def main():
     parser.add_argument('--tickers', type=str, help="Comma-separated ticker list for custom mode")
     parser.add_argument('--dates', type=str, help="Start,End dates for custom mode (YYYY-MM-DD,YYYY-MM-DD)")
     parser.add_argument('--test-size', type=int, default=5, help="Number of tickers for validation test")
+    parser.add_argument('--workers', type=positive_int, default=4, help="Tickers pulled concurrently (default: 4)")
+    parser.add_argument('--rps', type=positive_float, default=2, help="API requests per second across all workers (default: 2)")
+    parser.add_argument('--format', choices=['parquet', 'dataset', 'csv'], default='parquet',
+                       help="Output format: one file per ticker (parquet/csv) or a "
+                            "symbol/year/month partitioned dataset (default: parquet)")
     
     args = parser.parse_args()
     
@@ -431,7 +904,8 @@ def main():
     setup_logging('mse_data_puller')
     
     try:
-        puller = MSEDataPuller()
+        puller = MSEDataPuller(max_workers=args.workers, requests_per_second=args.rps,
+                               output_format=args.format)
         
         # Extract unique tickers
         unique_tickers = puller.extract_unique_tickers()
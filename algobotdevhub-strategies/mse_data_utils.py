@@ -30,6 +30,15 @@ sys.path.insert(0, str(project_root))
 
 from config.config import BACKTESTER_CONFIG
 
+# Puller output formats, in lookup preference order
+DATA_FILE_SUFFIXES = ('.parquet', '.csv')
+
+def read_data_file(path: Path) -> pd.DataFrame:
+    """Load a pulled data file, Parquet or CSV."""
+    if path.suffix == '.parquet':
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
 class MSEDataUtils:
     """Utility class for MSE data management."""
     
@@ -176,11 +185,11 @@ class MSEDataUtils:
             
         print(f"🔍 Validating data in: {data_dir}")
         
-        # Get all CSV files
-        csv_files = list(data_dir.glob("*.csv"))
+        # Get all data files (Parquet from current pulls, CSV from older ones)
+        data_files = [path for suffix in DATA_FILE_SUFFIXES for path in data_dir.glob(f"*{suffix}")]
         
         validation_results = {
-            'total_files': len(csv_files),
+            'total_files': len(data_files),
             'valid_files': 0,
             'invalid_files': [],
             'file_stats': {},
@@ -195,13 +204,13 @@ class MSEDataUtils:
             }
         }
         
-        for csv_file in csv_files:
+        for data_file in data_files:
             try:
                 # Extract ticker from filename
-                ticker_match = re.search(r'([A-Z0-9&-]+)_1m_', csv_file.name)
+                ticker_match = re.search(r'([A-Z0-9&-]+)_1m_', data_file.name)
                 if not ticker_match:
                     validation_results['invalid_files'].append({
-                        'file': csv_file.name,
+                        'file': data_file.name,
                         'error': 'Invalid filename format'
                     })
                     continue
@@ -210,7 +219,7 @@ class MSEDataUtils:
                 validation_results['ticker_coverage'].add(ticker)
                 
                 # Load and validate file
-                df = pd.read_csv(csv_file)
+                df = read_data_file(data_file)
                 
                 # Basic validation
                 required_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
@@ -218,14 +227,14 @@ class MSEDataUtils:
                 
                 if missing_columns:
                     validation_results['invalid_files'].append({
-                        'file': csv_file.name,
+                        'file': data_file.name,
                         'error': f'Missing columns: {missing_columns}'
                     })
                     continue
                     
                 # Data quality checks
                 candles_count = len(df)
-                file_size_mb = csv_file.stat().st_size / (1024 * 1024)
+                file_size_mb = data_file.stat().st_size / (1024 * 1024)
                 
                 # Date range analysis
                 df['timestamp'] = pd.to_datetime(df['timestamp'])
@@ -259,7 +268,7 @@ class MSEDataUtils:
                 
             except Exception as e:
                 validation_results['invalid_files'].append({
-                    'file': csv_file.name,
+                    'file': data_file.name,
                     'error': str(e)
                 })
                 
@@ -313,7 +322,8 @@ class MSEDataUtils:
             date_range = "2022-01-01_to_2025-07-07"
             
         data_dir = Path(BACKTESTER_CONFIG['DATA_POOL_DIR']) / date_range / "1minute"
-        ticker_file = data_dir / f"{ticker}_1m_{date_range}.csv"
+        candidates = [data_dir / f"{ticker}_1m_{date_range}{suffix}" for suffix in DATA_FILE_SUFFIXES]
+        ticker_file = next((path for path in candidates if path.exists()), candidates[0])
         
         if not ticker_file.exists():
             return {
@@ -323,7 +333,7 @@ class MSEDataUtils:
             }
             
         try:
-            df = pd.read_csv(ticker_file)
+            df = read_data_file(ticker_file)
             df['timestamp'] = pd.to_datetime(df['timestamp'])
             df = df.sort_values('timestamp')
             
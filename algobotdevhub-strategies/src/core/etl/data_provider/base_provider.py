@@ -67,11 +67,11 @@ class DataProvider(ABC):
                 df = df.rename(columns={old_col: new_col})
         
         # Ensure timestamp is datetime
-        if 'timestamp' in df.columns:
+        if 'timestamp' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
             df['timestamp'] = pd.to_datetime(df['timestamp'])
         
         # Sort by timestamp
-        if 'timestamp' in df.columns:
+        if 'timestamp' in df.columns and not df['timestamp'].is_monotonic_increasing:
             df = df.sort_values('timestamp')
         
         return df
\ No newline at end of file
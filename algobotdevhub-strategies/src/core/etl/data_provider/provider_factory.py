@@ -83,8 +83,7 @@ class DataProviderFactory:
             
         except Exception as e:
             logger.error(f"Error creating data provider '{provider_name}': {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback:", exc_info=True)
             return None
     
     @classmethod
@@ -6,9 +6,30 @@ import logging
 import time
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    pa = None
+    pc = None
+
 from .base_provider import DataProvider
 from ..token_manager import load_provider_token, save_provider_token
-from config import create_session, BACKTESTER_CONFIG
+from config import create_session, BACKTESTER_CONFIG, parse_timeframe, upstox_unit_interval
+
+# V3 candles are [timestamp, open, high, low, close, volume, open_interest]
+CANDLE_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+CANDLE_DTYPES = {
+    'open': 'float64',
+    'high': 'float64',
+    'low': 'float64',
+    'close': 'float64',
+    'volume': 'int64'
+}
+CANDLE_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S%z'  # e.g. 2025-07-11T00:00:00+05:30
+CANDLE_TIMEZONE = '+05:30'  # Offset carried by every V3 timestamp (IST)
 
 class UpstoxDataProvider(DataProvider):
     """Upstox V3 API implementation of the DataProvider interface."""
@@ -17,6 +38,7 @@ class UpstoxDataProvider(DataProvider):
         super().__init__(config)
         self.session = None
         self.instruments_df = None
+        self.instrument_keys = {}  # tradingsymbol -> instrument_key
         self.provider_name = 'upstox_v3'  # Indicate V3 API usage
     
     def authenticate(self) -> bool:
@@ -110,31 +132,14 @@ class UpstoxDataProvider(DataProvider):
         if standard_timeframe in mappings:
             return mappings[standard_timeframe]
         
-        # Fallback mappings if not in config
-        fallback_mappings = {
-            '1m': {'unit': 'minutes', 'interval': '1'},
-            '2m': {'unit': 'minutes', 'interval': '2'},
-            '3m': {'unit': 'minutes', 'interval': '3'},
-            '5m': {'unit': 'minutes', 'interval': '5'},
-            '10m': {'unit': 'minutes', 'interval': '10'},
-            '15m': {'unit': 'minutes', 'interval': '15'},
-            '30m': {'unit': 'minutes', 'interval': '30'},
-            '1h': {'unit': 'hours', 'interval': '1'},
-            '2h': {'unit': 'hours', 'interval': '2'},
-            'day': {'unit': 'days', 'interval': '1'},
-            'week': {'unit': 'weeks', 'interval': '1'},
-            'month': {'unit': 'months', 'interval': '1'},
-            # Legacy compatibility
-            '1minute': {'unit': 'minutes', 'interval': '1'},
-            '30minute': {'unit': 'minutes', 'interval': '30'}
-        }
-        
-        mapping = fallback_mappings.get(standard_timeframe)
-        if not mapping:
+        # Fall back to the shared Timeframe tables if not in config
+        timeframe = parse_timeframe(standard_timeframe)
+        if timeframe is None:
             self.logger.warning(f"Unknown timeframe '{standard_timeframe}', defaulting to 1 minute")
-            mapping = {'unit': 'minutes', 'interval': '1'}
+            return {'unit': 'minutes', 'interval': '1'}
         
-        return mapping
+        unit, interval = upstox_unit_interval(timeframe)
+        return {'unit': unit, 'interval': interval}
     
     def get_available_symbols(self) -> list:
         """Get list of available trading symbols."""
@@ -172,10 +177,30 @@ class UpstoxDataProvider(DataProvider):
         return df
 
 
+    def resolve_instrument_ids(self, symbols: list) -> dict:
+        """
+        Resolve many trading symbols to instrument keys in one pass.
+        
+        Uses a single isin() filter over the instruments table instead of one
+        scan per symbol, and caches the result for symbol_to_instrument_id.
+        
+        Returns:
+            Dict of symbol -> instrument_key for every symbol that was found
+        """
+        missing = [symbol for symbol in symbols if symbol not in self.instrument_keys]
+        if missing:
+            matches = self.fetch_instrument_details(missing).drop_duplicates('tradingsymbol')
+            self.instrument_keys.update(zip(matches['tradingsymbol'], matches['instrument_key']))
+        
+        return {symbol: self.instrument_keys[symbol] for symbol in symbols if symbol in self.instrument_keys}
+    
     def symbol_to_instrument_id(self, symbol: str) -> str:
         if not self.authenticated:
             self.authenticate()
 
+        if symbol in self.instrument_keys:
+            return self.instrument_keys[symbol]
+
         instruments = self.fetch_instrument_details([symbol])
 
         if instruments.empty:
@@ -188,19 +213,39 @@ class UpstoxDataProvider(DataProvider):
             self.logger.error(f"Symbol '{symbol}' not found in instruments data after filtering.")
             return None
 
-        return match.iloc[0]['instrument_key']
+        instrument_key = match.iloc[0]['instrument_key']
+        self.instrument_keys[symbol] = instrument_key
+        return instrument_key
 
     
     def fetch_historical_data(self, symbol: str, start_date: datetime, end_date: datetime, 
                              timeframe: str) -> pd.DataFrame:
         """Fetch historical data from Upstox API month by month."""
+        candles = self._fetch_candles(symbol, start_date, end_date, timeframe)
+        if not candles:
+            return pd.DataFrame()
+        return self._candles_to_frame(candles, symbol)
+    
+    def fetch_historical_data_arrow(self, symbol: str, start_date: datetime, end_date: datetime,
+                                    timeframe: str) -> "pa.Table":
+        """Fetch historical data as a pyarrow Table, skipping the pandas frame entirely."""
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is required for fetch_historical_data_arrow")
+        candles = self._fetch_candles(symbol, start_date, end_date, timeframe)
+        if not candles:
+            return pa.table({})
+        return self._candles_to_table(candles, symbol)
+    
+    def _fetch_candles(self, symbol: str, start_date: datetime, end_date: datetime,
+                       timeframe: str) -> list:
+        """Collect raw V3 candle rows for a date range, chunked to the API limits."""
         if not self.authenticated:
             self.authenticate()
             
         instrument_id = self.symbol_to_instrument_id(symbol)
         if not instrument_id:
             self.logger.error(f"Could not find instrument key for ticker: {symbol}")
-            return pd.DataFrame()
+            return []
         
         timeframe_mapping = self.map_timeframe(timeframe)
         unit = timeframe_mapping['unit']
@@ -256,16 +301,51 @@ class UpstoxDataProvider(DataProvider):
         success_pct = ((days_processed - len(failed_days)) / days_processed * 100) if days_processed > 0 else 0
         self.logger.info(f"✅ {symbol}: Completed fetching {len(full_data)} total candles ({success_pct:.1f}% success rate)")
         
-        if not full_data:
-            return pd.DataFrame()
-            
-        df = pd.DataFrame(full_data)
+        return full_data
+    
+    def _candles_to_frame(self, candles: list, symbol: str) -> pd.DataFrame:
+        """
+        Build the standard OHLCV frame from raw V3 candle rows.
+        
+        The result is typed (datetime64 timestamp, float64 prices, int64
+        volume) and sorted ascending by timestamp, so callers can rely on it
+        without re-parsing or re-sorting.
+        """
+        df = pd.DataFrame.from_records(candles, columns=CANDLE_COLUMNS).astype(CANDLE_DTYPES)
+        try:
+            df['timestamp'] = pd.to_datetime(df['timestamp'], format=CANDLE_TIMESTAMP_FORMAT)
+        except (ValueError, TypeError):
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        df['ticker'] = symbol
         
-        # Apply standard data normalization
-        df = self.normalize_data(df)
+        # Each chunk arrives newest-first; one stable sort orders the whole range
+        if not df['timestamp'].is_monotonic_increasing:
+            df = df.sort_values('timestamp', kind='stable', ignore_index=True)
         
         return df
     
+    def _candles_to_table(self, candles: list, symbol: str) -> "pa.Table":
+        """
+        Build the standard OHLCV table column by column from raw V3 candle rows.
+        
+        Same columns and types as _candles_to_frame (timestamps in exchange
+        time), without creating a Python object per value for pandas.
+        """
+        columns = list(zip(*candles))
+        timestamps = pc.strptime(pa.array(columns[0], pa.string()), format=CANDLE_TIMESTAMP_FORMAT, unit='ns')
+        table = pa.table({
+            'timestamp': timestamps.cast(pa.timestamp('ns', tz=CANDLE_TIMEZONE)),
+            'open': pa.array(columns[1], pa.float64()),
+            'high': pa.array(columns[2], pa.float64()),
+            'low': pa.array(columns[3], pa.float64()),
+            'close': pa.array(columns[4], pa.float64()),
+            'volume': pa.array(columns[5], pa.int64()),
+            'ticker': pa.array([symbol] * len(candles), pa.string())
+        })
+        
+        # Each chunk arrives newest-first; one stable sort orders the whole range
+        return table.sort_by('timestamp')
+    
     def _get_optimal_chunk_size(self, unit: str, interval: str) -> int:
         """
         Determine optimal chunk size based on timeframe and empirical API limits.
@@ -312,7 +392,7 @@ class UpstoxDataProvider(DataProvider):
             max_retries: Maximum retry attempts
             
         Returns:
-            List of candle data or empty list on failure
+            List of [timestamp, open, high, low, close, volume] rows, or empty list on failure
         """
         url = f"{historical_base}/{instrument_id}/{unit}/{interval}/{end_str}/{start_str}"
         
@@ -327,19 +407,8 @@ class UpstoxDataProvider(DataProvider):
                         candles = data.get('data', {}).get('candles', [])
                         
                         if candles:
-                            # Convert to our format
-                            chunk_data = []
-                            for candle in candles:
-                                chunk_data.append({
-                                    'timestamp': candle[0],
-                                    'open': candle[1],
-                                    'high': candle[2],
-                                    'low': candle[3],
-                                    'close': candle[4],
-                                    'volume': candle[5],
-                                    'ticker': symbol
-                                })
-                            return chunk_data
+                            # Keep raw rows; the frame is typed once in _candles_to_frame
+                            return [candle[:6] for candle in candles]
                         else:
                             # No data for this date range (e.g., weekend/holiday)
                             return []
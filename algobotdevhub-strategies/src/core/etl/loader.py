@@ -6,6 +6,12 @@ import glob
 from typing import Optional
 from pathlib import Path
 
+# Readers for the file formats data pulls write, in order of preference
+DATA_FILE_READERS = {
+    '.parquet': pd.read_parquet,
+    '.csv': pd.read_csv,
+}
+
 def load_base_data(pull_date: str, ticker: str) -> Optional[pd.DataFrame]:
     """
     Load base data for a given ticker and date from available timeframes.
@@ -19,29 +25,33 @@ def load_base_data(pull_date: str, ticker: str) -> Optional[pd.DataFrame]:
     """
     # Try multiple timeframes in order of preference
     timeframes_to_try = ["1m", "day", "5m", "15m", "1h"]
-    csv_files = []
+    data_files = []
     
     for tf in timeframes_to_try:
         if tf in BACKTESTER_CONFIG['TIMEFRAME_FOLDERS']:
-            base_file_pattern = os.path.join(
-                BACKTESTER_CONFIG['DATA_POOL_DIR'],
-                pull_date,
-                BACKTESTER_CONFIG['TIMEFRAME_FOLDERS'][tf],
-                f"{ticker}_*.csv"
-            )
-            csv_files = glob.glob(base_file_pattern)
-            if csv_files:
-                logging.info(f"Found {len(csv_files)} CSV files for {ticker} in {tf} timeframe")
+            # Parquet (the pullers' default) wins over CSV copies of the same data
+            for suffix in DATA_FILE_READERS:
+                base_file_pattern = os.path.join(
+                    BACKTESTER_CONFIG['DATA_POOL_DIR'],
+                    pull_date,
+                    BACKTESTER_CONFIG['TIMEFRAME_FOLDERS'][tf],
+                    f"{ticker}_*{suffix}"
+                )
+                data_files = glob.glob(base_file_pattern)
+                if data_files:
+                    break
+            if data_files:
+                logging.info(f"Found {len(data_files)} data files for {ticker} in {tf} timeframe")
                 break
 
-    if not csv_files:
-        logging.warning(f"No CSV files found for ticker '{ticker}' on date range '{pull_date}' in any supported timeframe.")
+    if not data_files:
+        logging.warning(f"No data files found for ticker '{ticker}' on date range '{pull_date}' in any supported timeframe.")
         return None
 
     data_frames = []
-    for file in csv_files:
+    for file in data_files:
         try:
-            df = pd.read_csv(file)
+            df = DATA_FILE_READERS[Path(file).suffix](file)
             # Identify and rename the timestamp column
             timestamp_cols = ['timestamp', 'datetime', 'time']
             found = False
@@ -0,0 +1,47 @@
+"""
+Token-bucket rate limiting for data provider API calls.
+
+One limiter is shared by every worker pulling from the same API, so the
+sustained request rate holds regardless of concurrency.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter driven by the monotonic clock.
+    
+    Each acquisition reserves the next free slot; callers only wait when the
+    bucket is empty, so time already spent on network/parsing counts towards
+    the pacing instead of being added on top of it. Usable from blocking code
+    via wait() and from coroutines via acquire().
+    """
+    
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self.interval = time_period / max_rate
+        self.burst_window = time_period - self.interval  # Allow up to max_rate back-to-back
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        """Claim the next slot and return how long the caller must wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now - self.burst_window, self._next_allowed)
+            self._next_allowed = slot + self.interval
+            return slot - now
+    
+    def wait(self):
+        """Block until a request may be issued"""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire(self):
+        """Suspend the calling coroutine until a request may be issued"""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
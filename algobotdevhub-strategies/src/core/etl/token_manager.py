@@ -345,8 +345,7 @@ class ProviderTokenManager:
         latest_file = max(token_files, key=lambda f: f.stat().st_mtime)
         
         try:
-            with open(latest_file, 'r') as f:
-                token_data = json.load(f)
+            token_data = json.loads(latest_file.read_bytes())
             
             return {
                 'provider': provider,
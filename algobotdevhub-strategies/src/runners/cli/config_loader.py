@@ -40,16 +40,16 @@ def load_config_from_args(args) -> BacktestConfig:
     elif args.template:
         # Load from template
         if args.template == 'conservative':
-            config = get_conservative_config()
+            config = get_conservative_config().clone()
         elif args.template == 'aggressive':
-            config = get_aggressive_config()
+            config = get_aggressive_config().clone()
         elif args.template == 'options':
-            config = get_options_config()
+            config = get_options_config().clone()
         else:
             raise ValueError(f"Unknown template: {args.template}")
     else:
         # Use default conservative configuration
-        config = get_conservative_config()
+        config = get_conservative_config().clone()
     
     # Override configuration with CLI arguments
     if args.dates:
@@ -8,7 +8,6 @@ This module extracts all CLI-related functionality from the monolithic unified_r
 
 import argparse
 import json
-import yaml
 from datetime import datetime
 from pathlib import Path
 from typing import List
@@ -188,24 +187,22 @@ def load_config_from_args(args) -> BacktestConfig:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
-        
-        config = BacktestConfig.from_dict(config_data)
+        # Parsed with libyaml when available and cached per file version
+        config = BacktestConfig.from_yaml(str(config_path))
     elif args.template:        # Load from template
         if args.template == 'conservative':
-            config = get_conservative_config()
+            config = get_conservative_config().clone()
         elif args.template == 'aggressive':
-            config = get_aggressive_config()
+            config = get_aggressive_config().clone()
         elif args.template == 'options':
-            config = get_options_config()
+            config = get_options_config().clone()
         elif args.template == 'minimal':
-            config = get_minimal_config()
+            config = get_minimal_config().clone()
         else:
             raise ValueError(f"Unknown template: {args.template}")
     else:
         # Use default conservative configuration
-        config = get_conservative_config()
+        config = get_conservative_config().clone()
       # Override configuration with CLI arguments
     if args.dates:
         normalized_dates = parse_dates(args.dates)
@@ -76,6 +76,9 @@ class UnifiedBacktesterRunner:
         self.config = config
         self.start_time = datetime.now()
         
+        # Create the configured data/output/log/cache directories once per run
+        self.config.setup_paths()
+        
         # Initialize CLI handler and setup logging
         self.cli_handler = CLIHandler()
         self.logger = configure_logging()
@@ -294,8 +297,7 @@ class UnifiedBacktesterRunner:
             return results
             
         except Exception as e:
-            self.logger.error(f"Unified backtester execution failed: {e}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.error(f"Unified backtester execution failed: {e}", exc_info=True)
             return {
                 'status': 'error',
                 'error': str(e),
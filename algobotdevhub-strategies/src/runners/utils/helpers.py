@@ -43,8 +43,9 @@ def load_json_file(file_path: Union[str, Path]) -> Dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         json.JSONDecodeError: If JSON is invalid
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    # One read of the whole file, then a single parse of the bytes
+    with open(file_path, 'rb') as f:
+        return json.loads(f.read())
 
 
 def save_json_file(data: Dict[str, Any], file_path: Union[str, Path], pretty: bool = True) -> None:
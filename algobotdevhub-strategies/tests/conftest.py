@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Scripts at the project root import `config` and `src` relative to it
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
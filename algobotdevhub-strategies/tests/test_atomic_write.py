@@ -0,0 +1,18 @@
+"""config.config.atomic_write_bytes under concurrent writers."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+config = pytest.importorskip("config.config")
+
+
+def test_concurrent_writers_never_share_a_temp_file(tmp_path):
+    target = tmp_path / "settings.json"
+    payloads = [config.json_dumps({'writer': i, 'pad': 'x' * 50_000}) for i in range(16)]
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda data: config.atomic_write_bytes(target, data, fsync=False), payloads))
+    
+    assert target.read_bytes() in payloads
+    assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
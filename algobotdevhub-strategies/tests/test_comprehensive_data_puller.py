@@ -0,0 +1,81 @@
+"""Frame transport, dtype narrowing and async pipeline of comprehensive_data_puller."""
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+cdp = pytest.importorskip("comprehensive_data_puller")
+
+
+def make_frame():
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-01', periods=3, freq='D'),
+        'open': [1.0, 2.0, 3.0],
+        'close': [1.5, 2.5, 3.5],
+        'volume': [10, 20, 30],
+        'ticker': ['TCS', 'TCS', 'TCS'],
+    })
+
+
+def test_frame_with_string_column_round_trips_from_worker_process():
+    df = make_frame()
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        payload = executor.submit(cdp._send_frame, df).result()
+    
+    result = cdp._receive_frame(payload)
+    
+    pd.testing.assert_frame_equal(result, df, check_dtype=False)
+    assert list(result['ticker']) == ['TCS', 'TCS', 'TCS']
+    if cdp.SHARED_MEMORY_TRANSPORT:
+        # The segment is unlinked once the frame has been read
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=payload[0])
+
+
+@pytest.mark.skipif(not cdp.SHARED_MEMORY_TRANSPORT, reason="shared memory transport unavailable")
+def test_unreceived_segment_is_unlinked_by_name():
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        name, _ = executor.submit(cdp._send_frame, make_frame()).result()
+    
+    # The worker has exited without reclaiming the segment
+    shared_memory.SharedMemory(name=name).close()
+    
+    cdp._unlink_segment(name)
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=name)
+    # Already freed segments are ignored
+    cdp._unlink_segment(name)
+
+
+def test_narrow_dtypes_keeps_rows_with_missing_volume():
+    df = make_frame().astype({'volume': 'float64'})
+    df.loc[1, 'volume'] = float('nan')
+    
+    result = cdp.narrow_dtypes(df)
+    
+    assert str(result['volume'].dtype) == 'Int64'
+    assert result['volume'].isna().tolist() == [False, True, False]
+    assert result['open'].dtype == 'float32'
+    assert cdp.narrow_dtypes(make_frame())['volume'].dtype == 'int32'
+
+
+def test_fetch_task_exceptions_are_counted_as_failures(tmp_path):
+    puller = cdp.ComprehensiveDataPuller(str(tmp_path))
+    
+    async def fetch_ticker_data_async(ticker, executor):
+        if ticker == 'BAD':
+            raise RuntimeError("boom")
+        return None, "No data"
+    
+    puller.fetch_ticker_data_async = fetch_ticker_data_async
+    progress = {}
+    
+    asyncio.run(puller._collect_async(['BAD', 'GOOD'], progress))
+    
+    assert progress['BAD']['status'] == 'failed'
+    assert 'boom' in progress['BAD']['error']
+    assert puller.failed_downloads == 2
@@ -0,0 +1,28 @@
+"""Flat path lookups of config.strategy_config.BacktestConfig."""
+
+import json
+
+import pytest
+
+strategy_config = pytest.importorskip("config.strategy_config")
+
+
+def test_editing_a_returned_section_does_not_go_stale():
+    config = strategy_config.BacktestConfig()
+    params = config.get_strategy_config('mse')['parameters']
+    
+    params['macd_fast'] = 5  # A copy: the stored configuration is unchanged
+    assert config.get('strategies.parameters.mse.macd_fast') == 12
+    
+    config.set('strategies.parameters.mse', params)
+    params['macd_fast'] = 7  # Later edits to the caller's dict do not leak in
+    
+    assert config.get('strategies.parameters.mse.macd_fast') == 5
+    assert config.get('strategies.parameters.mse')['macd_fast'] == 5
+
+
+def test_strategy_config_is_plain_json_serializable_dicts():
+    config = strategy_config.BacktestConfig()
+    
+    assert isinstance(config.get('risk'), dict)
+    assert json.loads(json.dumps(config.get_strategy_config('mse')))['parameters']['macd_fast'] == 12
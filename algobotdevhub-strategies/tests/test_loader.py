@@ -0,0 +1,48 @@
+"""load_base_data reads what the data pullers write."""
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+loader = pytest.importorskip("src.core.etl.loader")
+
+PULL_DATE = '2024-01-01_to_2024-01-31'
+
+
+def make_frame():
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2024-01-02 09:15', periods=3, freq='min', tz='Asia/Kolkata'),
+        'open': [1.0, 2.0, 3.0],
+        'high': [1.5, 2.5, 3.5],
+        'low': [0.5, 1.5, 2.5],
+        'close': [1.2, 2.2, 3.2],
+        'volume': [10, 20, 30],
+    })
+
+
+@pytest.fixture
+def minute_dir(tmp_path, monkeypatch):
+    monkeypatch.setitem(loader.BACKTESTER_CONFIG, 'DATA_POOL_DIR', str(tmp_path))
+    folder = tmp_path / PULL_DATE / loader.BACKTESTER_CONFIG['TIMEFRAME_FOLDERS']['1m']
+    folder.mkdir(parents=True)
+    return folder
+
+
+def test_parquet_output_round_trips(minute_dir):
+    df = make_frame()
+    df.to_parquet(minute_dir / f"TCS_1m_{PULL_DATE}.parquet", index=False)
+    
+    loaded = loader.load_base_data(PULL_DATE, 'TCS')
+    
+    assert loaded is not None
+    assert list(loaded['close']) == list(df['close'])
+    assert loaded['timestamp'].is_monotonic_increasing
+
+
+def test_csv_output_still_loads(minute_dir):
+    make_frame().to_csv(minute_dir / f"TCS_1m_{PULL_DATE}.csv", index=False)
+    
+    loaded = loader.load_base_data(PULL_DATE, 'TCS')
+    
+    assert loaded is not None
+    assert len(loaded) == 3
@@ -0,0 +1,34 @@
+"""Queue-backed logging set up by config.config."""
+
+import logging
+
+import pytest
+
+config = pytest.importorskip("config.config")
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+        
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+def test_listeners_are_registered_and_flushed_on_stop():
+    logger = logging.getLogger("tests.queue_listener")
+    logger.propagate = False
+    handler = ListHandler()
+    config._attach_queue_listener(logger, handler)
+    try:
+        assert "tests.queue_listener" in config._log_listeners
+        assert not hasattr(logger, "_ql")
+        
+        logger.warning("hello %s", "world")
+        config.stop_log_listeners()
+        
+        assert handler.messages == ["hello world"]
+        assert "tests.queue_listener" not in config._log_listeners
+    finally:
+        logger.handlers.clear()
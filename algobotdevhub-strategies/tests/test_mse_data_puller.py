@@ -0,0 +1,125 @@
+"""Incremental resume, output writers and run summary of mse_data_puller."""
+
+import json
+from datetime import timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+mse = pytest.importorskip("mse_data_puller")
+
+IST = timezone(timedelta(hours=5, minutes=30))
+
+
+class DailyCandleProvider:
+    """Returns one 09:15 candle per calendar day and records each requested range."""
+    
+    def __init__(self):
+        self.calls = []
+        
+    def fetch_historical_data(self, symbol, start_date, end_date, timeframe):
+        self.calls.append((start_date, end_date))
+        days = pd.date_range(start_date.date(), end_date.date(), freq='D')
+        return pd.DataFrame({
+            'timestamp': (days + pd.Timedelta(hours=9, minutes=15)).tz_localize(IST),
+            'open': 1.0, 'high': 2.0, 'low': 0.5, 'close': 1.5, 'volume': 100,
+            'ticker': symbol,
+        })
+
+
+def pull(puller, fetcher, start, end):
+    puller.date_range = {'start': start, 'end': end}
+    chunks = puller.create_date_chunks(start, end)
+    assert puller.pull_ticker_data('TCS', chunks, fetcher)
+    return puller._output_file('TCS')
+
+
+def test_later_end_date_fetches_only_the_missing_tail(tmp_path, monkeypatch):
+    monkeypatch.setitem(mse.BACKTESTER_CONFIG, 'DATA_POOL_DIR', str(tmp_path))
+    provider = DailyCandleProvider()
+    fetcher = SimpleNamespace(provider=provider)
+    puller = mse.MSEDataPuller(max_workers=1, requests_per_second=1000, output_format="parquet")
+    
+    first_file = pull(puller, fetcher, '2024-01-01', '2024-01-31')
+    provider.calls.clear()
+    second_file = pull(puller, fetcher, '2024-01-01', '2024-02-29')
+    
+    # Only chunks from the last stored day onwards were requested again
+    assert provider.calls
+    assert min(start for start, _ in provider.calls).date() == pd.Timestamp('2024-01-31').date()
+    
+    # The earlier file was folded into the new one rather than left alongside it
+    assert not first_file.exists()
+    df = pd.read_parquet(second_file)
+    assert len(df) == 31 + 29
+    assert df['timestamp'].is_monotonic_increasing
+    assert not df['timestamp'].duplicated().any()
+
+
+def test_dataset_writer_discards_fragments_unless_committed(tmp_path):
+    df = DailyCandleProvider().fetch_historical_data('TCS', pd.Timestamp('2024-01-30'), pd.Timestamp('2024-02-02'), '1m')
+    
+    aborted = mse.PartitionedDatasetWriter(tmp_path, 'TCS', '1m')
+    aborted.write(df)
+    aborted.close(commit=False)
+    assert list(tmp_path.rglob('*.parquet')) == []
+    
+    committed = mse.PartitionedDatasetWriter(tmp_path, 'TCS', '1m')
+    committed.write(df)
+    committed.close(commit=True)
+    months = sorted(p.parent.name for p in tmp_path.rglob('*.parquet'))
+    assert months == ['month=1', 'month=2']
+    assert not any(p.name.startswith('.staging') for p in tmp_path.iterdir())
+
+
+
+def test_parquet_output_keeps_rows_with_missing_volume(tmp_path):
+    df = DailyCandleProvider().fetch_historical_data('TCS', pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-03'), '1m')
+    df['volume'] = df['volume'].astype('float64')
+    df.loc[0, 'volume'] = float('nan')
+    
+    writer = mse.PartitionedDatasetWriter(tmp_path, 'TCS', '1m')
+    writer.write(df)
+    writer.close(commit=True)
+    
+    result = pd.read_parquet(next(tmp_path.rglob('*.parquet')))
+    assert len(result) == len(df)
+    assert result['volume'].isna().sum() == 1
+
+def test_dataset_resume_appends_only_new_candles(tmp_path, monkeypatch):
+    monkeypatch.setitem(mse.BACKTESTER_CONFIG, 'DATA_POOL_DIR', str(tmp_path))
+    provider = DailyCandleProvider()
+    fetcher = SimpleNamespace(provider=provider)
+    puller = mse.MSEDataPuller(max_workers=1, requests_per_second=1000, output_format="dataset")
+    
+    pull(puller, fetcher, '2024-01-01', '2024-01-31')
+    pull(puller, fetcher, '2024-01-01', '2024-02-29')
+    
+    df = pd.read_parquet(tmp_path / "mse_dataset")
+    assert len(df) == 31 + 29
+    assert not df['timestamp'].duplicated().any()
+
+
+@pytest.mark.parametrize("parse, value", [
+    (mse.positive_int, "0"), (mse.positive_int, "-2"),
+    (mse.positive_float, "0"), (mse.positive_float, "-0.5"), (mse.positive_float, "nan"),
+])
+def test_cli_rejects_non_positive_workers_and_rates(parse, value):
+    with pytest.raises(mse.argparse.ArgumentTypeError):
+        parse(value)
+
+
+def test_full_pull_writes_a_json_summary(tmp_path, monkeypatch):
+    monkeypatch.setitem(mse.BACKTESTER_CONFIG, 'DATA_POOL_DIR', str(tmp_path))
+    puller = mse.MSEDataPuller(max_workers=1, requests_per_second=1000, output_format="parquet")
+    puller.fetcher = SimpleNamespace(provider=DailyCandleProvider())
+    puller.date_range = {'start': '2024-01-01', 'end': '2024-01-05'}
+    
+    summary = puller.run_full_data_pull({'TCS'})
+    
+    summary_file, = tmp_path.glob('mse_data_pull_summary_*.json')
+    assert json.loads(summary_file.read_bytes()) == summary
+    assert summary['successful_tickers'] == 1
+    assert not list(tmp_path.glob('.*.tmp'))
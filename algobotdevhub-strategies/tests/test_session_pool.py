@@ -0,0 +1,30 @@
+"""Pooled HTTP sessions in config.config."""
+
+import gc
+
+import pytest
+
+config = pytest.importorskip("config.config")
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    config.close_sessions()
+    yield
+    config.close_sessions()
+
+
+def test_token_refresh_keeps_the_old_session_open_while_held():
+    old = config.create_session("token-a")
+    closed = []
+    old.get_adapter("https://").close = lambda: closed.append(True)
+    
+    new = config.create_session("token-b")
+    
+    assert new is not old
+    assert config.create_session("token-b") is new
+    assert closed == []  # Still usable by whoever holds it
+    
+    del old
+    gc.collect()
+    assert closed == [True]
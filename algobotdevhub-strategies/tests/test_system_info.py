@@ -0,0 +1,39 @@
+"""Deferred host details in config.config."""
+
+import json
+import pickle
+
+import pytest
+
+config = pytest.importorskip("config.config")
+
+
+def test_system_info_is_a_json_serializable_dict():
+    info = config.SystemInfo()
+    
+    assert isinstance(info, dict)
+    assert set(json.loads(json.dumps(info))) == {
+        "hostname", "platform", "python_version", "cpu_count", "system_id", "environment"
+    }
+    assert info.platform == info["platform"]
+    assert type(pickle.loads(pickle.dumps(info))) is dict
+
+
+def test_deferred_probe_runs_only_when_read(monkeypatch):
+    calls = []
+    monkeypatch.setattr(config.platform, "platform", lambda: calls.append(1) or "test-os")
+    info = config.SystemInfo()
+    
+    assert "platform" in info and len(info) == 6
+    assert calls == []
+    assert info["platform"] == "test-os"
+    assert dict(info)["platform"] == "test-os"
+    assert calls == [1]
+
+
+def test_system_id_is_indexable_from_common_config():
+    system_id = config.COMMON_CONFIG['SYSTEM_ID']
+    
+    assert len(system_id) == 8
+    assert 'SYSTEM_ID' in config.COMMON_CONFIG
+    assert config.get_config_value('SYSTEM_ID') == system_id == config.SYSTEM_ID
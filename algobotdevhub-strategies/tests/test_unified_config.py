@@ -0,0 +1,26 @@
+"""Dataclass round trips of config.unified_config.BacktestConfig."""
+
+import pytest
+
+unified_config = pytest.importorskip("config.unified_config")
+
+
+def test_config_survives_a_dict_round_trip():
+    config = unified_config.BacktestConfig()
+    
+    restored = unified_config.BacktestConfig.from_dict(config.to_dict())
+    
+    assert restored == config
+    assert restored.data.required_columns == ("timestamp", "open", "high", "low", "close", "volume")
+
+
+def test_section_field_names_are_class_variables():
+    names = {f.name for f in unified_config.fields(unified_config.RiskConfig)}
+    
+    assert "_FIELDS" not in names
+    assert unified_config.RiskConfig._FIELDS == frozenset(names)
+
+
+def test_calculation_standard_lookup_is_case_insensitive():
+    assert unified_config.get_calculation_standard("rsi") == unified_config.get_calculation_standard("RSI")
+    assert not hasattr(unified_config.get_calculation_standard, "cache_info")
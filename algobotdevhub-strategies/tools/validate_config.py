@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Static validation for the unified backtest configuration.
+
+Runs the range checks from BacktestConfig.validate() against the dataclass
+defaults and every predefined template, so bad defaults are caught at commit
+time instead of on each BacktestConfig() construction. Wired into
+.pre-commit-config.yaml for changes to config/unified_config.py.
+"""
+
+import sys
+from dataclasses import fields, is_dataclass, MISSING
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import unified_config
+from config.unified_config import BacktestConfig
+
+
+def check_defaults(cls: type, prefix: str = "") -> List[str]:
+    """Every field must have a default so BacktestConfig() can be built bare."""
+    errors = []
+    for f in fields(cls):
+        path = f"{prefix}{f.name}"
+        if f.default is MISSING and f.default_factory is MISSING:
+            errors.append(f"{path} has no default")
+        elif f.default_factory is not MISSING and is_dataclass(f.default_factory):
+            errors.extend(check_defaults(f.default_factory, f"{path}."))
+    return errors
+
+
+def check_templates() -> List[str]:
+    """Default and template configs must satisfy the runtime invariants."""
+    errors = []
+    builders = {
+        "default": BacktestConfig,
+        "minimal": unified_config.get_minimal_config,
+        "conservative": unified_config.get_conservative_config,
+        "aggressive": unified_config.get_aggressive_config,
+        "options": unified_config.get_options_config,
+    }
+    for name, build in builders.items():
+        try:
+            build().validate()
+        except (TypeError, ValueError) as e:
+            errors.append(f"{name}: {e}")
+    return errors
+
+
+def main() -> int:
+    errors = check_defaults(BacktestConfig) + check_templates()
+    for error in errors:
+        print(f"❌ {error}")
+    if not errors:
+        print("✅ Unified configuration defaults and templates are valid")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())